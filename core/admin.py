@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
 
 
@@ -18,6 +19,14 @@ class PessoaAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+    
+    def get_queryset(self, request):
+        """Anota a contagem de pets para evitar um COUNT por linha"""
+        return super().get_queryset(request).annotate(pet_count=Count('pets'))
+    
+    @admin.display(description='Total pets', ordering='pet_count')
+    def total_pets(self, obj):
+        return obj.pet_count
 
 
 @admin.register(Pet)
@@ -47,10 +56,13 @@ class PetAdmin(admin.ModelAdmin):
 
 @admin.register(Vaccine)
 class VaccineAdmin(admin.ModelAdmin):
-    list_display = ['name', 'manufacturer', 'species_target', 'duration_months', 'is_mandatory', 'created_at']
+    list_display = [
+        'name', 'manufacturer', 'species_target', 'duration_months',
+        'is_mandatory', 'total_administrations', 'created_at'
+    ]
     search_fields = ['name', 'manufacturer']
     list_filter = ['is_mandatory', 'species_target', 'created_at']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['total_administrations', 'created_at', 'updated_at']
     
     fieldsets = (
         ('Vaccine Information', {
@@ -59,6 +71,9 @@ class VaccineAdmin(admin.ModelAdmin):
         ('Scheduling', {
             'fields': ('duration_months', 'is_mandatory')
         }),
+        ('Statistics', {
+            'fields': ('total_administrations',)
+        }),
         ('Metadata', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -97,12 +112,20 @@ class VaccinationRecordAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Calcula o status das doses no banco em vez de por linha"""
+        return super().get_queryset(request).select_related(
+            'pet', 'pet__pessoa', 'vaccine'
+        ).with_due_status()
+    
+    @admin.display(boolean=True, description='Due Soon', ordering='is_due')
     def is_due(self, obj):
         return obj.is_due
-    is_due.boolean = True
-    is_due.short_description = 'Due Soon'
     
+    @admin.display(boolean=True, description='Overdue', ordering='is_overdue')
     def is_overdue(self, obj):
         return obj.is_overdue
-    is_overdue.boolean = True
-    is_overdue.short_description = 'Overdue'
\ No newline at end of file
+    
+    @admin.display(description='Days Until Due', ordering='days_until_due')
+    def days_until_due(self, obj):
+        return obj.days_until_due
\ No newline at end of file
@@ -0,0 +1,158 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from core.revocation import token_revocations
+
+
+DEFAULT_TOKEN_AUTH_CACHE = {
+    # Número máximo de tokens no cache local de cada processo
+    'MAX_SIZE': 1024,
+    # Segundos até uma entrada expirar
+    'TTL': 60,
+    # Usar o cache do Django (CACHES['default']) no lugar do cache local
+    'SHARED': False,
+}
+
+
+def get_token_cache_settings():
+    return {**DEFAULT_TOKEN_AUTH_CACHE, **getattr(settings, 'TOKEN_AUTH_CACHE', {})}
+
+
+class LRUCache:
+    """
+    Cache LRU limitado, com expiração por TTL, seguro entre threads.
+    Guarda os valores serializados, para que cada requisição receba uma
+    cópia própria dos objetos.
+    """
+    
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value, ttl, max_size):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_token_cache = LRUCache()
+
+
+def _shared_key(key):
+    return f'token_auth:{key}'
+
+
+def get_cached_token(key):
+    options = get_token_cache_settings()
+    if options['SHARED']:
+        entry = cache.get(_shared_key(key))
+    else:
+        entry = local_token_cache.get(key)
+    if entry is None:
+        return None
+    
+    cached_at, value = entry
+    if token_revocations.revoked_since(key, cached_at):
+        return None
+    return value if options['SHARED'] else pickle.loads(value)
+
+
+def cache_token(token, cached_at):
+    """
+    Guarda o token no cache. `cached_at` é o instante anterior à leitura
+    do banco, para que uma revogação concorrente invalide a entrada.
+    """
+    options = get_token_cache_settings()
+    if options['SHARED']:
+        cache.set(_shared_key(token.key), (cached_at, token), options['TTL'])
+    else:
+        local_token_cache.set(
+            token.key, (cached_at, pickle.dumps(token)), options['TTL'], options['MAX_SIZE']
+        )
+
+
+def invalidate_tokens(keys):
+    """Remove tokens do cache e os revoga nos demais processos"""
+    keys = list(keys)
+    if not keys:
+        return
+    options = get_token_cache_settings()
+    token_revocations.revoke(keys, options['TTL'])
+    for key in keys:
+        local_token_cache.delete(key)
+        if options['SHARED']:
+            cache.delete(_shared_key(key))
+
+
+def invalidate_token(key):
+    """Remove um token do cache (logout, troca de senha, remoção do token)"""
+    invalidate_tokens([key])
+
+
+def invalidate_user_tokens(user_id):
+    """Remove do cache os tokens de um usuário (alterações no usuário ou na pessoa)"""
+    invalidate_tokens(Token.objects.filter(user_id=user_id).values_list('key', flat=True))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication com cache dos tokens válidos.
+    
+    O token é buscado junto com o usuário e a pessoa (select_related), e o
+    resultado fica em um LRU por processo com TTL (ou no cache do Django,
+    com TOKEN_AUTH_CACHE['SHARED']). Requisições seguintes com o mesmo
+    token não acessam o banco, e request.user.pessoa já vem carregado.
+    
+    logout e change_password invalidam a entrada imediatamente; alterações
+    no usuário, na pessoa ou no token são tratadas por core.signals. Cada
+    acerto no cache é conferido contra os marcadores de revogação
+    compartilhados (core.revocation), então a invalidação vale para
+    todos os processos do servidor, sem esperar o TTL.
+    """
+    
+    def authenticate_credentials(self, key):
+        token = get_cached_token(key)
+        if token is None:
+            cached_at = time.time()
+            try:
+                token = Token.objects.select_related('user', 'user__pessoa').get(key=key)
+            except Token.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            
+            if not token.user.is_active:
+                raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+            
+            cache_token(token, cached_at)
+        
+        return (token.user, token)
@@ -0,0 +1,203 @@
+import hashlib
+from datetime import datetime, time as dt_time
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from core.models import Vaccine
+from core.renderers import dumps
+
+
+# Tempo máximo de vida das respostas em cache. A versão do catálogo muda
+# a cada alteração de Vaccine e de total_administrations; o timeout limita
+# apenas a defasagem das aplicações recentes do detalhe quando um registro
+# é editado sem mudar de vacina.
+CATALOG_CACHE_TIMEOUT = 300
+
+CATALOG_VERSION_AGGREGATES = {
+    'last_modified': Max('updated_at'),
+    'count': Count('id'),
+    'administrations': Sum('total_administrations'),
+}
+
+
+def _catalog_version(row):
+    stamp = row['last_modified'].timestamp() if row['last_modified'] else 0
+    return f'{row["count"]}-{stamp}-{row["administrations"] or 0}'
+
+
+def get_catalog_version():
+    """
+    Versão do catálogo de vacinas, lida do banco em uma consulta agregada
+    (maior updated_at, número de vacinas e soma dos contadores), para que
+    todos os processos vejam a mesma versão logo após uma alteração.
+    """
+    return _catalog_version(Vaccine.objects.aggregate(**CATALOG_VERSION_AGGREGATES))
+
+
+async def aget_catalog_version():
+    """Versão assíncrona de get_catalog_version()"""
+    return _catalog_version(await Vaccine.objects.aaggregate(**CATALOG_VERSION_AGGREGATES))
+
+
+class CachedCatalogMixin:
+    """
+    Mixin para ViewSets de catálogo somente leitura para usuários comuns.
+    
+    As respostas de list e retrieve ficam em cache por versão do catálogo e
+    parâmetros da requisição, e levam um ETag calculado do conteúdo. A
+    versão é lida do banco em uma consulta agregada (get_catalog_version());
+    requisições com If-None-Match válido recebem 304 sem outras consultas
+    nem serialização. Não há Last-Modified: os contadores mudam sem alterar
+    o updated_at das vacinas. Autenticação, permissões e throttling continuam sendo aplicados
+    antes do cache, pelo fluxo normal do DRF.
+    
+    list é assíncrona (requer AsyncViewSetMixin): respostas em cache são
+    servidas sem ocupar uma thread; em caso de falha do cache, a listagem
+    do DRF (paginação síncrona) roda via sync_to_async.
+    """
+    
+    async def list(self, request, *args, **kwargs):
+        version = await aget_catalog_version()
+        key = self._catalog_cache_key(request, version)
+        entry = await cache.aget(key)
+        
+        if entry is None:
+            response = await sync_to_async(super().list)(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            entry = self._catalog_entry(response)
+            await cache.aset(key, entry, CATALOG_CACHE_TIMEOUT)
+        
+        return self._entry_response(request, entry)
+    
+    def retrieve(self, request, *args, **kwargs):
+        return self._catalog_response(request, super().retrieve, *args, **kwargs)
+    
+    def _catalog_response(self, request, handler, *args, **kwargs):
+        version = get_catalog_version()
+        key = self._catalog_cache_key(request, version)
+        entry = cache.get(key)
+        
+        if entry is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            entry = self._catalog_entry(response)
+            cache.set(key, entry, CATALOG_CACHE_TIMEOUT)
+        
+        return self._entry_response(request, entry)
+    
+    def _catalog_entry(self, response):
+        content = dumps(response.data)
+        return {
+            'data': response.data,
+            'etag': quote_etag(hashlib.md5(content).hexdigest()),
+        }
+    
+    def _entry_response(self, request, entry):
+        response = get_conditional_response(
+            request,
+            etag=entry['etag']
+        ) or Response(entry['data'])
+        
+        response['ETag'] = entry['etag']
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+    
+    def _catalog_cache_key(self, request, version):
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        url = f'{request.build_absolute_uri(request.path)}?{query}'
+        return f'vaccine_catalog:{version}:{hashlib.md5(url.encode()).hexdigest()}'
+
+
+def get_validators(queryset, timestamps, counts=()):
+    """
+    Calcula (ETag, Last-Modified) de um objeto a partir do maior updated_at
+    dele e dos filhos relevantes, em uma única consulta agregada.
+    
+    `queryset` deve selecionar uma única linha; `timestamps` são lookups de
+    datas (ex.: 'pets__updated_at') e `counts` relações contadas, para que
+    remoções de filhos também mudem o ETag. A data atual entra nos
+    validadores, pois idades e status de vencimento dependem dela.
+    Retorna None se o objeto não existir.
+    """
+    aggregates = {f'max_{i}': Max(lookup) for i, lookup in enumerate(timestamps)}
+    aggregates.update({
+        f'count_{i}': Count(lookup, distinct=True) for i, lookup in enumerate(counts)
+    })
+    row = queryset.order_by().values('pk').annotate(**aggregates).first()
+    if row is None:
+        return None
+    
+    today = timezone.localdate()
+    start_of_day = datetime.combine(today, dt_time.min)
+    if timezone.is_naive(start_of_day) and timezone.is_aware(timezone.now()):
+        start_of_day = timezone.make_aware(start_of_day)
+    
+    stamps = [value for key, value in row.items() if key.startswith('max_') and value]
+    last_modified = max(stamps + [start_of_day])
+    
+    source = '|'.join(str(value) for value in row.values()) + f'|{today.isoformat()}'
+    etag = quote_etag(hashlib.md5(source.encode()).hexdigest())
+    return etag, int(last_modified.timestamp())
+
+
+def conditional_response(request, validators, handler):
+    """
+    Responde 304 se as pré-condições da requisição baterem com os
+    validadores; caso contrário chama `handler()` para montar a resposta.
+    """
+    etag, last_modified = validators
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified
+    ) or handler()
+    
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class ConditionalRetrieveMixin:
+    """
+    Mixin que adiciona ETag / Last-Modified ao retrieve de ViewSets com
+    queryset restrito ao dono.
+    
+    Os validadores são calculados com get_validators() sobre o objeto do
+    queryset da view (já filtrado pelas permissões do usuário), antes de
+    qualquer serialização; se a requisição ainda for válida, responde 304
+    sem carregar o objeto. Objetos fora do escopo seguem o fluxo normal
+    (404).
+    """
+    validator_timestamps = ('updated_at',)
+    validator_counts = ()
+    
+    def retrieve(self, request, *args, **kwargs):
+        validators = self.get_validators()
+        handler = lambda: super(ConditionalRetrieveMixin, self).retrieve(request, *args, **kwargs)
+        if validators is None:
+            return handler()
+        return conditional_response(request, validators, handler)
+    
+    def get_validators(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            scoped = self.get_queryset().filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+            queryset = scoped.model.objects.filter(pk__in=scoped.values('pk'))
+            return get_validators(queryset, self.validator_timestamps, self.validator_counts)
+        except (TypeError, ValueError, ValidationError):
+            # Lookup inválido: o retrieve padrão responde 404
+            return None
@@ -0,0 +1,140 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection, connections
+from django.utils.decorators import classonlymethod
+
+
+def concurrent_queries_enabled():
+    """
+    Indica se run_queries() pode usar várias conexões ao mesmo tempo.
+
+    No SQLite o acesso é serializado de qualquer forma, e dentro de uma
+    transação (ex.: TestCase) as outras conexões não veem os dados ainda
+    não confirmados, então as consultas rodam em sequência.
+    """
+    return (
+        getattr(settings, 'ASYNC_CONCURRENT_QUERIES', True)
+        and connection.vendor != 'sqlite'
+        and not connection.in_atomic_block
+    )
+
+
+def is_asgi_request(request):
+    """
+    Indica se a requisição (HttpRequest ou Request do DRF) chegou pelo
+    handler ASGI, que a cria com o `scope` da conexão.
+    """
+    return getattr(request, 'scope', None) is not None
+
+
+def _in_worker(function):
+    """
+    Executa `function` em uma thread do pool. Cada thread tem a sua conexão,
+    fechada conforme CONN_MAX_AGE, como ao fim de uma requisição. O
+    contexto (ex.: o perfil do RequestProfilingMiddleware) é herdado via
+    sync_to_async.
+    """
+    def run():
+        close_old_connections()
+        try:
+            return function()
+        finally:
+            close_old_connections()
+    return run
+
+
+async def run_queries(*functions):
+    """
+    Executa funções síncronas de consulta independentes (sem argumentos) e
+    retorna os resultados na mesma ordem.
+
+    Quando concurrent_queries_enabled(), cada função roda em uma thread do
+    pool com a sua própria conexão e as consultas são feitas ao mesmo
+    tempo; senão, rodam em sequência na thread do ORM assíncrono.
+    """
+    if not concurrent_queries_enabled():
+        return [await sync_to_async(function)() for function in functions]
+    return await asyncio.gather(*(
+        sync_to_async(_in_worker(function), thread_sensitive=False)()
+        for function in functions
+    ))
+
+
+def map_in_threads(function, items, max_workers=4):
+    """
+    Versão síncrona de run_queries(): aplica `function` a cada item e
+    retorna os resultados na mesma ordem, em um pool de threads quando
+    concurrent_queries_enabled(). As conexões abertas pelas threads do
+    pool são fechadas ao fim de cada item, e cada item roda com uma cópia
+    do contexto de quem chamou, como em sync_to_async.
+    """
+    items = list(items)
+    if len(items) < 2 or not concurrent_queries_enabled():
+        return [function(item) for item in items]
+
+    def run(item):
+        try:
+            return function(item)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        # Um mesmo Context não pode estar ativo em duas threads ao mesmo tempo
+        contexts = [copy_context() for _ in items]
+        return list(executor.map(lambda context, item: context.run(run, item), contexts, items))
+
+
+class AsyncViewSetMixin:
+    """
+    Permite actions `async def` em ViewSets (o DRF só despacha de forma
+    síncrona).
+
+    Uma rota com alguma action assíncrona vira uma view assíncrona para o
+    Django: autenticação, permissões e throttling rodam pelo fluxo normal
+    do DRF via sync_to_async e a action é aguardada, sem ocupar uma thread
+    enquanto usa o ORM assíncrono. Actions síncronas da mesma rota (ex.:
+    create junto com list) rodam via sync_to_async. Rotas só com actions
+    síncronas não mudam.
+    """
+
+    @classonlymethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if any(iscoroutinefunction(getattr(cls, action, None)) for action in (actions or {}).values()):
+            markcoroutinefunction(view)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if not any(iscoroutinefunction(getattr(self, action)) for action in self.action_map.values()):
+            return super().dispatch(request, *args, **kwargs)
+        return self.adispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        """Versão assíncrona de APIView.dispatch()"""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,134 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import permissions
+
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def _param_set(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    return {field.strip() for field in value.split(',') if field.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    Mixin de serializer para fieldsets esparsos: ?fields=id,name retorna
+    apenas os campos listados e ?omit=notes remove campos da resposta.
+    
+    Só é aplicado ao serializer criado pela view (com a requisição no
+    contexto) e em métodos de leitura; nomes desconhecidos são ignorados.
+    Serializers aninhados não são afetados.
+    
+    Meta.sparse_sources declara as colunas usadas por campos que não
+    apontam diretamente para um campo do modelo (propriedades e
+    SerializerMethodField), para que SparseFieldsetViewMixin possa reduzir
+    a consulta. Campos sem fonte conhecida desativam essa redução.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return
+        
+        only = _param_set(request, FIELDS_PARAM)
+        omit = _param_set(request, OMIT_PARAM)
+        if only is None and omit is None:
+            return
+        
+        for name in list(self.fields):
+            if (only is not None and name not in only) or (omit and name in omit):
+                self.fields.pop(name)
+    
+    def get_sparse_lookups(self):
+        """
+        Lookups do modelo (ex.: 'pessoa__name') necessários para os campos
+        selecionados, ou None se algum campo não puder ser resolvido.
+        """
+        sources = getattr(self.Meta, 'sparse_sources', {})
+        model = self.Meta.model
+        lookups = set()
+        for name, field in self.fields.items():
+            if name in sources:
+                lookups.update(sources[name])
+                continue
+            if field.source == '*':
+                return None
+            resolved = resolve_source(model, field.source_attrs)
+            if resolved is None:
+                return None
+            lookups.add(resolved[0])
+        return lookups
+
+
+def resolve_source(model, attrs):
+    """
+    Converte a source de um campo (ex.: ['pessoa', 'name'] ou
+    ['get_species_display']) em (lookup, campo do modelo, display), ou None.
+    display indica que a source é o get_X_display() do campo.
+    """
+    path = []
+    field = None
+    display = False
+    for attr in attrs:
+        display = attr.startswith('get_') and attr.endswith('_display')
+        if display:
+            attr = attr[len('get_'):-len('_display')]
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if field.many_to_many or field.one_to_many:
+            return None
+        path.append(field.name)
+        if field.is_relation:
+            model = field.related_model
+    if field is None:
+        return None
+    return '__'.join(path), field, display
+
+
+class SparseFieldsetViewMixin:
+    """
+    Mixin de ViewSet que aplica ?fields= / ?omit= também ao banco: com os
+    campos selecionados pelo serializer (SparseFieldsetMixin), carrega só
+    as colunas necessárias com .only() e mantém apenas os select_related
+    usados por elas.
+    
+    `sparse_required_fields` lista colunas sempre carregadas (ex.: owner,
+    usado pelas permissões); os campos de `keyset_ordering` também são
+    incluídos, pois o cursor é montado a partir deles.
+    """
+    sparse_required_fields = ()
+    
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in permissions.SAFE_METHODS:
+            return queryset
+        if _param_set(self.request, FIELDS_PARAM) is None and _param_set(self.request, OMIT_PARAM) is None:
+            return queryset
+        
+        serializer = self.get_serializer()
+        get_lookups = getattr(serializer, 'get_sparse_lookups', None)
+        lookups = get_lookups() if get_lookups else None
+        if lookups is None:
+            return queryset
+        
+        lookups.update(self.sparse_required_fields)
+        lookups.update(field.lstrip('-') for field in getattr(self, 'keyset_ordering', ()))
+        
+        joins = set()
+        for lookup in lookups:
+            # Cada relação percorrida precisa da FK carregada e do join
+            parts = lookup.split('__')
+            for depth in range(1, len(parts)):
+                joins.add('__'.join(parts[:depth]))
+        columns = {queryset.model._meta.pk.name, *lookups, *joins}
+        
+        queryset = queryset.select_related(None)
+        if joins:
+            queryset = queryset.select_related(*joins)
+        return queryset.only(*columns)
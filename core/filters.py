@@ -0,0 +1,47 @@
+from rest_framework import filters
+from core.search import SEARCH_INDEXES
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Substituto do SearchFilter que consulta o índice FTS5 do modelo
+    (core.search) em vez de fazer ORs de icontains com joins.
+    
+    Cada termo de ?search= deve aparecer, como prefixo de palavra, em alguma
+    das colunas indexadas. Sem índice disponível (ex.: PostgreSQL), usa o
+    comportamento padrão do SearchFilter com os search_fields da view.
+    """
+    
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        index = SEARCH_INDEXES.get(queryset.model)
+        
+        if not terms or index is None or not index.available():
+            return super().filter_queryset(request, queryset, view)
+        
+        return queryset.filter(pk__in=index.match(terms))
+
+
+class AliasedOrderingFilter(filters.OrderingFilter):
+    """
+    OrderingFilter que aceita nomes alternativos de ordenação, declarados
+    na view em `ordering_aliases` (ex.: {'age': '-birth_date'}). O prefixo
+    "-" inverte o alias (?ordering=-age vira birth_date), e o campo de
+    destino deve estar em ordering_fields.
+    """
+    
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        aliases = getattr(view, 'ordering_aliases', {})
+        return super().remove_invalid_fields(
+            queryset, [self._resolve_alias(term, aliases) for term in fields], view, request
+        )
+    
+    @staticmethod
+    def _resolve_alias(term, aliases):
+        name = term.lstrip('-')
+        if name not in aliases:
+            return term
+        target = aliases[name]
+        if term.startswith('-'):
+            target = target[1:] if target.startswith('-') else f'-{target}'
+        return target
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from core.models import Pet, VaccinationStatus
+
+
+class Command(BaseCommand):
+    """
+    Recalcula a tabela VaccinationStatus (dose mais recente por pet e vacina)
+    a partir do histórico de registros, em lotes de pets.
+    
+    Os signals mantêm a tabela atualizada; este comando serve para a carga
+    inicial e para corrigir divergências após importações com SQL manual.
+    """
+    help = 'Recalcula o status atual de vacinação de todos os pets em lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Quantidade de pets processados por lote (padrão: 500)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        pet_ids = Pet.objects.order_by('pk').values_list('pk', flat=True)
+        
+        last_pk = 0
+        total_pets = 0
+        while True:
+            batch = list(pet_ids.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            VaccinationStatus.objects.refresh_pets(batch)
+            total_pets += len(batch)
+            last_pk = batch[-1]
+        
+        self.stdout.write(self.style.SUCCESS(
+            f'Status recalculado para {total_pets} pet(s): '
+            f'{VaccinationStatus.objects.count()} par(es) pet/vacina.'
+        ))
@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from core.management.commands.run_benchmark import percentile
+from core.models import VaccinationRecord
+from core.renderers import FastJSONRenderer
+from core.serializers import VaccinationRecordSerializer
+from core.values import serialize_list
+
+
+class Command(BaseCommand):
+    """
+    Micro-benchmark da codificação JSON: renderiza listas de registros de
+    vacinação (já serializadas, como nas respostas da API) com o
+    JSONRenderer do DRF e com o FastJSONRenderer, e reporta p50/p95 de
+    cada um por tamanho de lista. Também confere que as saídas são iguais.
+    """
+    help = 'Compara o tempo de renderização JSON do DRF e do FastJSONRenderer'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', default='20,1000,20000',
+            help='Tamanhos das listas, separados por vírgula (padrão: 20,1000,20000)'
+        )
+        parser.add_argument('--iterations', type=int, default=20, help='Renderizações medidas por tamanho (padrão: 20)')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',')]
+        except ValueError:
+            raise CommandError('--sizes deve ser uma lista de inteiros.')
+        if options['iterations'] < 1 or not sizes or min(sizes) < 1:
+            raise CommandError('--sizes e --iterations devem ser maiores que zero.')
+
+        queryset = VaccinationRecord.objects.with_due_status().order_by('-administered_date', '-id')
+        data = serialize_list(VaccinationRecordSerializer, queryset[:max(sizes)])
+        if not data:
+            raise CommandError('Nenhum registro de vacinação encontrado; rode seed_benchmark_data antes.')
+
+        renderers = [('drf', JSONRenderer()), ('fast', FastJSONRenderer())]
+        for size in sizes:
+            payload = data[:size]
+            outputs = {name: renderer.render(payload) for name, renderer in renderers}
+            if outputs['drf'] != outputs['fast']:
+                raise CommandError(f'Saídas diferentes para {len(payload)} registros.')
+
+            results = {
+                name: self.measure(renderer, payload, options['iterations'])
+                for name, renderer in renderers
+            }
+            speedup = results['drf'][0] / results['fast'][0] if results['fast'][0] else float('inf')
+            self.stdout.write(
+                f'{len(payload):>7} registros ({len(outputs["drf"]) / 1024:>8.1f} KiB)  '
+                f'drf p50 {results["drf"][0]:>8.2f} ms  p95 {results["drf"][1]:>8.2f} ms  '
+                f'fast p50 {results["fast"][0]:>8.2f} ms  p95 {results["fast"][1]:>8.2f} ms  '
+                f'{speedup:>5.1f}x'
+            )
+
+    def measure(self, renderer, payload, iterations):
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            renderer.render(payload)
+            timings.append((time.perf_counter() - started) * 1000)
+        return percentile(timings, 0.50), percentile(timings, 0.95)
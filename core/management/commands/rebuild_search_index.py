@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from core.search import SEARCH_INDEXES
+
+
+class Command(BaseCommand):
+    """
+    Recria os índices de busca de texto completo (FTS5) a partir das tabelas
+    do sistema. Útil após importações com SQL manual ou se o índice divergir.
+    """
+    help = 'Recria os índices de busca FTS5 de pets, vacinas e registros de vacinação'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Quantidade de linhas indexadas por lote (padrão: 5000)'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('Os índices FTS5 só estão disponíveis no SQLite.')
+        
+        for model, index in SEARCH_INDEXES.items():
+            with transaction.atomic():
+                index.rebuild(batch_size=options['batch_size'])
+            self.stdout.write(f'{index.table}: {model.objects.count()} linha(s) indexada(s)')
+        
+        self.stdout.write(self.style.SUCCESS('Índices de busca recriados.'))
@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from core.models import Vaccine, VaccinationRecord
+
+
+class Command(BaseCommand):
+    """
+    Corrige divergências em Vaccine.total_administrations.
+    
+    Os contadores são mantidos por core.signals, mas operações que não
+    disparam signals (bulk_create, update(), SQL manual) podem deixá-los
+    desatualizados. Cada lote é recalculado e corrigido em uma única
+    instrução UPDATE, sem carregar os registros de vacinação em memória.
+    """
+    help = 'Recalcula os contadores de aplicações das vacinas em lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Quantidade de vacinas processadas por lote (padrão: 500)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas relata as divergências, sem corrigi-las'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+        
+        actual_count = Coalesce(
+            Subquery(
+                VaccinationRecord.objects.filter(
+                    vaccine=OuterRef('pk')
+                ).order_by().values('vaccine').annotate(
+                    count=Count('id')
+                ).values('count'),
+                output_field=IntegerField()
+            ),
+            Value(0)
+        )
+        
+        vaccine_ids = list(Vaccine.objects.order_by('pk').values_list('pk', flat=True))
+        total_fixed = 0
+        
+        for start in range(0, len(vaccine_ids), batch_size):
+            batch = vaccine_ids[start:start + batch_size]
+            
+            with transaction.atomic():
+                drifted = Vaccine.objects.filter(pk__in=batch).annotate(
+                    actual_count=actual_count
+                ).exclude(total_administrations=F('actual_count'))
+                
+                drifted_ids = []
+                for vaccine in drifted.only('pk', 'name', 'total_administrations'):
+                    self.stdout.write(
+                        f'{vaccine.name}: {vaccine.total_administrations} -> {vaccine.actual_count}'
+                    )
+                    drifted_ids.append(vaccine.pk)
+                
+                if drifted_ids and not dry_run:
+                    Vaccine.objects.filter(pk__in=drifted_ids).update(
+                        total_administrations=actual_count
+                    )
+                total_fixed += len(drifted_ids)
+        
+        action = 'encontradas' if dry_run else 'corrigidas'
+        self.stdout.write(self.style.SUCCESS(
+            f'{total_fixed} divergência(s) {action} em {len(vaccine_ids)} vacina(s).'
+        ))
@@ -0,0 +1,165 @@
+import json
+import math
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from core.models import Pessoa, VaccinationRecord
+from core.throttling import throttle_store
+
+
+# (nome, URL); os campos entre chaves vêm dos dados do usuário medido
+ENDPOINTS = [
+    ('auth.profile', '/api/auth/profile/'),
+    ('pessoas.list', '/api/pessoas/'),
+    ('pessoas.retrieve', '/api/pessoas/{pessoa}/'),
+    ('pessoas.pets', '/api/pessoas/{pessoa}/pets/'),
+    ('pessoas.vaccination_summary', '/api/pessoas/{pessoa}/vaccination_summary/'),
+    ('pets.list', '/api/pets/'),
+    ('pets.list.search', '/api/pets/?search={pet_name}'),
+    ('pets.list.cursor', '/api/pets/?cursor='),
+    ('pets.retrieve', '/api/pets/{pet}/'),
+    ('pets.vaccinations', '/api/pets/{pet}/vaccinations/'),
+    ('pets.upcoming_vaccinations', '/api/pets/{pet}/upcoming_vaccinations/'),
+    ('vaccines.list', '/api/vaccines/'),
+    ('vaccines.retrieve', '/api/vaccines/{vaccine}/'),
+    ('vaccines.statistics', '/api/vaccines/{vaccine}/statistics/'),
+    ('vaccinations.list', '/api/vaccinations/'),
+    ('vaccinations.retrieve', '/api/vaccinations/{record}/'),
+    ('vaccinations.due_soon', '/api/vaccinations/due_soon/'),
+    ('vaccinations.overdue', '/api/vaccinations/overdue/'),
+    ('vaccinations.recent', '/api/vaccinations/recent/'),
+    ('vaccinations.export', '/api/vaccinations/export/?export_format=ndjson'),
+]
+
+
+def percentile(values, fraction):
+    """Percentil com interpolação linear entre as amostras ordenadas"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class Command(BaseCommand):
+    """
+    Mede a latência e o número de consultas de cada endpoint de leitura,
+    chamando a API pelo test client do Django contra o banco configurado
+    (normalmente populado com seed_benchmark_data).
+    
+    Reporta p50/p95/p99 por endpoint e, com --output, grava o resultado em
+    JSON para comparar execuções. O throttling usa um arquivo temporário
+    (THROTTLE_STORE_PATH), zerado antes de cada requisição fora do tempo
+    medido, sem alterar os contadores do servidor.
+    """
+    help = 'Mede p50/p95/p99 e consultas por endpoint da API'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Requisições medidas por endpoint (padrão: 50)')
+        parser.add_argument('--warmup', type=int, default=5, help='Requisições de aquecimento por endpoint (padrão: 5)')
+        parser.add_argument('--user', help='Usuário usado nas requisições (padrão: pessoa com mais pets)')
+        parser.add_argument('--endpoint', action='append', help='Mede apenas endpoints que contêm este texto (repetível)')
+        parser.add_argument('--output', help='Arquivo JSON de saída')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations deve ser maior que zero.')
+        
+        pessoa = self.get_pessoa(options['user'])
+        token, _ = Token.objects.get_or_create(user=pessoa.user)
+        client = Client(SERVER_NAME='localhost', HTTP_AUTHORIZATION=f'Token {token.key}')
+        context = self.get_context(pessoa)
+        
+        endpoints = [
+            (name, url.format(**context))
+            for name, url in ENDPOINTS
+            if not options['endpoint'] or any(text in name for text in options['endpoint'])
+        ]
+        if not endpoints:
+            raise CommandError('Nenhum endpoint corresponde ao filtro.')
+        
+        results = {}
+        with tempfile.TemporaryDirectory() as directory, \
+                override_settings(THROTTLE_STORE_PATH=Path(directory) / 'throttle.sqlite3'):
+            for name, url in endpoints:
+                results[name] = self.measure(client, url, options['warmup'], options['iterations'])
+                self.write_row(name, results[name])
+        
+        if options['output']:
+            report = {
+                'generated_at': datetime.now(timezone.utc).isoformat(),
+                'database': connection.vendor,
+                'user': pessoa.user.username,
+                'pets': context['pet_count'],
+                'iterations': options['iterations'],
+                'results': results,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Resultado gravado em {options["output"]}'))
+
+    def get_pessoa(self, username):
+        pessoas = Pessoa.objects.select_related('user')
+        if username:
+            pessoa = pessoas.filter(user__username=username).first()
+        else:
+            pessoa = pessoas.filter(pets__isnull=False).order_by('-pk').first()
+        if pessoa is None:
+            raise CommandError('Nenhuma pessoa com pets encontrada; rode seed_benchmark_data antes.')
+        return pessoa
+
+    def get_context(self, pessoa):
+        pets = pessoa.pets.order_by('pk')
+        pet = pets.first()
+        record = VaccinationRecord.objects.filter(pet__pessoa=pessoa).order_by('pk').first()
+        if pet is None or record is None:
+            raise CommandError(f'{pessoa.user.username} não tem pets com registros de vacinação.')
+        return {
+            'pessoa': pessoa.pk,
+            'pet': pet.pk,
+            'pet_name': pet.name,
+            'pet_count': pets.count(),
+            'vaccine': record.vaccine_id,
+            'record': record.pk,
+        }
+
+    def measure(self, client, url, warmup, iterations):
+        timings = []
+        queries = []
+        status_codes = set()
+        for iteration in range(warmup + iterations):
+            throttle_store.clear()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = client.get(url)
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                elapsed = time.perf_counter() - started
+            if iteration >= warmup:
+                timings.append(elapsed * 1000)
+                queries.append(len(captured.captured_queries))
+                status_codes.add(response.status_code)
+        
+        return {
+            'url': url,
+            'status': sorted(status_codes),
+            'p50_ms': round(percentile(timings, 0.50), 3),
+            'p95_ms': round(percentile(timings, 0.95), 3),
+            'p99_ms': round(percentile(timings, 0.99), 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'queries': max(queries),
+        }
+
+    def write_row(self, name, result):
+        status = ','.join(str(code) for code in result['status'])
+        self.stdout.write(
+            f'{name:<32} p50 {result["p50_ms"]:>8.2f} ms  p95 {result["p95_ms"]:>8.2f} ms  '
+            f'p99 {result["p99_ms"]:>8.2f} ms  {result["queries"]:>3} queries  [{status}]'
+        )
@@ -0,0 +1,229 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from dateutil.relativedelta import relativedelta
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from core.models import (
+    Pessoa, Pet, Vaccine, VaccinationRecord, VaccinationReminder, VaccinationStatus
+)
+from core.search import SEARCH_INDEXES
+
+
+# Prefixo dos usuários gerados, usado também por --clear
+USERNAME_PREFIX = 'bench_'
+
+DEFAULT_PASSWORD = 'benchmark-123'
+
+# (nome, fabricante, espécie, duração em meses, obrigatória)
+VACCINE_CATALOG = [
+    ('Antirrábica', 'Zoetis', 'dog,cat', 12, True),
+    ('V10 (Polivalente canina)', 'Zoetis', 'dog', 12, False),
+    ('V8 (Polivalente canina)', 'MSD', 'dog', 12, False),
+    ('Gripe canina (Bordetella)', 'Boehringer Ingelheim', 'dog', 12, False),
+    ('Giárdia', 'Zoetis', 'dog', 12, False),
+    ('Leishmaniose', 'Ceva', 'dog', 12, False),
+    ('V4 felina (FVRCP + Clamidiose)', 'Boehringer Ingelheim', 'cat', 12, False),
+    ('V5 felina (FeLV)', 'Zoetis', 'cat', 12, False),
+    ('Polyomavírus aviário', 'Biovet', 'bird', 12, False),
+    ('Mixomatose', 'Ceva', 'rabbit', 6, False),
+]
+
+SPECIES_WEIGHTS = [
+    ('dog', 55), ('cat', 35), ('bird', 4), ('rabbit', 3),
+    ('hamster', 1), ('reptile', 1), ('other', 1),
+]
+
+BREEDS = {
+    'dog': ['SRD', 'Labrador', 'Poodle', 'Shih Tzu', 'Golden Retriever', 'Bulldog Francês', 'Yorkshire'],
+    'cat': ['SRD', 'Siamês', 'Persa', 'Maine Coon', 'Angorá'],
+    'bird': ['Calopsita', 'Periquito', 'Papagaio'],
+    'rabbit': ['Mini Lop', 'Lionhead'],
+}
+
+PET_NAMES = [
+    'Thor', 'Luna', 'Mel', 'Bob', 'Nina', 'Fred', 'Amora', 'Pipoca', 'Max', 'Lola',
+    'Simba', 'Belinha', 'Toby', 'Frida', 'Zeca', 'Mia', 'Rex', 'Bidu', 'Chico', 'Jade',
+]
+
+FIRST_NAMES = ['Ana', 'Bruno', 'Carla', 'Diego', 'Elisa', 'Fábio', 'Gabriela', 'Hugo', 'Isabela', 'João']
+LAST_NAMES = ['Silva', 'Souza', 'Oliveira', 'Santos', 'Pereira', 'Lima', 'Costa', 'Almeida']
+
+VETERINARIANS = ['Dra. Marina Alves', 'Dr. Paulo Reis', 'Dra. Júlia Prado', 'Dr. Renato Dias']
+CLINICS = ['Clínica Vet Central', 'Hospital Veterinário Pet Care', 'Clínica Bichos & Cia', '']
+
+
+class Command(BaseCommand):
+    """
+    Gera dados sintéticos para benchmarks: catálogo de vacinas, pessoas,
+    pets e históricos de vacinação com datas realistas (doses a cada
+    duration_months desde o nascimento, com atrasos aleatórios).
+    
+    A geração é determinística a partir de --seed e usa bulk_create; ao
+    final, status atuais, contadores e índices de busca são recalculados
+    pelos comandos de manutenção.
+    """
+    help = 'Gera dados sintéticos (pessoas, pets e vacinações) para benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--owners', type=int, default=100, help='Número de pessoas (padrão: 100)')
+        parser.add_argument('--pets', type=int, default=5, help='Pets por pessoa (padrão: 5)')
+        parser.add_argument('--seed', type=int, default=42, help='Semente do gerador (padrão: 42)')
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help=f'Remove antes os usuários "{USERNAME_PREFIX}*" gerados anteriormente'
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        today = date.today()
+        
+        with transaction.atomic():
+            if options['clear']:
+                self.clear()
+            
+            vaccines = self.seed_vaccines()
+            pessoas = self.seed_pessoas(rng, options['owners'])
+            pets = self.seed_pets(rng, pessoas, options['pets'], today)
+            records = self.seed_records(rng, pets, vaccines, today)
+        
+        # bulk_create não dispara signals: recalcula os dados derivados
+        quiet = StringIO()
+        call_command('backfill_vaccination_status', stdout=quiet)
+        call_command('reconcile_vaccine_counters', stdout=quiet)
+        if connection.vendor == 'sqlite':
+            call_command('rebuild_search_index', stdout=quiet)
+        
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(pessoas)} pessoa(s), {len(pets)} pet(s) e {records} registro(s) de '
+            f'vacinação criados (senha dos usuários: {DEFAULT_PASSWORD}).'
+        ))
+
+    def clear(self):
+        """
+        Remove os dados gerados anteriormente. As tabelas são apagadas com
+        um DELETE por tabela, sem signals por linha (o delete() em cascata
+        levaria minutos), junto com os dados derivados: status atuais e
+        linhas dos índices de busca. Os contadores das vacinas são
+        recalculados ao final do comando (reconcile_vaccine_counters).
+        """
+        users = User.objects.filter(username__startswith=USERNAME_PREFIX)
+        for queryset in (
+            VaccinationReminder.objects.filter(record__owner__in=users),
+            VaccinationStatus.objects.filter(pet__owner__in=users),
+            VaccinationRecord.objects.filter(owner__in=users),
+            Pet.objects.filter(owner__in=users),
+            Pessoa.objects.filter(user__in=users),
+        ):
+            index = SEARCH_INDEXES.get(queryset.model)
+            if index is not None:
+                index.remove_queryset(queryset)
+            self.delete_rows(queryset)
+        users.delete()
+
+    @staticmethod
+    def delete_rows(queryset):
+        """DELETE das linhas do queryset em uma única instrução, sem signals"""
+        meta = queryset.model._meta
+        pk_sql, params = queryset.order_by().values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            # Tabela derivada: o MySQL não aceita a própria tabela no IN do DELETE
+            cursor.execute(
+                f'DELETE FROM {connection.ops.quote_name(meta.db_table)} '
+                f'WHERE {connection.ops.quote_name(meta.pk.column)} IN '
+                f'(SELECT * FROM ({pk_sql}) AS cleared)',
+                params
+            )
+
+    def seed_vaccines(self):
+        vaccines = []
+        for name, manufacturer, species, duration, mandatory in VACCINE_CATALOG:
+            vaccine, _ = Vaccine.objects.get_or_create(name=name, defaults={
+                'manufacturer': manufacturer,
+                'species_target': species,
+                'duration_months': duration,
+                'is_mandatory': mandatory,
+            })
+            vaccines.append(vaccine)
+        return vaccines
+
+    def seed_pessoas(self, rng, count):
+        start = User.objects.filter(username__startswith=USERNAME_PREFIX).count()
+        password = make_password(DEFAULT_PASSWORD)
+        
+        users = User.objects.bulk_create([
+            User(username=f'{USERNAME_PREFIX}{i}', email=f'{USERNAME_PREFIX}{i}@example.com', password=password)
+            for i in range(start, start + count)
+        ], batch_size=1000)
+        return Pessoa.objects.bulk_create([
+            Pessoa(
+                user=user,
+                name=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                email=user.email,
+                phone=f'+55119{rng.randrange(10_000_000, 99_999_999)}',
+            )
+            for user in users
+        ], batch_size=1000)
+
+    def seed_pets(self, rng, pessoas, per_pessoa, today):
+        species, weights = zip(*SPECIES_WEIGHTS)
+        pets = []
+        for pessoa in pessoas:
+            for _ in range(per_pessoa):
+                kind = rng.choices(species, weights)[0]
+                pets.append(Pet(
+                    pessoa=pessoa,
+                    owner_id=pessoa.user_id,
+                    name=rng.choice(PET_NAMES),
+                    species=kind,
+                    breed=rng.choice(BREEDS.get(kind, [''])),
+                    birth_date=today - timedelta(days=rng.randrange(90, 15 * 365)),
+                    weight=Decimal(rng.randrange(50, 4000)) / 100,
+                ))
+        return Pet.objects.bulk_create(pets, batch_size=1000)
+
+    def seed_records(self, rng, pets, vaccines, today):
+        """
+        Para cada vacina aplicável à espécie, doses desde ~2 meses de vida,
+        cada uma entre a data prevista e alguns meses de atraso; parte dos
+        pets interrompe a vacinação (gerando doses atrasadas).
+        """
+        by_species = {}
+        for vaccine in vaccines:
+            for kind in vaccine.species_target.split(','):
+                by_species.setdefault(kind, []).append(vaccine)
+        
+        batch = []
+        total = 0
+        for pet in pets:
+            for vaccine in by_species.get(pet.species, []):
+                if not vaccine.is_mandatory and rng.random() < 0.3:
+                    continue
+                stop = today - timedelta(days=rng.randrange(0, 700)) if rng.random() < 0.2 else today
+                administered = pet.birth_date + timedelta(days=rng.randrange(50, 120))
+                while administered <= stop:
+                    next_dose = administered + relativedelta(months=vaccine.duration_months)
+                    batch.append(VaccinationRecord(
+                        pet=pet,
+                        owner_id=pet.owner_id,
+                        vaccine=vaccine,
+                        administered_date=administered,
+                        next_dose_date=next_dose,
+                        veterinarian_name=rng.choice(VETERINARIANS),
+                        clinic_name=rng.choice(CLINICS),
+                        batch_number=f'L{rng.randrange(100000, 999999)}',
+                    ))
+                    administered = next_dose + timedelta(days=rng.randrange(0, 60))
+            
+            if len(batch) >= 5000:
+                total += len(VaccinationRecord.objects.bulk_create(batch, batch_size=1000))
+                batch = []
+        
+        total += len(VaccinationRecord.objects.bulk_create(batch, batch_size=1000))
+        return total
@@ -0,0 +1,121 @@
+from datetime import date, timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, Max, OuterRef, Q
+from django.utils import timezone
+
+from core.models import ReminderRun, VaccinationReminder, VaccinationStatus
+from core.models.vaccination_record import DUE_SOON_DAYS
+
+
+class Command(BaseCommand):
+    """
+    Envia um e-mail de resumo por pessoa com as doses que entraram na janela
+    de lembrete desde a última execução.
+    
+    A última execução concluída (ReminderRun) funciona como marca d'água:
+    só são lidas doses atuais (VaccinationStatus) cuja data passou a estar
+    dentro do horizonte ou que foram registradas depois dela, então o custo
+    de cada execução é proporcional ao que mudou. Cada dose lembrada é
+    gravada em VaccinationReminder, o que torna o comando idempotente.
+    Todos os e-mails usam a mesma conexão com o backend de e-mail.
+    """
+    help = 'Envia lembretes de vacinação agrupados por pessoa'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=DUE_SOON_DAYS,
+            help=f'Janela de lembrete em dias (padrão: {DUE_SOON_DAYS})'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Lista os lembretes sem enviar e-mails nem gravar a execução'
+        )
+
+    def handle(self, *args, **options):
+        today = date.today()
+        horizon = today + timedelta(days=options['days'])
+        dry_run = options['dry_run']
+        
+        last_run = ReminderRun.objects.filter(finished_at__isnull=False).first()
+        last_horizon = last_run.due_horizon if last_run else today - timedelta(days=1)
+        last_status_id = last_run.last_status_id if last_run else 0
+        # Fixado antes da leitura para não pular status criados durante a execução
+        max_status_id = VaccinationStatus.objects.aggregate(Max('id'))['id__max'] or 0
+        
+        already_sent = VaccinationReminder.objects.filter(
+            record_id=OuterRef('latest_record_id'),
+            next_dose_date=OuterRef('next_dose_date')
+        )
+        statuses = VaccinationStatus.objects.filter(
+            next_dose_date__gte=today,
+            next_dose_date__lte=horizon,
+            id__lte=max_status_id
+        ).filter(
+            Q(next_dose_date__gt=last_horizon) | Q(id__gt=last_status_id)
+        ).filter(
+            ~Exists(already_sent)
+        ).select_related(
+            'pet', 'pet__pessoa', 'vaccine'
+        ).order_by('pet__pessoa_id', 'next_dose_date', 'pet__name')
+        
+        run = None if dry_run else ReminderRun.objects.create(
+            due_horizon=horizon,
+            last_status_id=max_status_id
+        )
+        
+        with get_connection() as connection:
+            for _, group in groupby(statuses.iterator(), key=lambda status: status.pet.pessoa_id):
+                group = list(group)
+                pessoa = group[0].pet.pessoa
+                
+                if dry_run:
+                    self.stdout.write(f'{pessoa.email}: {len(group)} lembrete(s)')
+                    continue
+                
+                connection.send_messages([self._build_message(pessoa, group, options['days'])])
+                VaccinationReminder.objects.bulk_create([
+                    VaccinationReminder(
+                        record_id=status.latest_record_id,
+                        pessoa=pessoa,
+                        run=run,
+                        next_dose_date=status.next_dose_date
+                    )
+                    for status in group
+                ], ignore_conflicts=True)
+                run.emails_sent += 1
+                run.reminders_sent += len(group)
+        
+        if run is not None:
+            run.finished_at = timezone.now()
+            run.save()
+            self.stdout.write(self.style.SUCCESS(
+                f'{run.reminders_sent} lembrete(s) enviados em {run.emails_sent} e-mail(s).'
+            ))
+
+    def _build_message(self, pessoa, statuses, days):
+        """Monta o e-mail de resumo de uma pessoa"""
+        lines = [
+            f'Olá, {pessoa.name}!',
+            '',
+            f'As seguintes vacinas dos seus pets vencem nos próximos {days} dias:',
+            '',
+        ]
+        for status in statuses:
+            lines.append(
+                f'- {status.pet.name}: {status.vaccine.name} em '
+                f'{status.next_dose_date.strftime("%d/%m/%Y")}'
+            )
+        
+        return EmailMessage(
+            subject='Lembrete de vacinação',
+            body='\n'.join(lines),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[pessoa.email]
+        )
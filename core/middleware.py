@@ -0,0 +1,259 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import serializers
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_PROFILING = {
+    'ENABLED': False,
+    # Requisições acima destes limites são registradas no log
+    'SLOW_REQUEST_MS': 500,
+    'MAX_QUERIES': 30,
+    # Consultas repetidas (mesmo SQL, parâmetros diferentes) listadas no log
+    'MAX_DUPLICATES_LOGGED': 5,
+}
+
+# Métricas da requisição atual (None fora do RequestProfilingMiddleware)
+_current_profile = ContextVar('request_profile', default=None)
+
+
+class RequestProfile:
+    """
+    Métricas coletadas durante uma requisição. Pode receber consultas e
+    serializações de várias threads (run_queries, map_in_threads); o
+    tempo de banco é a soma dos tempos de cada consulta.
+    """
+    
+    def __init__(self):
+        self.queries = []
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.view_name = None
+        self.view_started = None
+        self._lock = threading.Lock()
+        # Profundidade de serialização por thread (serialization_timer)
+        self._local = threading.local()
+    
+    def record_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.db_time += elapsed
+                self.queries.append(sql)
+    
+    def add_serializer_time(self, seconds):
+        with self._lock:
+            self.serializer_time += seconds
+    
+    def duplicated_queries(self):
+        """SQL executado mais de uma vez (típico de N+1), do mais repetido ao menos"""
+        return [
+            (sql, count)
+            for sql, count in Counter(self.queries).most_common()
+            if count > 1
+        ]
+
+
+@contextmanager
+def serialization_timer():
+    """
+    Soma o tempo do bloco ao tempo de serialização da requisição atual.
+    Apenas o bloco mais externo é medido, para não contar duas vezes
+    serializers aninhados (ex.: em SerializerMethodField).
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+    
+    local = profile._local
+    local.depth = getattr(local, 'depth', 0) + 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        local.depth -= 1
+        if local.depth == 0:
+            profile.add_serializer_time(time.perf_counter() - started)
+
+
+def _profiled_data(original):
+    """
+    Envolve Serializer.data / ListSerializer.data para medir o tempo de
+    serialização com serialization_timer().
+    """
+    def data(self):
+        with serialization_timer():
+            return original.fget(self)
+    
+    data.profiled = True
+    return property(data)
+
+
+def _install_serializer_timing():
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        if not getattr(cls.data.fget, 'profiled', False):
+            cls.data = _profiled_data(cls.data)
+
+
+def _record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper instalado em todas as conexões: registra a consulta no
+    perfil da requisição atual (_current_profile), inclusive em threads que
+    herdam o contexto (sync_to_async, run_queries, map_in_threads).
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    return profile.record_query(execute, sql, params, many, context)
+
+
+def _install_query_recording(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _install_query_recording_on_all():
+    """Instala _record_query nas conexões da thread atual e nas criadas depois"""
+    connection_created.connect(_install_query_recording, dispatch_uid='request_profiling')
+    for connection in connections.all():
+        _install_query_recording(connection)
+
+
+class RequestProfilingMiddleware:
+    """
+    Instrumentação opcional por requisição (settings.REQUEST_PROFILING).
+    
+    Mede número de consultas, tempo de banco, de serialização, da view e
+    total, e os expõe no header Server-Timing. Requisições acima de
+    SLOW_REQUEST_MS ou MAX_QUERIES são registradas no log (logger
+    core.middleware) com o nome da view (ex.:
+    VaccinationRecordViewSet.overdue) e as consultas repetidas.
+    
+    As consultas são registradas por um execute wrapper em todas as
+    conexões, que usa o perfil do contexto atual: entram também as feitas
+    pelo ORM assíncrono e pelas threads de run_queries / map_in_threads.
+    Sob ASGI o middleware roda de forma assíncrona, sem uma thread extra.
+    
+    Desativado, o middleware levanta MiddlewareNotUsed e é removido da
+    cadeia pelo Django, sem custo por requisição.
+    """
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response):
+        self.options = {
+            **DEFAULT_REQUEST_PROFILING,
+            **getattr(settings, 'REQUEST_PROFILING', {})
+        }
+        if not self.options['ENABLED']:
+            raise MiddlewareNotUsed
+        
+        _install_serializer_timing()
+        _install_query_recording_on_all()
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+    
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        
+        # Conexões desta thread abertas antes da ativação do middleware
+        for connection in connections.all():
+            _install_query_recording(connection)
+        
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+        return self.finish(request, response, profile, started)
+    
+    async def __acall__(self, request):
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+        return self.finish(request, response, profile, started)
+    
+    def finish(self, request, response, profile, started):
+        finished = time.perf_counter()
+        total = finished - started
+        # Da chamada da view até a resposta voltar (inclui a renderização)
+        view_time = finished - profile.view_started if profile.view_started else 0.0
+        
+        response['Server-Timing'] = self.server_timing(profile, view_time, total)
+        self.log_if_slow(request, profile, total)
+        return response
+    
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.view_name = self.get_view_name(request, view_func)
+            profile.view_started = time.perf_counter()
+        return None
+    
+    @staticmethod
+    def get_view_name(request, view_func):
+        """Nome legível da view: Classe.ação para ViewSets, senão o nome da função"""
+        cls = getattr(view_func, 'cls', None)
+        if cls is None:
+            return getattr(view_func, '__name__', repr(view_func))
+        actions = getattr(view_func, 'actions', None) or {}
+        action = actions.get(request.method.lower())
+        return f'{cls.__name__}.{action}' if action else cls.__name__
+    
+    @staticmethod
+    def server_timing(profile, view_time, total):
+        metrics = [
+            ('db', profile.db_time, f'{len(profile.queries)} queries'),
+            ('serializer', profile.serializer_time, None),
+            ('view', view_time, profile.view_name),
+            ('total', total, None),
+        ]
+        parts = []
+        for name, seconds, description in metrics:
+            part = f'{name};dur={seconds * 1000:.1f}'
+            if description:
+                part += f';desc="{description}"'
+            parts.append(part)
+        return ', '.join(parts)
+    
+    def log_if_slow(self, request, profile, total):
+        total_ms = total * 1000
+        if (total_ms < self.options['SLOW_REQUEST_MS']
+                and len(profile.queries) <= self.options['MAX_QUERIES']):
+            return
+        
+        lines = [
+            '%s %s (%s): %.1f ms, %d queries (%.1f ms db, %.1f ms serializer)' % (
+                request.method, request.path, profile.view_name or '-',
+                total_ms, len(profile.queries),
+                profile.db_time * 1000, profile.serializer_time * 1000
+            )
+        ]
+        duplicates = profile.duplicated_queries()[:self.options['MAX_DUPLICATES_LOGGED']]
+        for sql, count in duplicates:
+            lines.append(f'  {count}x {sql}')
+        logger.warning('\n'.join(lines))
+
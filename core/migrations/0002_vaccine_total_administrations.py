@@ -0,0 +1,30 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_total_administrations(apps, schema_editor):
+    """Preenche o contador com a contagem atual de registros"""
+    Vaccine = apps.get_model('core', 'Vaccine')
+    counts = Vaccine.objects.annotate(count=Count('vaccination_records')).values_list('pk', 'count')
+    for pk, count in counts:
+        Vaccine.objects.filter(pk=pk).update(total_administrations=count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vaccine',
+            name='total_administrations',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Total de aplicações registradas (mantido por core.signals)'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationrecord',
+            index=models.Index(fields=['vaccine', '-administered_date'], name='core_vaccin_vaccine_8a9f12_idx'),
+        ),
+        migrations.RunPython(populate_total_administrations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_vaccine_total_administrations'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vaccinationrecord',
+            index=models.Index(fields=['-administered_date', '-id'], name='core_vaccin_adminis_0025c1_idx'),
+        ),
+    ]
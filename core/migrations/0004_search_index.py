@@ -0,0 +1,63 @@
+from django.db import migrations, OperationalError
+
+
+TOKENIZE = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+
+SEARCH_TABLES = [
+    (
+        'core_pet_search',
+        ['name', 'breed', 'pessoa_name'],
+        'SELECT p.id, p.name, p.breed, pe.name FROM core_pet p '
+        'INNER JOIN core_pessoa pe ON pe.id = p.pessoa_id',
+    ),
+    (
+        'core_vaccinationrecord_search',
+        ['pet_name', 'vaccine_name', 'veterinarian_name', 'clinic_name'],
+        'SELECT r.id, p.name, v.name, r.veterinarian_name, r.clinic_name '
+        'FROM core_vaccinationrecord r '
+        'INNER JOIN core_pet p ON p.id = r.pet_id '
+        'INNER JOIN core_vaccine v ON v.id = r.vaccine_id',
+    ),
+    (
+        'core_vaccine_search',
+        ['name', 'manufacturer', 'species_target'],
+        'SELECT v.id, v.name, v.manufacturer, v.species_target FROM core_vaccine v',
+    ),
+]
+
+
+def create_search_tables(apps, schema_editor):
+    """Cria e popula as tabelas FTS5 (apenas SQLite com FTS5 disponível)"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    
+    with schema_editor.connection.cursor() as cursor:
+        for table, columns, select_sql in SEARCH_TABLES:
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE {table} USING fts5({', '.join(columns)}, {TOKENIZE})"
+                )
+            except OperationalError:
+                # SQLite compilado sem FTS5: a busca usa o SearchFilter padrão
+                return
+            cursor.execute(f"INSERT INTO {table}(rowid, {', '.join(columns)}) {select_sql}")
+
+
+def drop_search_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    
+    with schema_editor.connection.cursor() as cursor:
+        for table, _, _ in SEARCH_TABLES:
+            cursor.execute(f'DROP TABLE IF EXISTS {table}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_vaccinationrecord_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_tables, drop_search_tables),
+    ]
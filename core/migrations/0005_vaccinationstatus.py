@@ -0,0 +1,65 @@
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+import django.db.models.deletion
+
+
+def backfill_vaccination_status(apps, schema_editor):
+    """Cria o status atual a partir do registro mais recente de cada (pet, vacina)"""
+    VaccinationRecord = apps.get_model('core', 'VaccinationRecord')
+    VaccinationStatus = apps.get_model('core', 'VaccinationStatus')
+    
+    newer = VaccinationRecord.objects.filter(
+        pet_id=OuterRef('pet_id'),
+        vaccine_id=OuterRef('vaccine_id'),
+        administered_date__gt=OuterRef('administered_date')
+    )
+    latest = VaccinationRecord.objects.filter(~Exists(newer)).values_list(
+        'id', 'pet_id', 'vaccine_id', 'administered_date', 'next_dose_date'
+    )
+    VaccinationStatus.objects.bulk_create(
+        (
+            VaccinationStatus(
+                latest_record_id=record_id,
+                pet_id=pet_id,
+                vaccine_id=vaccine_id,
+                administered_date=administered_date,
+                next_dose_date=next_dose_date
+            )
+            for record_id, pet_id, vaccine_id, administered_date, next_dose_date in latest.iterator()
+        ),
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VaccinationStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('administered_date', models.DateField(help_text='Data da aplicação mais recente')),
+                ('next_dose_date', models.DateField(blank=True, help_text='Data da próxima dose segundo o registro mais recente', null=True)),
+                ('latest_record', models.OneToOneField(help_text='Registro de vacinação mais recente deste pet com esta vacina', on_delete=django.db.models.deletion.CASCADE, related_name='current_status', to='core.vaccinationrecord')),
+                ('pet', models.ForeignKey(help_text='Pet vacinado', on_delete=django.db.models.deletion.CASCADE, related_name='vaccination_statuses', to='core.pet')),
+                ('vaccine', models.ForeignKey(help_text='Vacina aplicada', on_delete=django.db.models.deletion.CASCADE, related_name='vaccination_statuses', to='core.vaccine')),
+            ],
+            options={
+                'verbose_name': 'Vaccination Status',
+                'verbose_name_plural': 'Vaccination Statuses',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationstatus',
+            index=models.Index(fields=['next_dose_date'], name='core_vaccin_next_do_acef3e_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='vaccinationstatus',
+            unique_together={('pet', 'vaccine')},
+        ),
+        migrations.RunPython(backfill_vaccination_status, migrations.RunPython.noop),
+    ]
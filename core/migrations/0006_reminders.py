@@ -0,0 +1,46 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_vaccinationstatus'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('due_horizon', models.DateField(help_text='Maior next_dose_date coberta por esta execução')),
+                ('last_status_id', models.BigIntegerField(default=0, help_text='Maior id de VaccinationStatus visto por esta execução')),
+                ('reminders_sent', models.PositiveIntegerField(default=0)),
+                ('emails_sent', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Reminder Run',
+                'verbose_name_plural': 'Reminder Runs',
+                'ordering': ['-started_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='VaccinationReminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('next_dose_date', models.DateField()),
+                ('sent_at', models.DateTimeField(auto_now_add=True)),
+                ('pessoa', models.ForeignKey(help_text='Pessoa que recebeu o lembrete', on_delete=django.db.models.deletion.CASCADE, related_name='vaccination_reminders', to='core.pessoa')),
+                ('record', models.ForeignKey(help_text='Registro cuja próxima dose foi lembrada', on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='core.vaccinationrecord')),
+                ('run', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reminders', to='core.reminderrun')),
+            ],
+            options={
+                'verbose_name': 'Vaccination Reminder',
+                'verbose_name_plural': 'Vaccination Reminders',
+                'ordering': ['-sent_at'],
+                'unique_together': {('record', 'next_dose_date')},
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def backfill_owner(apps, schema_editor):
+    """Copia pessoa.user para Pet.owner e pet.owner para VaccinationRecord.owner"""
+    Pessoa = apps.get_model('core', 'Pessoa')
+    Pet = apps.get_model('core', 'Pet')
+    VaccinationRecord = apps.get_model('core', 'VaccinationRecord')
+    
+    Pet.objects.update(owner_id=Subquery(
+        Pessoa.objects.filter(pk=OuterRef('pessoa_id')).values('user_id')[:1]
+    ))
+    VaccinationRecord.objects.update(owner_id=Subquery(
+        Pet.objects.filter(pk=OuterRef('pet_id')).values('owner_id')[:1]
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0006_reminders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='owner',
+            field=models.ForeignKey(editable=False, help_text='Usuário dono do pet (cópia de pessoa.user, usada para filtrar por dono sem joins)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='vaccinationrecord',
+            name='owner',
+            field=models.ForeignKey(editable=False, help_text='Usuário dono do pet (cópia de pet.owner, usada para filtrar por dono sem joins)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(backfill_owner, migrations.RunPython.noop),
+    ]
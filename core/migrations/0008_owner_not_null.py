@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    # Separada da 0007 para que o ALTER não rode na mesma transação do
+    # preenchimento (o PostgreSQL recusa ALTER TABLE com eventos de
+    # constraint pendentes)
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0007_owner'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pet',
+            name='owner',
+            field=models.ForeignKey(editable=False, help_text='Usuário dono do pet (cópia de pessoa.user, usada para filtrar por dono sem joins)', on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='vaccinationrecord',
+            name='owner',
+            field=models.ForeignKey(editable=False, help_text='Usuário dono do pet (cópia de pet.owner, usada para filtrar por dono sem joins)', on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_owner_not_null'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['birth_date'], name='core_pet_birth_d_bf48ca_idx'),
+        ),
+    ]
@@ -1,11 +1,17 @@
 from .pessoa import Pessoa
 from .pet import Pet
 from .vaccine import Vaccine
-from .vaccination_record import VaccinationRecord
+from .vaccination_record import VaccinationRecord, VaccinationRecordQuerySet
+from .vaccination_status import VaccinationStatus
+from .reminder import ReminderRun, VaccinationReminder
 
 __all__ = [
     'Pessoa',
     'Pet',
     'Vaccine',
     'VaccinationRecord',
+    'VaccinationRecordQuerySet',
+    'VaccinationStatus',
+    'ReminderRun',
+    'VaccinationReminder',
 ]
\ No newline at end of file
@@ -0,0 +1,30 @@
+from django.db.models import Func, IntegerField
+
+
+class DaysBetween(Func):
+    """
+    Número inteiro de dias entre duas datas (end - start), calculado no banco.
+    Retorna NULL quando qualquer uma das datas for NULL.
+    """
+    arity = 2
+    output_field = IntegerField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        # PostgreSQL e Oracle: date - date já retorna um número de dias
+        return super().as_sql(
+            compiler, connection, template='(%(expressions)s)', arg_joiner=' - ', **extra_context
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template='CAST(julianday(%(expressions)s) AS integer)',
+            arg_joiner=') - julianday(',
+            **extra_context
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection, function='DATEDIFF', **extra_context
+        )
@@ -43,6 +43,24 @@ class Pessoa(models.Model):
     def __str__(self):
         return self.name
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Guarda o usuário carregado para detectar trocas ao salvar"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_user_id = instance.__dict__.get('user_id')
+        return instance
+    
+    def save(self, *args, **kwargs):
+        """Sobrescreve o save para propagar trocas de usuário ao owner dos pets"""
+        super().save(*args, **kwargs)
+        
+        loaded_user_id = getattr(self, '_loaded_user_id', None)
+        if loaded_user_id is not None and loaded_user_id != self.user_id:
+            from core.models.vaccination_record import VaccinationRecord
+            self.pets.update(owner_id=self.user_id)
+            VaccinationRecord.objects.filter(pet__pessoa=self).update(owner_id=self.user_id)
+        self._loaded_user_id = self.user_id
+    
     @property
     def total_pets(self):
         """Retorna o número total de pets desta pessoa"""
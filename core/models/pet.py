@@ -1,6 +1,96 @@
 from django.db import models
+from django.contrib.auth.models import User
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import ExtractMonth, ExtractYear, Greatest
 from django.core.exceptions import ValidationError
 from datetime import date
+from dateutil.relativedelta import relativedelta
+
+
+AGE_UNITS = {
+    'years': relativedelta(years=1),
+    'months': relativedelta(months=1),
+}
+
+# Maior idade aceita nos filtros, por unidade (evita datas fora do calendário)
+AGE_LIMITS = {
+    'years': 200,
+    'months': 2400,
+}
+
+
+def age_in_years(birth_date, today=None):
+    """Idade em anos completos na data de hoje"""
+    today = today or date.today()
+    age = today.year - birth_date.year
+    # Ajusta se o aniversário ainda não ocorreu neste ano
+    if (today.month, today.day) < (birth_date.month, birth_date.day):
+        age -= 1
+    return age
+
+
+def age_in_months(birth_date, today=None):
+    """Idade em meses completos na data de hoje"""
+    today = today or date.today()
+    months = (today.year - birth_date.year) * 12
+    months += today.month - birth_date.month
+    if today.day < birth_date.day:
+        months -= 1
+    return max(0, months)
+
+
+class PetQuerySet(models.QuerySet):
+    """
+    QuerySet com os cálculos de idade feitos no banco de dados.
+    """
+
+    def with_age(self, today=None):
+        """
+        Anota age_years e age_months em SQL, com o mesmo resultado das
+        funções age_in_years() / age_in_months(). As anotações substituem
+        o cálculo em Python das propriedades do modelo.
+        """
+        today = today or date.today()
+        # 1 se o dia/mês de nascimento ainda não chegou neste ano
+        before_birthday = Case(
+            When(
+                Q(birth_date__month__gt=today.month)
+                | Q(birth_date__month=today.month, birth_date__day__gt=today.day),
+                then=Value(1)
+            ),
+            default=Value(0)
+        )
+        # 1 se o dia de nascimento ainda não chegou neste mês
+        before_monthday = Case(
+            When(birth_date__day__gt=today.day, then=Value(1)),
+            default=Value(0)
+        )
+        return self.annotate(
+            age_years=Value(today.year) - ExtractYear('birth_date') - before_birthday,
+            age_months=Greatest(
+                Value(0),
+                Value(today.year * 12 + today.month)
+                - ExtractYear('birth_date') * 12
+                - ExtractMonth('birth_date')
+                - before_monthday
+            ),
+        )
+
+    def age_between(self, minimum=None, maximum=None, unit='years', today=None):
+        """
+        Pets com idade (em anos ou meses completos) entre minimum e maximum,
+        inclusive, como faixa de birth_date que usa o índice da coluna.
+        """
+        today = today or date.today()
+        step = AGE_UNITS[unit]
+        queryset = self
+        if minimum is not None:
+            # Idade >= N: completou N anos/meses até hoje
+            queryset = queryset.filter(birth_date__lte=today - step * minimum)
+        if maximum is not None:
+            # Idade <= N: ainda não completou N + 1
+            queryset = queryset.filter(birth_date__gt=today - step * (maximum + 1))
+        return queryset
 
 
 class Pet(models.Model):
@@ -24,6 +114,13 @@ class Pet(models.Model):
         related_name='pets',
         help_text="Pessoa dona do pet"
     )
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        editable=False,
+        help_text="Usuário dono do pet (cópia de pessoa.user, usada para filtrar por dono sem joins)"
+    )
     name = models.CharField(max_length=100)
     species = models.CharField(
         max_length=20,
@@ -58,30 +155,39 @@ class Pet(models.Model):
         indexes = [
             models.Index(fields=['pessoa', '-created_at']),
             models.Index(fields=['species']),
+            models.Index(fields=['birth_date']),
         ]
     
+    objects = PetQuerySet.as_manager()
+    
     def __str__(self):
         return f"{self.name} ({self.get_species_display()})"
     
+    # As propriedades abaixo usam os valores anotados por
+    # PetQuerySet.with_age() quando presentes e só calculam em Python
+    # para instâncias não anotadas.
+    
     @property
     def age_years(self):
         """Calcula a idade do pet em anos"""
-        today = date.today()
-        age = today.year - self.birth_date.year
-        # Ajusta se o aniversário ainda não ocorreu neste ano
-        if (today.month, today.day) < (self.birth_date.month, self.birth_date.day):
-            age -= 1
-        return age
+        if '_age_years' in self.__dict__:
+            return self._age_years
+        return age_in_years(self.birth_date)
+    
+    @age_years.setter
+    def age_years(self, value):
+        self._age_years = value
     
     @property
     def age_months(self):
         """Calcula a idade do pet em meses"""
-        today = date.today()
-        months = (today.year - self.birth_date.year) * 12
-        months += today.month - self.birth_date.month
-        if today.day < self.birth_date.day:
-            months -= 1
-        return max(0, months)
+        if '_age_months' in self.__dict__:
+            return self._age_months
+        return age_in_months(self.birth_date)
+    
+    @age_months.setter
+    def age_months(self, value):
+        self._age_months = value
     
     def clean(self):
         """Valida os campos do modelo"""
@@ -99,7 +205,22 @@ class Pet(models.Model):
                 'weight': 'Peso deve ser maior que zero.'
             })
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Guarda o dono carregado para detectar transferências ao salvar"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_owner_id = instance.__dict__.get('owner_id')
+        return instance
+    
     def save(self, *args, **kwargs):
-        """Sobrescreve o save para chamar clean()"""
+        """Sobrescreve o save para chamar clean() e manter o owner atualizado"""
+        if self.pessoa_id:
+            self.owner_id = self.pessoa.user_id
         self.full_clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+        
+        # Transferência de tutor: os registros de vacinação acompanham o pet
+        loaded_owner_id = getattr(self, '_loaded_owner_id', None)
+        if loaded_owner_id is not None and loaded_owner_id != self.owner_id:
+            self.vaccination_records.update(owner_id=self.owner_id)
+        self._loaded_owner_id = self.owner_id
\ No newline at end of file
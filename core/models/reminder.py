@@ -0,0 +1,66 @@
+from django.db import models
+
+
+class ReminderRun(models.Model):
+    """
+    Execução do comando send_vaccination_reminders.
+    
+    A última execução serve de marca d'água para a próxima: apenas doses
+    que entraram na janela de lembrete depois dela (horizonte de datas
+    avançou ou status novo) são consideradas.
+    """
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    due_horizon = models.DateField(
+        help_text="Maior next_dose_date coberta por esta execução"
+    )
+    last_status_id = models.BigIntegerField(
+        default=0,
+        help_text="Maior id de VaccinationStatus visto por esta execução"
+    )
+    reminders_sent = models.PositiveIntegerField(default=0)
+    emails_sent = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        ordering = ['-started_at']
+        verbose_name = 'Reminder Run'
+        verbose_name_plural = 'Reminder Runs'
+    
+    def __str__(self):
+        return f"Run {self.pk} until {self.due_horizon} ({self.reminders_sent} reminders)"
+
+
+class VaccinationReminder(models.Model):
+    """
+    Lembrete enviado para uma próxima dose. Garante que cada dose gere no
+    máximo um lembrete, mesmo se o comando for executado várias vezes.
+    """
+    record = models.ForeignKey(
+        'VaccinationRecord',
+        on_delete=models.CASCADE,
+        related_name='reminders',
+        help_text="Registro cuja próxima dose foi lembrada"
+    )
+    pessoa = models.ForeignKey(
+        'Pessoa',
+        on_delete=models.CASCADE,
+        related_name='vaccination_reminders',
+        help_text="Pessoa que recebeu o lembrete"
+    )
+    run = models.ForeignKey(
+        ReminderRun,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='reminders'
+    )
+    next_dose_date = models.DateField()
+    sent_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-sent_at']
+        verbose_name = 'Vaccination Reminder'
+        verbose_name_plural = 'Vaccination Reminders'
+        unique_together = [['record', 'next_dose_date']]
+    
+    def __str__(self):
+        return f"{self.pessoa} - record {self.record_id} ({self.next_dose_date})"
@@ -1,7 +1,92 @@
 from django.db import models
+from django.contrib.auth.models import User
+from django.db.models import BooleanField, Case, Count, F, Q, Value, When
 from django.core.exceptions import ValidationError
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
+from core.models.functions import DaysBetween
+
+
+# Janela (em dias) em que uma próxima dose é considerada "a vencer"
+DUE_SOON_DAYS = 30
+
+
+# Prefixo para aplicar as condições ao status atual (VaccinationStatus)
+# em vez do próprio registro, ignorando doses já substituídas
+CURRENT_STATUS = 'current_status__'
+
+
+def due_soon_q(today, prefix=''):
+    """Condição de próxima dose dentro da janela de DUE_SOON_DAYS"""
+    return Q(**{
+        f'{prefix}next_dose_date__gte': today,
+        f'{prefix}next_dose_date__lte': today + timedelta(days=DUE_SOON_DAYS),
+    })
+
+
+def overdue_q(today, prefix=''):
+    """Condição de próxima dose atrasada"""
+    return Q(**{f'{prefix}next_dose_date__lt': today})
+
+
+class VaccinationRecordQuerySet(models.QuerySet):
+    """
+    QuerySet com os cálculos de status de dose feitos no banco de dados.
+    """
+
+    def with_due_status(self, today=None):
+        """
+        Anota is_due, is_overdue e days_until_due em SQL.
+        As anotações podem ser usadas em filter() e order_by() e substituem
+        o cálculo em Python das propriedades do modelo.
+        """
+        today = today or date.today()
+        return self.annotate(
+            days_until_due=DaysBetween(F('next_dose_date'), Value(today)),
+            is_due=Case(
+                When(due_soon_q(today), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            ),
+            is_overdue=Case(
+                When(overdue_q(today), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            ),
+        )
+
+    def current(self):
+        """Apenas o registro mais recente de cada (pet, vacina)"""
+        return self.filter(current_status__isnull=False)
+
+    def due_soon(self, today=None, current_only=False):
+        """
+        Registros com próxima dose dentro da janela. Com current_only, usa a
+        faixa indexada de VaccinationStatus e ignora doses já substituídas.
+        """
+        prefix = CURRENT_STATUS if current_only else ''
+        return self.filter(due_soon_q(today or date.today(), prefix))
+
+    def overdue(self, today=None, current_only=False):
+        """
+        Registros com próxima dose atrasada. Com current_only, usa a faixa
+        indexada de VaccinationStatus e ignora doses já substituídas.
+        """
+        prefix = CURRENT_STATUS if current_only else ''
+        return self.filter(overdue_q(today or date.today(), prefix))
+
+    def due_counts(self, today=None, current_only=False):
+        """
+        Retorna em uma única consulta o total de registros e quantos estão
+        a vencer e atrasados, usando agregação condicional.
+        """
+        today = today or date.today()
+        prefix = CURRENT_STATUS if current_only else ''
+        return self.aggregate(
+            total=Count('id'),
+            due_soon=Count('id', filter=due_soon_q(today, prefix)),
+            overdue=Count('id', filter=overdue_q(today, prefix)),
+        )
 
 
 class VaccinationRecord(models.Model):
@@ -15,6 +100,13 @@ class VaccinationRecord(models.Model):
         related_name='vaccination_records',
         help_text="Pet que recebeu a vacina"
     )
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        editable=False,
+        help_text="Usuário dono do pet (cópia de pet.owner, usada para filtrar por dono sem joins)"
+    )
     vaccine = models.ForeignKey(
         'Vaccine',
         on_delete=models.PROTECT,
@@ -50,13 +142,17 @@ class VaccinationRecord(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = VaccinationRecordQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-administered_date']
         verbose_name = 'Vaccination Record'
         verbose_name_plural = 'Vaccination Records'
         indexes = [
             models.Index(fields=['pet', '-administered_date']),
+            models.Index(fields=['-administered_date', '-id']),
             models.Index(fields=['vaccine']),
+            models.Index(fields=['vaccine', '-administered_date']),
             models.Index(fields=['next_dose_date']),
         ]
         # Evita vacinas duplicadas no mesmo dia
@@ -65,28 +161,58 @@ class VaccinationRecord(models.Model):
     def __str__(self):
         return f"{self.pet.name} - {self.vaccine.name} on {self.administered_date}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Guarda o pet e a vacina carregados para detectar trocas ao salvar"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_pet_id = instance.__dict__.get('pet_id')
+        instance._loaded_vaccine_id = instance.__dict__.get('vaccine_id')
+        return instance
+    
+    # As propriedades abaixo usam os valores anotados por
+    # VaccinationRecordQuerySet.with_due_status() quando presentes e
+    # só calculam em Python para instâncias não anotadas.
+    
     @property
     def is_due(self):
         """Verifica se a próxima dose está próxima (dentro de 30 dias)"""
+        if '_is_due' in self.__dict__:
+            return self._is_due
         if not self.next_dose_date:
             return False
         days_until_due = (self.next_dose_date - date.today()).days
-        return 0 <= days_until_due <= 30
+        return 0 <= days_until_due <= DUE_SOON_DAYS
+    
+    @is_due.setter
+    def is_due(self, value):
+        self._is_due = value
     
     @property
     def is_overdue(self):
         """Verifica se a próxima dose está atrasada"""
+        if '_is_overdue' in self.__dict__:
+            return self._is_overdue
         if not self.next_dose_date:
             return False
         return date.today() > self.next_dose_date
     
+    @is_overdue.setter
+    def is_overdue(self, value):
+        self._is_overdue = value
+    
     @property
     def days_until_due(self):
         """Calcula os dias restantes até a próxima dose"""
+        if '_days_until_due' in self.__dict__:
+            return self._days_until_due
         if not self.next_dose_date:
             return None
         return (self.next_dose_date - date.today()).days
     
+    @days_until_due.setter
+    def days_until_due(self, value):
+        self._days_until_due = value
+    
     def calculate_next_dose_date(self):
         """Calcula a data da próxima dose com base na duração da vacina"""
         if self.vaccine.duration_months:
@@ -116,6 +242,17 @@ class VaccinationRecord(models.Model):
         if not self.next_dose_date:
             self.next_dose_date = self.calculate_next_dose_date()
         
+        if self.pet_id:
+            self.owner_id = self.pet.owner_id
+        
         # Validate before saving
         self.full_clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+        
+        # Descarta o status anotado, que pode não refletir mais os dados salvos
+        for attr in ('_is_due', '_is_overdue', '_days_until_due'):
+            self.__dict__.pop(attr, None)
+        
+        # Os signals de post_save já compararam com os valores carregados
+        self._loaded_pet_id = self.pet_id
+        self._loaded_vaccine_id = self.vaccine_id
\ No newline at end of file
@@ -0,0 +1,107 @@
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef, Q
+
+
+# Quantidade máxima de pares (pet, vacina) recalculados por consulta
+REFRESH_CHUNK_SIZE = 200
+
+
+class VaccinationStatusQuerySet(models.QuerySet):
+    """QuerySet para o status atual de vacinação"""
+
+    def refresh(self, pairs):
+        """
+        Recalcula o status de cada par (pet_id, vaccine_id) a partir do
+        registro mais recente do par, removendo o status quando não houver
+        mais registros. Usado pelos signals de VaccinationRecord.
+        """
+        pairs = [pair for pair in set(pairs) if None not in pair]
+        
+        # Em blocos, para manter a cláusula OR dentro dos limites do banco
+        for start in range(0, len(pairs), REFRESH_CHUNK_SIZE):
+            pairs_q = Q()
+            for pet_id, vaccine_id in pairs[start:start + REFRESH_CHUNK_SIZE]:
+                pairs_q |= Q(pet_id=pet_id, vaccine_id=vaccine_id)
+            self._replace(pairs_q)
+
+    def refresh_pets(self, pet_ids):
+        """Recalcula o status de todas as vacinas dos pets informados"""
+        self._replace(Q(pet_id__in=list(pet_ids)))
+
+    def _replace(self, condition):
+        """Substitui os status que atendem `condition` pelos registros mais recentes"""
+        from core.models.vaccination_record import VaccinationRecord
+        
+        # unique_together (pet, vaccine, administered_date) garante que
+        # existe no máximo um registro mais recente por par
+        newer = VaccinationRecord.objects.filter(
+            pet_id=OuterRef('pet_id'),
+            vaccine_id=OuterRef('vaccine_id'),
+            administered_date__gt=OuterRef('administered_date')
+        )
+        latest = VaccinationRecord.objects.filter(condition).filter(
+            ~Exists(newer)
+        ).values_list('id', 'pet_id', 'vaccine_id', 'administered_date', 'next_dose_date')
+        
+        with transaction.atomic():
+            self.filter(condition).delete()
+            self.bulk_create([
+                self.model(
+                    pet_id=pet_id,
+                    vaccine_id=vaccine_id,
+                    latest_record_id=record_id,
+                    administered_date=administered_date,
+                    next_dose_date=next_dose_date
+                )
+                for record_id, pet_id, vaccine_id, administered_date, next_dose_date in latest
+            ])
+
+
+class VaccinationStatus(models.Model):
+    """
+    Status atual de vacinação: uma linha por (pet, vacina), apontando para
+    o registro mais recente e a sua próxima dose.
+    
+    Mantido pelos signals em core.signals e recalculável com o comando
+    `backfill_vaccination_status`. Permite consultar doses a vencer e
+    atrasadas por faixa de next_dose_date sem percorrer todo o histórico.
+    """
+    pet = models.ForeignKey(
+        'Pet',
+        on_delete=models.CASCADE,
+        related_name='vaccination_statuses',
+        help_text="Pet vacinado"
+    )
+    vaccine = models.ForeignKey(
+        'Vaccine',
+        on_delete=models.CASCADE,
+        related_name='vaccination_statuses',
+        help_text="Vacina aplicada"
+    )
+    latest_record = models.OneToOneField(
+        'VaccinationRecord',
+        on_delete=models.CASCADE,
+        related_name='current_status',
+        help_text="Registro de vacinação mais recente deste pet com esta vacina"
+    )
+    administered_date = models.DateField(
+        help_text="Data da aplicação mais recente"
+    )
+    next_dose_date = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Data da próxima dose segundo o registro mais recente"
+    )
+    
+    objects = VaccinationStatusQuerySet.as_manager()
+    
+    class Meta:
+        verbose_name = 'Vaccination Status'
+        verbose_name_plural = 'Vaccination Statuses'
+        unique_together = [['pet', 'vaccine']]
+        indexes = [
+            models.Index(fields=['next_dose_date']),
+        ]
+    
+    def __str__(self):
+        return f"{self.pet_id} - {self.vaccine_id}: next dose {self.next_dose_date}"
@@ -33,6 +33,11 @@ class Vaccine(models.Model):
         default=False,
         help_text="Se esta vacina é legalmente obrigatória"
     )
+    total_administrations = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Total de aplicações registradas (mantido por core.signals)"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -42,4 +47,18 @@ class Vaccine(models.Model):
         verbose_name_plural = 'Vaccines'
     
     def __str__(self):
-        return f"{self.name} ({self.duration_months} months)"
\ No newline at end of file
+        return f"{self.name} ({self.duration_months} months)"
+    
+    def save(self, *args, **kwargs):
+        """
+        Ao atualizar, não grava total_administrations: o valor em memória
+        sobrescreveria os incrementos com F() feitos por core.signals depois
+        que a vacina foi carregada (ex.: edição no admin ou PUT/PATCH).
+        """
+        if (not self._state.adding and kwargs.get('update_fields') is None
+                and not kwargs.get('force_insert') and not args):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'total_administrations'
+            ]
+        super().save(*args, **kwargs)
@@ -0,0 +1,173 @@
+import base64
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError as APIValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination:
+    """
+    Paginação por keyset (cursor) sobre a ordenação `keyset_ordering` da view.
+
+    Cada página é buscada com um predicado sobre os valores da última linha
+    da página anterior, em vez de OFFSET, e sem COUNT(*). O custo de uma
+    página não depende da profundidade e os cursores são estáveis mesmo com
+    inserções. A ordenação deve terminar em um campo único (ex.: id).
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Cursor inválido'
+
+    def __init__(self, ordering, page_size):
+        self.ordering = list(ordering)
+        self.page_size = page_size
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        encoded = request.query_params.get(self.cursor_query_param)
+        values, self.reverse = self.decode_cursor(encoded, queryset.model) if encoded else (None, False)
+
+        ordering = self._reversed(self.ordering) if self.reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._after(ordering, values))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = values is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data
+        })
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = self.encode_cursor(self._position(self.page[-1]), reverse=False)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        cursor = self.encode_cursor(self._position(self.page[0]), reverse=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({'v': values, 'r': reverse}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, encoded, model):
+        """
+        Valores e direção de um cursor. Cada valor é convertido pelo campo
+        do modelo correspondente; cursores adulterados resultam em 404.
+        """
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values = payload['v']
+            reverse = bool(payload.get('r', False))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        converted = []
+        for field, value in zip(self.ordering, values):
+            model_field = model._meta.get_field(field.lstrip('-'))
+            try:
+                value = model_field.to_python(value)
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+            if value is None:
+                raise NotFound(self.invalid_cursor_message)
+            converted.append(value)
+        return converted, reverse
+
+    def _position(self, instance):
+        """
+        Valores da ordenação para uma linha (instância ou dict de
+        .values()), serializáveis em JSON
+        """
+        position = []
+        for field in self.ordering:
+            name = field.lstrip('-')
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            if isinstance(value, (date, datetime)):
+                value = value.isoformat()
+            position.append(value)
+        return position
+
+    @staticmethod
+    def _reversed(ordering):
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+    @staticmethod
+    def _after(ordering, values):
+        """
+        Predicado "linhas depois da posição" para ordenações compostas:
+        (a > x) OR (a = x AND b > y) OR ..., respeitando a direção de cada campo.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+
+class StandardPagination(PageNumberPagination):
+    """
+    Paginação padrão da API.
+
+    Usa PageNumberPagination (?page=N, com count) por padrão. Quando a
+    requisição inclui ?cursor= (vazio para a primeira página) e a view
+    define `keyset_ordering`, usa KeysetPagination, sem COUNT nem OFFSET.
+    A ordenação do keyset é fixa: ?cursor junto com ?ordering resulta em 400.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        ordering = getattr(view, 'keyset_ordering', None)
+
+        if ordering and KeysetPagination.cursor_query_param in request.query_params:
+            page_size = self.get_page_size(request)
+            if not page_size:
+                return None
+            if request.query_params.get(api_settings.ORDERING_PARAM):
+                raise APIValidationError({
+                    api_settings.ORDERING_PARAM: 'A ordenação não pode ser alterada na paginação por cursor.'
+                })
+            self.display_page_controls = False
+            self.keyset = KeysetPagination(ordering, page_size)
+            return self.keyset.paginate_queryset(queryset, request)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
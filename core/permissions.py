@@ -32,18 +32,15 @@ class IsPessoaOrReadOnly(permissions.BasePermission):
     def _check_ownership(self, user, obj):
         """
         Determina a relação pessoa-pet com base no tipo de objeto.
+        Compara apenas ids, sem carregar objetos relacionados.
         """
-        # Pet model
-        if hasattr(obj, 'pessoa') and hasattr(obj.pessoa, 'user'):
-            return obj.pessoa.user == user
+        # Pet e VaccinationRecord (owner desnormalizado)
+        if hasattr(obj, 'owner_id'):
+            return obj.owner_id == user.pk
         
         # Pessoa model
-        if hasattr(obj, 'user'):
-            return obj.user == user
-        
-        # VaccinationRecord model
-        if hasattr(obj, 'pet') and hasattr(obj.pet, 'pessoa'):
-            return obj.pet.pessoa.user == user
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == user.pk
         
         # Padrão: rejeitar accesso
         return False
@@ -74,14 +71,11 @@ class IsPessoa(permissions.BasePermission):
         """
         Determina a relação entre pessoa e pet.
         """
-        if hasattr(obj, 'pessoa') and hasattr(obj.pessoa, 'user'):
-            return obj.pessoa.user == user
-        
-        if hasattr(obj, 'user'):
-            return obj.user == user
+        if hasattr(obj, 'owner_id'):
+            return obj.owner_id == user.pk
         
-        if hasattr(obj, 'pet') and hasattr(obj.pet, 'pessoa'):
-            return obj.pet.pessoa.user == user
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == user.pk
         
         return False
 
@@ -103,14 +97,11 @@ class IsPessoaOrAdmin(permissions.BasePermission):
             return True
         
         # A pessoa pode acessar seus próprios recursos
-        if hasattr(obj, 'pessoa') and hasattr(obj.pessoa, 'user'):
-            return obj.pessoa.user == request.user
-        
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
+        if hasattr(obj, 'owner_id'):
+            return obj.owner_id == request.user.pk
         
-        if hasattr(obj, 'pet') and hasattr(obj.pet, 'pessoa'):
-            return obj.pet.pessoa.user == request.user
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == request.user.pk
         
         return False
 
@@ -0,0 +1,81 @@
+from rest_framework import renderers
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+
+# Tipos que o orjson não serializa (ou serializa em outro formato) são
+# convertidos pelo mesmo encoder do DRF, no mesmo formato do JSONRenderer:
+# datas em ISO 8601 com "Z" e milissegundos, Decimal como número, lazy
+# strings, QuerySets etc.
+_drf_default = encoders.JSONEncoder().default
+
+if orjson is not None:
+    ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+# U+2028 / U+2029 são válidos em JSON mas não em JavaScript; o DRF os escapa
+_LINE_SEPARATORS = (
+    ('\u2028'.encode(), b'\\u2028'),
+    ('\u2029'.encode(), b'\\u2029'),
+)
+
+
+def dumps(data):
+    """
+    Codifica `data` em JSON compacto e UTF-8 (bytes) com orjson quando
+    disponível, no formato do JSONRenderer do DRF; sem orjson usa o json da
+    biblioteca padrão. Diferenças em relação ao JSONRenderer, apenas com
+    floats: expoentes são escritos de outra forma (1e16 e 0.00001, em vez
+    de 1e+16 e 1e-05; o valor lido é o mesmo) e NaN / Infinity viram null,
+    em vez de levantar ValueError (STRICT_JSON).
+    """
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data, default=_drf_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Ex.: inteiros acima de 64 bits, tratados pelo json padrão
+            pass
+        else:
+            for raw, escaped in _LINE_SEPARATORS:
+                if raw in content:
+                    content = content.replace(raw, escaped)
+            return content
+    return renderers.JSONRenderer().render(data)
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer com a codificação feita pelo orjson (core.renderers.dumps).
+
+    A saída é a mesma do JSONRenderer com as configurações padrão do DRF
+    (UNICODE_JSON, COMPACT_JSON, STRICT_JSON), exceto pelos floats
+    descritos em dumps(). Pedidos com indentação
+    (Accept: application/json; indent=4) e configurações diferentes
+    usam o renderer padrão.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (orjson is None
+                or self.get_indent(accepted_media_type, renderer_context or {})
+                or not self._default_settings()):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+    def _default_settings(self):
+        return (
+            self.ensure_ascii is False
+            and self.compact
+            and self.strict
+            and self.encoder_class is encoders.JSONEncoder
+            and api_settings.UNICODE_JSON
+            and api_settings.COMPACT_JSON
+        )
@@ -0,0 +1,65 @@
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+
+
+class TokenRevocationStore:
+    """
+    Marcadores de revogação de tokens compartilhados entre os processos, em
+    um arquivo SQLite próprio (settings.TOKEN_REVOCATION_STORE_PATH).
+
+    Cada revogação guarda o instante em que ocorreu; uma entrada do cache
+    de tokens (core.authentication) criada antes desse instante deixa de
+    valer em todos os workers. O marcador só precisa durar o TTL do cache,
+    quando todas as entradas anteriores já expiraram.
+    """
+    cleanup_probability = 0.01
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def get_connection(self):
+        path = str(settings.TOKEN_REVOCATION_STORE_PATH)
+        state = (os.getpid(), path)
+        if getattr(self._local, 'state', None) != state:
+            connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS revoked_token ('
+                'key TEXT PRIMARY KEY, '
+                'revoked_at REAL NOT NULL, '
+                'expires_at REAL NOT NULL)'
+            )
+            self._local.connection = connection
+            self._local.state = state
+        return self._local.connection
+
+    def revoke(self, keys, ttl, now=None):
+        now = time.time() if now is None else now
+        connection = self.get_connection()
+        connection.executemany(
+            'INSERT INTO revoked_token (key, revoked_at, expires_at) VALUES (?, ?, ?) '
+            'ON CONFLICT (key) DO UPDATE SET revoked_at = excluded.revoked_at, '
+            'expires_at = excluded.expires_at',
+            [(key, now, now + ttl) for key in keys]
+        )
+        if random.random() < self.cleanup_probability:
+            connection.execute('DELETE FROM revoked_token WHERE expires_at < ?', [now])
+
+    def revoked_since(self, key, cached_at):
+        """Indica se o token foi revogado depois de entrar no cache"""
+        row = self.get_connection().execute(
+            'SELECT 1 FROM revoked_token WHERE key = ? AND revoked_at >= ?', [key, cached_at]
+        ).fetchone()
+        return row is not None
+
+    def clear(self):
+        self.get_connection().execute('DELETE FROM revoked_token')
+
+
+token_revocations = TokenRevocationStore()
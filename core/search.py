@@ -0,0 +1,163 @@
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+
+
+class SearchIndex:
+    """
+    Índice de texto completo (tabela virtual FTS5 do SQLite) para um modelo.
+
+    Cada linha tem rowid igual à pk do modelo e uma coluna por lookup de
+    busca, incluindo nomes de modelos relacionados (ex.: pet__name), que
+    ficam desnormalizados na tabela. A sincronização é feita por core.signals
+    e o índice completo pode ser recriado com `manage.py rebuild_search_index`.
+
+    Em bancos sem FTS5 o índice fica indisponível e a busca volta ao
+    comportamento padrão do SearchFilter (icontains).
+    """
+
+    def __init__(self, model, table, columns):
+        self.model = model
+        self.table = table
+        # Coluna do índice -> lookup no modelo
+        self.columns = columns
+        self._available = None
+
+    def available(self):
+        """
+        Indica se a tabela FTS5 existe no banco atual. Apenas o resultado
+        positivo fica guardado, para que o índice passe a ser usado assim que
+        a migração que o cria rodar; reset() descarta o resultado.
+        """
+        if connection.vendor != 'sqlite':
+            return False
+        if not self._available:
+            self._available = self.table in connection.introspection.table_names()
+        return self._available
+    
+    def reset(self):
+        self._available = None
+
+    def create(self):
+        """Cria a tabela virtual FTS5"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5('
+                f"{', '.join(self.columns)}, "
+                "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+        self._available = True
+
+    def drop(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {self.table}')
+        self._available = None
+
+    def index_queryset(self, queryset):
+        """
+        (Re)indexa as linhas do queryset com um único INSERT ... SELECT,
+        sem trazer os dados para o Python.
+        """
+        if not self.available():
+            return
+        pk_sql, pk_params = self._pk_sql(queryset)
+        select_sql, params = queryset.order_by().values_list(
+            'pk', *self.columns.values()
+        ).query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid IN ({pk_sql})', pk_params)
+            cursor.execute(
+                f"INSERT INTO {self.table}(rowid, {', '.join(self.columns)}) {select_sql}",
+                params
+            )
+
+    def index(self, pks):
+        self.index_queryset(self.model.objects.filter(pk__in=list(pks)))
+
+    def remove(self, pks):
+        pks = list(pks)
+        if not pks or not self.available():
+            return
+        placeholders = ', '.join(['%s'] * len(pks))
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid IN ({placeholders})', pks)
+
+    def remove_queryset(self, queryset):
+        """Remove do índice as linhas do queryset, sem trazer as pks para o Python"""
+        if not self.available():
+            return
+        pk_sql, params = self._pk_sql(queryset)
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid IN ({pk_sql})', params)
+
+    def update_column(self, column, value, queryset):
+        """
+        Atualiza uma coluna desnormalizada (ex.: pet_name) para as linhas do
+        queryset, apenas onde o valor mudou.
+        """
+        if not self.available():
+            return
+        pk_sql, params = self._pk_sql(queryset)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {self.table} SET {column} = %s '
+                f'WHERE rowid IN ({pk_sql}) AND {column} != %s',
+                [value, *params, value]
+            )
+
+    def rebuild(self, batch_size=5000):
+        """Recria o índice inteiro em lotes de pk"""
+        self.drop()
+        self.create()
+        pks = self.model.objects.order_by('pk').values_list('pk', flat=True)
+        last_pk = 0
+        while True:
+            batch = list(pks.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            self.index_queryset(self.model.objects.filter(pk__gte=batch[0], pk__lte=batch[-1]))
+            last_pk = batch[-1]
+
+    def match(self, terms):
+        """
+        Subconsulta com as pks que contêm todos os termos, em qualquer
+        coluna, como prefixo de palavra (ex.: "lab" encontra "Labrador").
+        """
+        query = ' '.join('"%s"*' % term.replace('"', '""') for term in terms)
+        return RawSQL(f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s', [query])
+
+    def _pk_sql(self, queryset):
+        return queryset.order_by().values('pk').query.sql_with_params()
+
+
+pet_index = SearchIndex(Pet, 'core_pet_search', {
+    'name': 'name',
+    'breed': 'breed',
+    'pessoa_name': 'pessoa__name',
+})
+
+vaccination_record_index = SearchIndex(VaccinationRecord, 'core_vaccinationrecord_search', {
+    'pet_name': 'pet__name',
+    'vaccine_name': 'vaccine__name',
+    'veterinarian_name': 'veterinarian_name',
+    'clinic_name': 'clinic_name',
+})
+
+vaccine_index = SearchIndex(Vaccine, 'core_vaccine_search', {
+    'name': 'name',
+    'manufacturer': 'manufacturer',
+    'species_target': 'species_target',
+})
+
+SEARCH_INDEXES = {
+    index.model: index
+    for index in (pet_index, vaccination_record_index, vaccine_index)
+}
+
+# Colunas desnormalizadas: (modelo de origem, campo) -> índice, coluna e
+# o filtro que seleciona as linhas afetadas a partir da pk de origem
+RELATED_COLUMNS = [
+    (Pessoa, 'name', pet_index, 'pessoa_name', 'pessoa_id'),
+    (Pet, 'name', vaccination_record_index, 'pet_name', 'pet_id'),
+    (Vaccine, 'name', vaccination_record_index, 'vaccine_name', 'vaccine_id'),
+]
@@ -4,7 +4,8 @@ from .vaccine import VaccineSerializer, VaccineDetailSerializer
 from .vaccination_record import (
     VaccinationRecordSerializer,
     VaccinationRecordDetailSerializer,
-    VaccinationRecordMinimalSerializer
+    VaccinationRecordMinimalSerializer,
+    VaccinationRecordBulkItemSerializer
 )
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     'VaccinationRecordSerializer',
     'VaccinationRecordDetailSerializer',
     'VaccinationRecordMinimalSerializer',
+    'VaccinationRecordBulkItemSerializer',
 ]
\ No newline at end of file
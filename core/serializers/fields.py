@@ -0,0 +1,34 @@
+import logging
+from django.conf import settings
+from rest_framework import serializers
+
+
+logger = logging.getLogger(__name__)
+
+
+class AnnotatedCountField(serializers.ReadOnlyField):
+    """
+    Campo de contagem que usa a anotação do queryset quando ela existe
+    (ex.: Count('pets') anotado como pet_count) e só faz um COUNT por
+    objeto quando a anotação está ausente.
+    
+    Em DEBUG, cada fallback gera um aviso no log para que o N+1 seja
+    percebido e o queryset da view seja corrigido.
+    """
+    
+    def __init__(self, annotation, related_name, **kwargs):
+        self.annotation = annotation
+        self.related_name = related_name
+        kwargs['source'] = '*'
+        super().__init__(**kwargs)
+    
+    def to_representation(self, instance):
+        if hasattr(instance, self.annotation):
+            return getattr(instance, self.annotation)
+        
+        if settings.DEBUG:
+            logger.warning(
+                "%s.%s: anotação '%s' ausente no queryset; executando COUNT em '%s' por objeto.",
+                type(self.parent).__name__, self.field_name, self.annotation, self.related_name
+            )
+        return getattr(instance, self.related_name).count()
@@ -1,14 +1,17 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from core.models import Pessoa
+from core.fieldsets import SparseFieldsetMixin
+from core.serializers.fields import AnnotatedCountField
 
 
-class PessoaSerializer(serializers.ModelSerializer):
+class PessoaSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer  para operações de listagem e criação de Pessoa.
+    Aceita ?fields= / ?omit= (SparseFieldsetMixin).
     """
     username = serializers.CharField(source='user.username', read_only=True)
-    total_pets = serializers.ReadOnlyField()
+    total_pets = AnnotatedCountField(annotation='pet_count', related_name='pets')
     
     class Meta:
         model = Pessoa
@@ -23,6 +26,9 @@ class PessoaSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['created_at']
+        sparse_sources = {
+            'total_pets': [],
+        }
 
 
 class PessoaDetailSerializer(PessoaSerializer):
@@ -33,6 +39,10 @@ class PessoaDetailSerializer(PessoaSerializer):
     
     class Meta(PessoaSerializer.Meta):
         fields = PessoaSerializer.Meta.fields + ['pets', 'updated_at']
+        sparse_sources = {
+            **PessoaSerializer.Meta.sparse_sources,
+            'pets': [],
+        }
     
     def get_pets(self, obj):
         """Retornar dados simplificados dos pets"""
@@ -1,5 +1,8 @@
 from rest_framework import serializers
 from core.models import Pet
+from core.models.pet import age_in_months, age_in_years
+from core.fieldsets import SparseFieldsetMixin
+from core.serializers.fields import AnnotatedCountField
 from datetime import date
 
 
@@ -15,9 +18,10 @@ class PetMinimalSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'species', 'species_display', 'breed', 'age_years']
 
 
-class PetSerializer(serializers.ModelSerializer):
+class PetSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer para listagem e criação de Pet.
+    Aceita ?fields= / ?omit= (SparseFieldsetMixin).
     """
     pessoa_name = serializers.CharField(source='pessoa.name', read_only=True)
     species_display = serializers.CharField(source='get_species_display', read_only=True)
@@ -43,6 +47,15 @@ class PetSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['created_at']
+        sparse_sources = {
+            'age_years': ['birth_date'],
+            'age_months': ['birth_date'],
+        }
+        # Propriedades calculadas a partir das colunas no ValuesReader
+        values_computed = {
+            'age_years': ('birth_date', age_in_years),
+            'age_months': ('birth_date', age_in_months),
+        }
     
     def validate_birth_date(self, value):
         if value > date.today():
@@ -61,7 +74,10 @@ class PetDetailSerializer(PetSerializer):
     """
     pessoa = serializers.SerializerMethodField()
     vaccination_history = serializers.SerializerMethodField()
-    vaccination_count = serializers.SerializerMethodField()
+    vaccination_count = AnnotatedCountField(
+        annotation='vaccination_count',
+        related_name='vaccination_records'
+    )
     
     class Meta(PetSerializer.Meta):
         fields = PetSerializer.Meta.fields + [
@@ -69,6 +85,12 @@ class PetDetailSerializer(PetSerializer):
             'vaccination_count',
             'updated_at'
         ]
+        sparse_sources = {
+            **PetSerializer.Meta.sparse_sources,
+            'pessoa': ['pessoa__name', 'pessoa__email', 'pessoa__phone'],
+            'vaccination_history': [],
+            'vaccination_count': [],
+        }
     
     def get_pessoa(self, obj):
         """Retornar detalhes da pessoa"""
@@ -82,9 +104,7 @@ class PetDetailSerializer(PetSerializer):
     def get_vaccination_history(self, obj):
         """Retornar registros de vacinação deste pet"""
         from core.serializers.vaccination_record import VaccinationRecordSerializer
-        records = obj.vaccination_records.select_related('vaccine').order_by('-administered_date')[:10]
+        records = obj.vaccination_records.select_related(
+            'vaccine'
+        ).with_due_status().order_by('-administered_date')[:10]
         return VaccinationRecordSerializer(records, many=True).data
-    
-    def get_vaccination_count(self, obj):
-        """Retornar contagem total de vacinações"""
-        return obj.vaccination_records.count()
\ No newline at end of file
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core.fieldsets import SparseFieldsetMixin
 from core.models import VaccinationRecord
 from datetime import date
 
@@ -21,9 +22,10 @@ class VaccinationRecordMinimalSerializer(serializers.ModelSerializer):
         ]
 
 
-class VaccinationRecordSerializer(serializers.ModelSerializer):
+class VaccinationRecordSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer padrão para operações de VaccinationRecord.
+    Aceita ?fields= / ?omit= (SparseFieldsetMixin).
     """
     pet_name = serializers.CharField(source='pet.name', read_only=True)
     vaccine_name = serializers.CharField(source='vaccine.name', read_only=True)
@@ -51,6 +53,12 @@ class VaccinationRecordSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['created_at', 'next_dose_date']
+        # Anotados por with_due_status(); next_dose_date é o fallback em Python
+        sparse_sources = {
+            'is_due': ['next_dose_date'],
+            'is_overdue': ['next_dose_date'],
+            'days_until_due': ['next_dose_date'],
+        }
     
     def validate_administered_date(self, value):
         """Garantir que a data de vacinação não seja futura"""
@@ -84,6 +92,16 @@ class VaccinationRecordDetailSerializer(VaccinationRecordSerializer):
     
     class Meta(VaccinationRecordSerializer.Meta):
         fields = VaccinationRecordSerializer.Meta.fields + ['updated_at']
+        sparse_sources = {
+            **VaccinationRecordSerializer.Meta.sparse_sources,
+            'pet': ['pet__name', 'pet__species', 'pet__breed', 'pet__pessoa__name'],
+            'vaccine': [
+                'vaccine__name',
+                'vaccine__manufacturer',
+                'vaccine__duration_months',
+                'vaccine__is_mandatory',
+            ],
+        }
     
     def get_pet(self, obj):
         """Retornar detalhes do pet"""
@@ -103,4 +121,25 @@ class VaccinationRecordDetailSerializer(VaccinationRecordSerializer):
             'manufacturer': obj.vaccine.manufacturer,
             'duration_months': obj.vaccine.duration_months,
             'is_mandatory': obj.vaccine.is_mandatory
-        }
\ No newline at end of file
+        }
+
+
+class VaccinationRecordBulkItemSerializer(serializers.Serializer):
+    """
+    Validação de formato de um item do endpoint de criação em lote.
+    Não acessa o banco: pets, vacinas e duplicatas são verificados em
+    conjunto pela view, com poucas consultas para o lote inteiro.
+    """
+    pet = serializers.IntegerField(min_value=1)
+    vaccine = serializers.IntegerField(min_value=1)
+    administered_date = serializers.DateField()
+    veterinarian_name = serializers.CharField(max_length=200)
+    clinic_name = serializers.CharField(max_length=200, allow_blank=True, default='')
+    batch_number = serializers.CharField(max_length=100, allow_blank=True, default='')
+    notes = serializers.CharField(allow_blank=True, default='')
+    
+    def validate_administered_date(self, value):
+        """Garantir que a data de vacinação não seja futura"""
+        if value > date.today():
+            raise serializers.ValidationError("A data da vacinação não pode estar no futuro.")
+        return value
\ No newline at end of file
@@ -1,13 +1,13 @@
 from rest_framework import serializers
+from core.fieldsets import SparseFieldsetMixin
 from core.models import Vaccine
 
 
-class VaccineSerializer(serializers.ModelSerializer):
+class VaccineSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer padrão para operações com Vaccine.
+    Aceita ?fields= / ?omit= (SparseFieldsetMixin).
     """
-    total_administrations = serializers.SerializerMethodField()
-    
     class Meta:
         model = Vaccine
         fields = [
@@ -21,11 +21,7 @@ class VaccineSerializer(serializers.ModelSerializer):
             'total_administrations',
             'created_at'
         ]
-        read_only_fields = ['created_at']
-    
-    def get_total_administrations(self, obj):
-        """Contar quantas vezes esta vacina foi administrada"""
-        return obj.vaccination_records.count()
+        read_only_fields = ['total_administrations', 'created_at']
     
     def validate_duration_months(self, value):
         """Garantir que a duração seja positiva"""
@@ -42,6 +38,9 @@ class VaccineDetailSerializer(VaccineSerializer):
     
     class Meta(VaccineSerializer.Meta):
         fields = VaccineSerializer.Meta.fields + ['recent_administrations', 'updated_at']
+        sparse_sources = {
+            'recent_administrations': [],
+        }
     
     def get_recent_administrations(self, obj):
         """Retornar registros recentes de vacinação usando esta vacina"""
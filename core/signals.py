@@ -0,0 +1,207 @@
+from collections import Counter
+from django.contrib.auth.models import User
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_delete
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from core.authentication import invalidate_token, invalidate_user_tokens
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord, VaccinationStatus
+from core.search import RELATED_COLUMNS, SEARCH_INDEXES
+
+
+# Enviado após VaccinationRecord.objects.bulk_create(), que não dispara
+# post_save. Argumentos: sender=VaccinationRecord, records=[instâncias criadas].
+vaccination_records_bulk_created = Signal()
+
+def _cascaded_from_pet(sender, instance, origin):
+    """
+    Indica se o registro está sendo removido junto com o seu pet, na mesma
+    remoção (`origin` dos sinais de delete): esses registros são tratados
+    em bloco por pet_deleting / pet_deleted, e não um a um. Os pets ficam
+    marcados na própria origem, então uma remoção que falhe no meio não
+    afeta as seguintes.
+    """
+    return (
+        sender is VaccinationRecord
+        and instance.pet_id in getattr(origin, '_deleting_pet_ids', ())
+    )
+
+
+def _adjust_total_administrations(vaccine_id, delta):
+    """
+    Atualiza o contador de forma atômica no banco, sem ler o valor atual.
+    Nunca fica negativo; divergências são corrigidas por reconcile_vaccine_counters.
+    """
+    if vaccine_id is None:
+        return
+    Vaccine.objects.filter(pk=vaccine_id).update(
+        total_administrations=Greatest(F('total_administrations') + delta, Value(0))
+    )
+
+
+@receiver(post_save, sender=VaccinationRecord)
+def vaccination_record_saved(sender, instance, created, raw=False, **kwargs):
+    """Incrementa o contador da vacina ao criar (ou trocar a vacina de) um registro"""
+    if raw:
+        return
+    
+    loaded_vaccine_id = getattr(instance, '_loaded_vaccine_id', None)
+    if created:
+        _adjust_total_administrations(instance.vaccine_id, 1)
+    elif loaded_vaccine_id is not None and loaded_vaccine_id != instance.vaccine_id:
+        _adjust_total_administrations(loaded_vaccine_id, -1)
+        _adjust_total_administrations(instance.vaccine_id, 1)
+
+
+@receiver(post_delete, sender=VaccinationRecord)
+def vaccination_record_deleted(sender, instance, **kwargs):
+    """Decrementa o contador da vacina ao remover um registro"""
+    if _cascaded_from_pet(sender, instance, kwargs.get('origin')):
+        return
+    _adjust_total_administrations(instance.vaccine_id, -1)
+
+
+@receiver(vaccination_records_bulk_created, sender=VaccinationRecord)
+def vaccination_records_bulk_created_counters(sender, records, **kwargs):
+    """Incrementa os contadores com um UPDATE por vacina do lote"""
+    per_vaccine = Counter(record.vaccine_id for record in records)
+    for vaccine_id, count in per_vaccine.items():
+        _adjust_total_administrations(vaccine_id, count)
+
+
+@receiver(post_save, sender=VaccinationRecord)
+def vaccination_record_saved_status(sender, instance, raw=False, **kwargs):
+    """Recalcula o status atual do par (pet, vacina), e do par anterior se mudou"""
+    if raw:
+        return
+    VaccinationStatus.objects.refresh([
+        (instance.pet_id, instance.vaccine_id),
+        (getattr(instance, '_loaded_pet_id', None), getattr(instance, '_loaded_vaccine_id', None)),
+    ])
+
+
+@receiver(post_delete, sender=VaccinationRecord)
+def vaccination_record_deleted_status(sender, instance, **kwargs):
+    """Promove o registro anterior do par (se houver) a status atual"""
+    if _cascaded_from_pet(sender, instance, kwargs.get('origin')):
+        # Os status do pet são removidos em cascata
+        return
+    VaccinationStatus.objects.refresh([(instance.pet_id, instance.vaccine_id)])
+
+
+@receiver(vaccination_records_bulk_created, sender=VaccinationRecord)
+def vaccination_records_bulk_created_status(sender, records, **kwargs):
+    """Recalcula o status atual dos pares afetados pelo lote"""
+    pairs = {(record.pet_id, record.vaccine_id) for record in records}
+    VaccinationStatus.objects.refresh(pairs)
+
+
+def _index_search(sender, instance, created=False, raw=False, **kwargs):
+    """Atualiza o índice de busca do objeto e as colunas desnormalizadas"""
+    if raw:
+        return
+    
+    index = SEARCH_INDEXES.get(sender)
+    if index is not None:
+        index.index([instance.pk])
+    
+    if created:
+        return
+    for model, field, related_index, column, fk in RELATED_COLUMNS:
+        if model is sender:
+            related_index.update_column(
+                column,
+                getattr(instance, field),
+                related_index.model.objects.filter(**{fk: instance.pk})
+            )
+
+
+def _unindex_search(sender, instance, **kwargs):
+    """Remove o objeto do índice de busca"""
+    if _cascaded_from_pet(sender, instance, kwargs.get('origin')):
+        return
+    SEARCH_INDEXES[sender].remove([instance.pk])
+
+
+for model in (Pessoa, Pet, Vaccine, VaccinationRecord):
+    post_save.connect(_index_search, sender=model, dispatch_uid=f'search_index_{model.__name__}')
+
+for model in SEARCH_INDEXES:
+    post_delete.connect(_unindex_search, sender=model, dispatch_uid=f'search_unindex_{model.__name__}')
+
+
+@receiver(post_migrate)
+def search_indexes_migrated(sender, **kwargs):
+    """Verifica de novo se as tabelas FTS5 existem após as migrações"""
+    for index in SEARCH_INDEXES.values():
+        index.reset()
+
+
+@receiver(vaccination_records_bulk_created, sender=VaccinationRecord)
+def vaccination_records_bulk_created_search(sender, records, **kwargs):
+    """Indexa os registros criados em lote com um único INSERT ... SELECT"""
+    SEARCH_INDEXES[VaccinationRecord].index(record.pk for record in records)
+
+
+@receiver(post_delete, sender=Pet)
+@receiver(post_delete, sender=VaccinationRecord)
+def child_deleted(sender, instance, **kwargs):
+    """
+    Atualiza o updated_at do pai (pessoa do pet, pet do registro) para que
+    o Last-Modified dos endpoints de detalhe reflita a remoção.
+    """
+    if sender is Pet:
+        Pessoa.objects.filter(pk=instance.pessoa_id).update(updated_at=timezone.now())
+    elif not _cascaded_from_pet(sender, instance, kwargs.get('origin')):
+        Pet.objects.filter(pk=instance.pet_id).update(updated_at=timezone.now())
+
+
+@receiver(pre_delete, sender=Pet)
+def pet_deleting(sender, instance, **kwargs):
+    """
+    Antes de remover um pet, trata em bloco os registros que serão apagados
+    em cascata: remove-os do índice de busca e guarda quantos há por vacina,
+    para ajustar os contadores com um UPDATE por vacina em pet_deleted.
+    Os handlers por registro ignoram esses registros.
+    """
+    origin = kwargs.get('origin')
+    if origin is None:
+        # Remoção sem origem: os registros são tratados um a um
+        return
+    
+    records = VaccinationRecord.objects.filter(pet_id=instance.pk)
+    instance._deleted_records_per_vaccine = dict(
+        records.order_by().values_list('vaccine_id').annotate(count=Count('id'))
+    )
+    SEARCH_INDEXES[VaccinationRecord].remove_queryset(records)
+    if not hasattr(origin, '_deleting_pet_ids'):
+        origin._deleting_pet_ids = set()
+    origin._deleting_pet_ids.add(instance.pk)
+
+
+@receiver(post_delete, sender=Pet)
+def pet_deleted(sender, instance, **kwargs):
+    """Ajusta os contadores das vacinas dos registros removidos com o pet"""
+    for vaccine_id, count in instance.__dict__.pop('_deleted_records_per_vaccine', {}).items():
+        _adjust_total_administrations(vaccine_id, -count)
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    """Remove o token do cache de autenticação"""
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Pessoa)
+@receiver(post_delete, sender=Pessoa)
+def token_owner_changed(sender, instance, raw=False, **kwargs):
+    """
+    Invalida os tokens em cache do usuário, que guardam o usuário e a
+    pessoa (is_active, is_staff, dados do perfil)
+    """
+    if raw:
+        return
+    invalidate_user_tokens(instance.pk if sender is User else instance.user_id)
@@ -0,0 +1,27 @@
+import tempfile
+from pathlib import Path
+
+from django.test import override_settings
+
+
+def _use_temporary_file(test, setting, filename):
+    directory = tempfile.TemporaryDirectory()
+    test.addCleanup(directory.cleanup)
+    path = Path(directory.name) / filename
+    override = override_settings(**{setting: path})
+    override.enable()
+    test.addCleanup(override.disable)
+    return path
+
+
+def use_temporary_throttle_store(test):
+    """
+    Aponta THROTTLE_STORE_PATH para um arquivo temporário durante o teste,
+    para não alterar os contadores reais. Retorna o caminho do arquivo.
+    """
+    return _use_temporary_file(test, 'THROTTLE_STORE_PATH', 'throttle.sqlite3')
+
+
+def use_temporary_token_revocation_store(test):
+    """Como use_temporary_throttle_store(), para TOKEN_REVOCATION_STORE_PATH"""
+    return _use_temporary_file(test, 'TOKEN_REVOCATION_STORE_PATH', 'token_revocations.sqlite3')
@@ -0,0 +1,33 @@
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+# Settings com arquivos SQLite compartilhados entre workers
+STORE_SETTINGS = {
+    'THROTTLE_STORE_PATH': 'throttle.sqlite3',
+    'TOKEN_REVOCATION_STORE_PATH': 'token_revocations.sqlite3',
+}
+
+
+class TestRunner(DiscoverRunner):
+    """
+    DiscoverRunner que usa arquivos temporários para THROTTLE_STORE_PATH e
+    TOKEN_REVOCATION_STORE_PATH durante toda a execução, para que as
+    requisições dos testes não escrevam nos arquivos do servidor.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._store_directory = tempfile.TemporaryDirectory()
+        self._store_paths = {name: getattr(settings, name) for name in STORE_SETTINGS}
+        for name, filename in STORE_SETTINGS.items():
+            setattr(settings, name, Path(self._store_directory.name) / filename)
+
+    def teardown_test_environment(self, **kwargs):
+        for name, path in self._store_paths.items():
+            setattr(settings, name, path)
+        self._store_directory.cleanup()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,132 @@
+import threading
+from datetime import date, timedelta
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import resolve
+from rest_framework.authtoken.models import Token
+
+from core import concurrency
+from core.concurrency import run_queries
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+
+
+class AsyncViewTests(TestCase):
+    """Testes das actions assíncronas servidas pelo handler ASGI"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.pet = Pet.objects.create(
+            pessoa=self.pessoa, name='Rex', species='dog', birth_date=date(2020, 1, 1)
+        )
+        self.vaccine = Vaccine.objects.create(name='Rabies', duration_months=12)
+        VaccinationRecord.objects.create(
+            pet=self.pet, vaccine=self.vaccine,
+            administered_date=date.today() - timedelta(days=350), veterinarian_name='Dr. A'
+        )
+        self.headers = {'authorization': f'Token {Token.objects.create(user=self.user).key}'}
+
+    def test_routes_are_async(self):
+        for url in [
+            '/api/vaccinations/due_soon/',
+            '/api/vaccinations/overdue/',
+            '/api/vaccinations/recent/',
+            f'/api/pets/{self.pet.pk}/upcoming_vaccinations/',
+            f'/api/pessoas/{self.pessoa.pk}/vaccination_summary/',
+            '/api/vaccines/',
+            f'/api/vaccines/{self.vaccine.pk}/statistics/',
+        ]:
+            with self.subTest(url=url):
+                self.assertTrue(iscoroutinefunction(resolve(url).func))
+        self.assertFalse(iscoroutinefunction(resolve(f'/api/vaccines/{self.vaccine.pk}/').func))
+
+    async def test_async_endpoints(self):
+        response = await self.async_client.get('/api/vaccinations/due_soon/', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([record['vaccine_name'] for record in response.json()], ['Rabies'])
+
+        response = await self.async_client.get(
+            f'/api/pets/{self.pet.pk}/upcoming_vaccinations/', headers=self.headers
+        )
+        self.assertEqual(len(response.json()['due_soon']), 1)
+
+        response = await self.async_client.get(
+            f'/api/pessoas/{self.pessoa.pk}/vaccination_summary/', headers=self.headers
+        )
+        self.assertEqual(response.json()['due_soon'], 1)
+
+        response = await self.async_client.get(
+            f'/api/vaccines/{self.vaccine.pk}/statistics/', headers=self.headers
+        )
+        self.assertEqual(response.json()['by_species'], [{'pet__species': 'dog', 'count': 1}])
+
+        response = await self.async_client.get('/api/vaccines/', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        response = await self.async_client.get(
+            '/api/vaccines/', headers={**self.headers, 'if-none-match': response['ETag']}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_auth_and_permissions(self):
+        response = await self.async_client.get('/api/vaccinations/due_soon/')
+        self.assertEqual(response.status_code, 401)
+
+        other = await User.objects.acreate(username='outro')
+        other_pessoa = await Pessoa.objects.acreate(user=other, name='Outro', email='outro@example.com')
+        response = await self.async_client.get(
+            f'/api/pessoas/{other_pessoa.pk}/vaccination_summary/', headers=self.headers
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_export_streams_asynchronously(self):
+        for days in (100, 200, 300):
+            await VaccinationRecord.objects.acreate(
+                pet=self.pet, vaccine=self.vaccine,
+                administered_date=date.today() - timedelta(days=days), veterinarian_name='Dr. A'
+            )
+
+        with mock.patch('core.views.vaccination_record.EXPORT_CHUNK_SIZE', 2):
+            response = await self.async_client.get(
+                '/api/vaccinations/export/?export_format=ndjson', headers=self.headers
+            )
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+
+        # Uma linha por registro, lidas em blocos de 2
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(all(chunk.endswith(b'\n') for chunk in chunks))
+
+    def test_export_streams_synchronously_under_wsgi(self):
+        response = self.client.get('/api/vaccinations/export/', HTTP_AUTHORIZATION=self.headers['authorization'])
+        self.assertFalse(response.is_async)
+        self.assertEqual(len(list(response.streaming_content)), 2)
+
+    def test_sync_actions_on_async_route(self):
+        admin = User.objects.create_user(username='admin', password='senha-forte-123', is_staff=True)
+        self.client.force_login(admin)
+        response = self.client.post('/api/vaccines/', {'name': 'FeLV', 'duration_months': 12})
+
+        self.assertEqual(response.status_code, 201)
+
+
+class RunQueriesTests(TestCase):
+
+    async def test_sequential_inside_transaction(self):
+        self.assertFalse(concurrency.concurrent_queries_enabled())
+        results = await run_queries(lambda: 1, lambda: 2)
+        self.assertEqual(results, [1, 2])
+
+    async def test_concurrent_in_worker_threads(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait():
+            # Só passa se as duas funções rodarem ao mesmo tempo
+            barrier.wait()
+            return threading.get_ident()
+
+        with mock.patch.object(concurrency, 'concurrent_queries_enabled', return_value=True):
+            first, second = await run_queries(wait, wait)
+        self.assertNotEqual(first, second)
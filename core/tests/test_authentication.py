@@ -0,0 +1,78 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from core.authentication import local_token_cache
+from core.models import Pessoa
+from core.revocation import token_revocations
+from core.tests import use_temporary_throttle_store, use_temporary_token_revocation_store
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    """Testes do CachedTokenAuthentication"""
+
+    def setUp(self):
+        use_temporary_throttle_store(self)
+        use_temporary_token_revocation_store(self)
+        local_token_cache.clear()
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def get_pets(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/pets/')
+        tables = [query['sql'] for query in context.captured_queries]
+        return response, [sql for sql in tables if 'authtoken_token' in sql]
+
+    def test_token_is_cached_with_pessoa(self):
+        response, token_queries = self.get_pets()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(token_queries), 1)
+        self.assertIn('core_pessoa', token_queries[0])
+
+        response, token_queries = self.get_pets()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(token_queries, [])
+
+    def test_logout_invalidates_token(self):
+        self.get_pets()
+        self.assertEqual(self.client.post('/api/auth/logout/').status_code, 200)
+        self.assertEqual(self.client.get('/api/pets/').status_code, 401)
+
+    def test_logout_revokes_token_in_other_workers(self):
+        self.get_pets()
+        # Entrada que continua no LRU local de outro worker após o logout
+        entry = local_token_cache.get(self.token.key)
+        self.assertEqual(self.client.post('/api/auth/logout/').status_code, 200)
+        local_token_cache.set(self.token.key, entry, 60, 10)
+
+        self.assertEqual(self.client.get('/api/pets/').status_code, 401)
+
+    def test_entries_cached_after_revocation_stay_valid(self):
+        token_revocations.revoke([self.token.key], 60)
+        self.get_pets()
+        response, token_queries = self.get_pets()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(token_queries, [])
+
+    def test_change_password_invalidates_token(self):
+        self.get_pets()
+        response = self.client.post('/api/auth/change-password/', {
+            'old_password': 'senha-forte-123',
+            'new_password': 'outra-senha-forte-456',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get('/api/pets/').status_code, 401)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {response.data['token']}")
+        self.assertEqual(self.client.get('/api/pets/').status_code, 200)
+
+    def test_deactivated_user_is_rejected(self):
+        self.get_pets()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/pets/').status_code, 401)
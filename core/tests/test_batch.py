@@ -0,0 +1,125 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from core import concurrency
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+from core.tests import use_temporary_throttle_store
+from core.throttling import UserRateThrottle
+from core.views.batch import BATCH_MAX_REQUESTS
+
+
+class BatchTests(APITestCase):
+    """Testes do endpoint de requisições em lote"""
+
+    def setUp(self):
+        use_temporary_throttle_store(self)
+
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.pet = Pet.objects.create(
+            pessoa=self.pessoa, name='Rex', species='dog', birth_date=date(2020, 1, 1)
+        )
+        vaccine = Vaccine.objects.create(name='Rabies', duration_months=12)
+        VaccinationRecord.objects.create(
+            pet=self.pet, vaccine=vaccine,
+            administered_date=date.today() - timedelta(days=350), veterinarian_name='Dr. A'
+        )
+
+        other = User.objects.create_user(username='outro', password='senha-forte-123')
+        other_pessoa = Pessoa.objects.create(user=other, name='Outro', email='outro@example.com')
+        self.other_pet = Pet.objects.create(
+            pessoa=other_pessoa, name='Mia', species='cat', birth_date=date(2021, 1, 1)
+        )
+
+        self.client.force_authenticate(self.user)
+
+    def test_runs_subrequests_in_order(self):
+        response = self.client.post('/api/batch/', {'requests': [
+            '/api/auth/profile/',
+            '/api/pets/?fields=id,name',
+            {'url': '/api/vaccinations/due_soon/', 'method': 'get'},
+            f'/api/pets/{self.pet.pk}/upcoming_vaccinations/',
+        ]}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        profile, pets, due_soon, upcoming = response.json()['responses']
+        self.assertEqual([item['status'] for item in response.json()['responses']], [200] * 4)
+        self.assertEqual(profile['body']['name'], 'Tutor')
+        self.assertIn('ETag', profile['headers'])
+        self.assertEqual(profile['headers']['Content-Type'], 'application/json')
+        self.assertEqual(pets['body']['results'], [{'id': self.pet.pk, 'name': 'Rex'}])
+        self.assertEqual([record['vaccine_name'] for record in due_soon['body']], ['Rabies'])
+        self.assertEqual(len(upcoming['body']['due_soon']), 1)
+
+    def test_errors_are_reported_per_item(self):
+        response = self.client.post('/api/batch/', [
+            f'/api/pets/{self.other_pet.pk}/',
+            '/api/nao-existe/',
+            '/api/batch/',
+            '/api/vaccinations/export/?export_format=ndjson',
+            f'/api/pets/{self.pet.pk}/',
+        ], format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item['status'] for item in response.json()['responses']], [404, 404, 400, 400, 200]
+        )
+
+    def test_invalid_payloads(self):
+        for payload in [
+            {},
+            {'requests': []},
+            {'requests': ['https://example.com/api/pets/']},
+            {'requests': ['/admin/']},
+            {'requests': [{'url': '/api/pets/', 'method': 'DELETE'}]},
+            {'requests': ['/api/pets/'] * (BATCH_MAX_REQUESTS + 1)},
+        ]:
+            with self.subTest(payload=payload):
+                response = self.client.post('/api/batch/', payload, format='json')
+                self.assertEqual(response.status_code, 400)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(None)
+        response = self.client.post('/api/batch/', ['/api/pets/'], format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_subrequests_are_throttled(self):
+        # O próprio lote conta como uma requisição
+        with mock.patch.dict(UserRateThrottle.THROTTLE_RATES, {'user': '3/minute'}):
+            response = self.client.post('/api/batch/', ['/api/pets/'] * 3, format='json')
+        self.assertEqual(
+            [item['status'] for item in response.json()['responses']], [200, 200, 429]
+        )
+
+
+class ParallelBatchTests(APITransactionTestCase):
+    """
+    Sub-requisições em um pool de threads. Os dados são confirmados no banco
+    (TransactionTestCase), pois as threads usam outras conexões.
+    """
+
+    def setUp(self):
+        use_temporary_throttle_store(self)
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.vaccine = Vaccine.objects.create(name='Rabies', duration_months=12, species_target='dog')
+        Vaccine.objects.create(name='FVRCP', duration_months=12, species_target='cat')
+        self.client.force_authenticate(self.user)
+
+    def test_parallel_matches_sequential(self):
+        requests = [
+            '/api/vaccines/',
+            '/api/vaccines/?species=dog',
+            f'/api/vaccines/{self.vaccine.pk}/',
+            f'/api/vaccines/{self.vaccine.pk}/statistics/',
+        ]
+        sequential = self.client.post('/api/batch/', requests, format='json').json()
+        self.assertEqual([item['status'] for item in sequential['responses']], [200] * 4)
+
+        with mock.patch.object(concurrency, 'concurrent_queries_enabled', return_value=True):
+            parallel = self.client.post(
+                '/api/batch/', {'requests': requests, 'parallel': True}, format='json'
+            ).json()
+        self.assertEqual(parallel, sequential)
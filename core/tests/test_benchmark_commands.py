@@ -0,0 +1,65 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from core.management.commands.seed_benchmark_data import Command as SeedCommand
+from core.models import Pessoa, Pet, VaccinationRecord, VaccinationStatus, Vaccine
+from core.search import SEARCH_INDEXES
+
+
+class BenchmarkCommandsTests(TestCase):
+    """Testes de seed_benchmark_data e run_benchmark"""
+
+    def seed(self, *args):
+        call_command('seed_benchmark_data', '--owners', '3', '--pets', '2', *args, stdout=StringIO())
+        return list(VaccinationRecord.objects.order_by('pet__name', 'vaccine__name', 'administered_date')
+                    .values_list('pet__name', 'vaccine__name', 'administered_date'))
+
+    def test_seed_is_deterministic(self):
+        first = self.seed()
+        self.assertEqual(Pet.objects.count(), 6)
+        self.assertTrue(first)
+        self.assertTrue(VaccinationStatus.objects.exists())
+        self.assertEqual(
+            sum(Vaccine.objects.values_list('total_administrations', flat=True)),
+            len(first)
+        )
+
+        self.assertEqual(self.seed('--clear'), first)
+        self.assertEqual(Pet.objects.count(), 6)
+
+    def test_clear_removes_derived_rows(self):
+        self.seed()
+        SeedCommand().clear()
+
+        self.assertFalse(Pessoa.objects.exists())
+        self.assertFalse(VaccinationRecord.objects.exists())
+        self.assertFalse(VaccinationStatus.objects.exists())
+        for model in (Pet, VaccinationRecord):
+            index = SEARCH_INDEXES[model]
+            if index.available():
+                with connection.cursor() as cursor:
+                    cursor.execute(f'SELECT COUNT(*) FROM {index.table}')
+                    self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_run_benchmark_writes_json(self):
+        self.seed()
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / 'bench.json'
+            call_command(
+                'run_benchmark', '--iterations', '3', '--warmup', '0',
+                '--endpoint', 'pets.', '--output', str(output), stdout=StringIO()
+            )
+            report = json.loads(output.read_text())
+
+        self.assertIn('pets.list', report['results'])
+        self.assertNotIn('vaccines.list', report['results'])
+        result = report['results']['pets.retrieve']
+        self.assertEqual(result['status'], [200])
+        self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+        self.assertGreater(result['queries'], 0)
@@ -0,0 +1,115 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+
+
+class ConditionalRequestTests(APITestCase):
+    """Testes de ETag / 304 nos endpoints de detalhe"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.pet = Pet.objects.create(
+            pessoa=self.pessoa, name='Rex', species='dog', birth_date=date(2020, 1, 1)
+        )
+        self.vaccine = Vaccine.objects.create(name='Rabies', duration_months=12)
+        self.record = VaccinationRecord.objects.create(
+            pet=self.pet, vaccine=self.vaccine,
+            administered_date=date(2024, 1, 10), veterinarian_name='Dr. A'
+        )
+        self.client.force_authenticate(self.user)
+        self.pet_url = f'/api/pets/{self.pet.pk}/'
+
+    def assertNotModified(self, url, etag):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_detail_endpoints_return_304(self):
+        for url in (self.pet_url, f'/api/pessoas/{self.pessoa.pk}/', '/api/auth/profile/'):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('Last-Modified', response)
+            self.assertNotModified(url, response['ETag'])
+
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            self.assertEqual(response.status_code, 304)
+
+    def test_child_changes_update_etag(self):
+        etag = self.client.get(self.pet_url)['ETag']
+
+        self.record.veterinarian_name = 'Dr. B'
+        self.record.save()
+        response = self.client.get(self.pet_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        self.record.delete()
+        response = self.client.get(self.pet_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['vaccination_count'], 0)
+
+    def test_other_users_objects_are_not_found(self):
+        other = User.objects.create_user(username='outro', password='senha-forte-123')
+        self.client.force_authenticate(other)
+        response = self.client.get(self.pet_url, HTTP_IF_NONE_MATCH='"x"')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.client.get('/api/pets/abc/').status_code, 404)
+
+
+class CatalogCacheTests(APITestCase):
+    """Testes do cache e do ETag do catálogo de vacinas"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.pet = Pet.objects.create(
+            pessoa=pessoa, name='Rex', species='dog', birth_date=date(2020, 1, 1)
+        )
+        self.vaccine = Vaccine.objects.create(name='Rabies', duration_months=12)
+        self.other = Vaccine.objects.create(name='DHPP', duration_months=12)
+        self.client.force_authenticate(self.user)
+        self.detail_url = f'/api/vaccines/{self.vaccine.pk}/'
+
+    def names(self):
+        return [vaccine['name'] for vaccine in self.client.get('/api/vaccines/').data['results']]
+
+    def test_vaccine_changes_invalidate_list_and_detail(self):
+        self.assertEqual(self.names(), ['DHPP', 'Rabies'])
+        self.assertEqual(self.client.get(self.detail_url).data['name'], 'Rabies')
+
+        self.vaccine.name = 'Raiva'
+        self.vaccine.save()
+        self.assertEqual(self.names(), ['DHPP', 'Raiva'])
+        self.assertEqual(self.client.get(self.detail_url).data['name'], 'Raiva')
+
+        self.other.delete()
+        self.assertEqual(self.names(), ['Raiva'])
+
+    def test_counter_changes_invalidate_etag(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data['total_administrations'], 0)
+        self.assertNotIn('Last-Modified', response)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        VaccinationRecord.objects.create(
+            pet=self.pet, vaccine=self.vaccine,
+            administered_date=date(2024, 1, 10), veterinarian_name='Dr. A'
+        )
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_administrations'], 1)
+        self.assertEqual(len(response.data['recent_administrations']), 1)
+
+        listed = self.client.get('/api/vaccines/').data['results']
+        self.assertEqual([vaccine['total_administrations'] for vaccine in listed], [0, 1])
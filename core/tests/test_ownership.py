@@ -0,0 +1,54 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+
+
+class OwnerTests(APITestCase):
+    """Testes do owner desnormalizado em Pet e VaccinationRecord"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.other_user = User.objects.create_user(username='outro', password='senha-forte-123')
+        self.other = Pessoa.objects.create(user=self.other_user, name='Outro', email='outro@example.com')
+        self.pet = Pet.objects.create(
+            pessoa=self.pessoa, name='Rex', species='dog', birth_date=date(2020, 1, 1)
+        )
+        self.record = VaccinationRecord.objects.create(
+            pet=self.pet,
+            vaccine=Vaccine.objects.create(name='Rabies', duration_months=12),
+            administered_date=date(2024, 1, 10),
+            veterinarian_name='Dr. A'
+        )
+
+    def test_owner_is_set_on_create(self):
+        self.assertEqual(self.pet.owner_id, self.user.pk)
+        self.assertEqual(self.record.owner_id, self.user.pk)
+
+    def test_pet_transfer_updates_records(self):
+        pet = Pet.objects.get(pk=self.pet.pk)
+        pet.pessoa = self.other
+        pet.save()
+
+        self.assertEqual(Pet.objects.get(pk=pet.pk).owner_id, self.other_user.pk)
+        self.assertEqual(VaccinationRecord.objects.get().owner_id, self.other_user.pk)
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(f'/api/pets/{pet.pk}/').status_code, 404)
+        self.assertEqual(self.client.get('/api/vaccinations/').data['count'], 0)
+
+        self.client.force_authenticate(self.other_user)
+        self.assertEqual(self.client.get(f'/api/pets/{pet.pk}/').status_code, 200)
+        self.assertEqual(self.client.get('/api/vaccinations/').data['count'], 1)
+
+    def test_pessoa_user_change_updates_owner(self):
+        new_user = User.objects.create_user(username='novo', password='senha-forte-123')
+        pessoa = Pessoa.objects.get(pk=self.pessoa.pk)
+        pessoa.user = new_user
+        pessoa.save()
+
+        self.assertEqual(Pet.objects.get().owner_id, new_user.pk)
+        self.assertEqual(VaccinationRecord.objects.get().owner_id, new_user.pk)
@@ -0,0 +1,50 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet
+from core.pagination import KeysetPagination
+
+
+class KeysetCursorTests(APITestCase):
+    """Cursores adulterados resultam em 404, e não em erro 500"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        for name in ('Rex', 'Mia'):
+            Pet.objects.create(pessoa=pessoa, name=name, species='dog', birth_date=date(2020, 1, 1))
+        self.client.force_authenticate(self.user)
+
+    def cursor(self, values, reverse=False):
+        return KeysetPagination(['-created_at', '-id'], 1).encode_cursor(values, reverse)
+
+    def test_malformed_cursors(self):
+        for values in [
+            ['abc', 'x'],
+            ['2024-01-01', 'x'],
+            [1, 2],
+            [None, None],
+            [['2024-01-01'], {'id': 1}],
+        ]:
+            with self.subTest(values=values):
+                response = self.client.get('/api/pets/', {'cursor': self.cursor(values)})
+                self.assertEqual(response.status_code, 404)
+
+        for cursor in ('not-base64!', self.cursor(['2024-01-01T00:00:00+00:00'])):
+            with self.subTest(cursor=cursor):
+                response = self.client.get('/api/pets/', {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def test_valid_cursor(self):
+        first = Pet.objects.order_by('-created_at', '-id').first()
+        cursor = self.cursor([first.created_at.isoformat(), first.pk])
+        response = self.client.get('/api/pets/', {'cursor': cursor})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([pet['name'] for pet in response.json()['results']], ['Rex'])
+
+    def test_ordering_with_cursor_is_rejected(self):
+        response = self.client.get('/api/pets/', {'cursor': '', 'ordering': 'name'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ordering', response.json())
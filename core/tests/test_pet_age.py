@@ -0,0 +1,87 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet
+from core.models.pet import age_in_months, age_in_years
+
+
+class PetAgeTests(APITestCase):
+    """Idades calculadas no banco e filtros/ordenação por idade"""
+
+    # Datas de referência com fim de mês, ano bissexto e virada de ano
+    TODAYS = [
+        date(2023, 2, 28), date(2024, 2, 29), date(2023, 3, 1),
+        date(2023, 3, 31), date(2024, 12, 31), date(2025, 1, 1),
+    ]
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        birth_dates = [date(2012, 2, 29), date(2016, 2, 29), date(2020, 2, 29), date(2022, 12, 31)]
+        birth_dates += [date(2019, 1, 1) + timedelta(days=offset) for offset in range(0, 2200, 17)]
+        Pet.objects.bulk_create([
+            Pet(pessoa=self.pessoa, owner=self.user, name=f'Pet {index}', species='dog', birth_date=birth_date)
+            for index, birth_date in enumerate(birth_dates)
+        ])
+        self.client.force_authenticate(self.user)
+
+    def test_annotations_match_python(self):
+        for today in self.TODAYS:
+            pets = Pet.objects.filter(birth_date__lte=today).with_age(today)
+            for birth_date, years, months in pets.values_list('birth_date', 'age_years', 'age_months'):
+                with self.subTest(today=today, birth_date=birth_date):
+                    self.assertEqual(years, age_in_years(birth_date, today))
+                    self.assertEqual(months, age_in_months(birth_date, today))
+
+    def test_age_between_matches_python(self):
+        pets = list(Pet.objects.values_list('pk', 'birth_date'))
+        cases = [('years', 1, 3), ('years', 0, 0), ('years', 8, None), ('months', None, 6), ('months', 12, 18)]
+        for today in self.TODAYS:
+            for unit, minimum, maximum in cases:
+                age = age_in_years if unit == 'years' else age_in_months
+                expected = {
+                    pk for pk, birth_date in pets
+                    if birth_date <= today
+                    and (minimum is None or age(birth_date, today) >= minimum)
+                    and (maximum is None or age(birth_date, today) <= maximum)
+                }
+                found = set(
+                    Pet.objects.filter(birth_date__lte=today)
+                    .age_between(minimum, maximum, unit, today)
+                    .values_list('pk', flat=True)
+                )
+                with self.subTest(today=today, unit=unit, minimum=minimum, maximum=maximum):
+                    self.assertEqual(found, expected)
+
+    def test_api_filters_and_ordering(self):
+        for days in (30, 100, 250):
+            Pet.objects.create(
+                pessoa=self.pessoa, name=f'Filhote {days}', species='cat',
+                birth_date=date.today() - timedelta(days=days)
+            )
+
+        response = self.client.get('/api/pets/', {'age_max': 6, 'age_unit': 'months', 'ordering': 'age'})
+        self.assertEqual(response.status_code, 200)
+        ages = [pet['age_months'] for pet in response.data['results']]
+        self.assertTrue(ages)
+        self.assertTrue(all(age <= 6 for age in ages))
+        self.assertEqual(ages, sorted(ages))
+
+        response = self.client.get('/api/pets/', {'age_min': 8, 'ordering': '-age'})
+        ages = [pet['age_years'] for pet in response.data['results']]
+        self.assertTrue(ages)
+        self.assertTrue(all(age >= 8 for age in ages))
+        self.assertEqual(ages, sorted(ages, reverse=True))
+
+    def test_invalid_parameters(self):
+        for params in (
+            {'age_min': 'abc'},
+            {'age_max': '-1'},
+            {'age_unit': 'days', 'age_min': 1},
+            {'age_min': 10000},
+            {'age_max': 24000, 'age_unit': 'months'},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get('/api/pets/', params).status_code, 400)
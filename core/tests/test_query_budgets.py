@@ -0,0 +1,313 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import post_delete
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord, VaccinationStatus
+from core.search import SEARCH_INDEXES
+from core.signals import vaccination_records_bulk_created
+from core.tests import use_temporary_throttle_store
+
+
+SMALL_PETS = 5
+LARGE_PETS = 500
+
+
+class QueryBudgetTests(APITestCase):
+    """
+    Orçamento de consultas de cada endpoint de core/urls.py.
+
+    Cada teste mede a mesma requisição com 5 e com 500 pets por pessoa: o
+    número de consultas deve ser igual nos dois tamanhos (sem N+1) e não
+    pode passar do orçamento. Se uma mudança aumentar o número de consultas
+    de forma legítima, atualize o orçamento no teste.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = date.today()
+        cls.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        cls.pessoa = Pessoa.objects.create(user=cls.user, name='Tutor', email='tutor@example.com')
+        cls.other_user = User.objects.create_user(username='outro', password='senha-forte-123')
+        cls.other = Pessoa.objects.create(user=cls.other_user, name='Outro', email='outro@example.com')
+        cls.vaccines = [
+            Vaccine.objects.create(name='Rabies', duration_months=12, is_mandatory=True),
+            Vaccine.objects.create(name='DHPP', duration_months=1),
+            Vaccine.objects.create(name='FeLV', duration_months=12, species_target='cat'),
+        ]
+        cls.pets = {cls.pessoa.pk: 0, cls.other.pk: 0}
+        for pessoa in (cls.pessoa, cls.other):
+            cls.add_pets(pessoa, SMALL_PETS)
+        cls.pet = Pet.objects.filter(pessoa=cls.pessoa).earliest('id')
+
+    @classmethod
+    def add_pets(cls, pessoa, count):
+        """Cria pets com um histórico a vencer, um atrasado e um em dia"""
+        start = cls.pets[pessoa.pk]
+        pets = Pet.objects.bulk_create([
+            Pet(
+                pessoa=pessoa,
+                owner_id=pessoa.user_id,
+                name=f'{pessoa.name} Pet {i}',
+                species='dog' if i % 2 else 'cat',
+                birth_date=date(2020, 1, 1)
+            )
+            for i in range(start, start + count)
+        ])
+        cls.pets[pessoa.pk] += count
+        SEARCH_INDEXES[Pet].index(pet.pk for pet in pets)
+
+        days_ago = (350, 100, 5)
+        records = VaccinationRecord.objects.bulk_create([
+            VaccinationRecord(
+                pet=pet,
+                owner_id=pet.owner_id,
+                vaccine=vaccine,
+                administered_date=cls.today - timedelta(days=days),
+                next_dose_date=cls.today - timedelta(days=days) + timedelta(
+                    days=30 * vaccine.duration_months
+                ),
+                veterinarian_name='Dr. A',
+                clinic_name='Clínica Central'
+            )
+            for pet in pets
+            for vaccine, days in zip(cls.vaccines, days_ago)
+        ])
+        vaccination_records_bulk_created.send(sender=VaccinationRecord, records=records)
+
+    def setUp(self):
+        use_temporary_throttle_store(self)
+        self.client.force_authenticate(self.user)
+
+    def count_queries(self, method, url, data=None):
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data, format='json')
+            if response.streaming:
+                b''.join(response.streaming_content)
+        self.assertLess(response.status_code, 400, getattr(response, 'data', None))
+        return len(context.captured_queries)
+
+    def assertQueryBudget(self, budget, method, url, data=None):
+        """
+        Mede a requisição com 5 e com 500 pets por pessoa. `data` pode ser
+        uma função do tamanho, para requisições que alteram dados.
+        """
+        counts = []
+        for size in (SMALL_PETS, LARGE_PETS):
+            if self.pets[self.pessoa.pk] < size:
+                for pessoa in (self.pessoa, self.other):
+                    self.add_pets(pessoa, size - self.pets[pessoa.pk])
+            payload = data(size) if callable(data) else data
+            counts.append(self.count_queries(method, url, payload))
+
+        small, large = counts
+        self.assertEqual(small, large, f'{method.upper()} {url}: {small} consultas com '
+                         f'{SMALL_PETS} pets e {large} com {LARGE_PETS}')
+        self.assertLessEqual(large, budget, f'{method.upper()} {url}: orçamento de '
+                             f'{budget} consultas excedido ({large})')
+
+    # Autenticação
+
+    def test_register(self):
+        self.client.force_authenticate(None)
+        self.assertQueryBudget(9, 'post', '/api/auth/register/', lambda size: {
+            'username': f'novo{size}',
+            'password': 'senha-forte-123',
+            'name': 'Novo',
+            'email': f'novo{size}@example.com',
+        })
+
+    def with_token(self, data=None):
+        """Garante que o usuário já tem token antes de cada medição"""
+        def build(size):
+            Token.objects.get_or_create(user=self.user)
+            return data(size) if callable(data) else data
+        return build
+
+    def test_login(self):
+        self.client.force_authenticate(None)
+        self.assertQueryBudget(3, 'post', '/api/auth/login/', self.with_token({
+            'username': 'tutor', 'password': 'senha-forte-123'
+        }))
+
+    def test_logout(self):
+        self.assertQueryBudget(1, 'post', '/api/auth/logout/', self.with_token())
+
+    def test_profile(self):
+        self.assertQueryBudget(2, 'get', '/api/auth/profile/')
+
+    def test_update_profile(self):
+        self.assertQueryBudget(4, 'patch', '/api/auth/profile/update/', {'phone': '+5511999999999'})
+
+    def test_change_password(self):
+        self.assertQueryBudget(5, 'post', '/api/auth/change-password/', self.with_token(lambda size: {
+            'old_password': 'senha-forte-123' if size == SMALL_PETS else 'outra-senha-456',
+            'new_password': 'outra-senha-456' if size == SMALL_PETS else 'senha-forte-123',
+        }))
+
+    # Pessoas
+
+    def test_pessoa_list(self):
+        self.assertQueryBudget(2, 'get', '/api/pessoas/')
+
+    def test_pessoa_retrieve(self):
+        self.assertQueryBudget(3, 'get', f'/api/pessoas/{self.pessoa.pk}/')
+
+    def test_pessoa_pets(self):
+        self.assertQueryBudget(2, 'get', f'/api/pessoas/{self.pessoa.pk}/pets/')
+
+    def test_pessoa_vaccination_summary(self):
+        self.assertQueryBudget(4, 'get', f'/api/pessoas/{self.pessoa.pk}/vaccination_summary/')
+
+    # Pets
+
+    def test_pet_list(self):
+        self.assertQueryBudget(2, 'get', '/api/pets/')
+
+    def test_pet_list_search(self):
+        self.assertQueryBudget(2, 'get', '/api/pets/', {'search': 'Tutor Pet'})
+
+    def test_pet_list_keyset(self):
+        self.assertQueryBudget(1, 'get', '/api/pets/', {'cursor': ''})
+
+    def test_pet_retrieve(self):
+        self.assertQueryBudget(3, 'get', f'/api/pets/{self.pet.pk}/')
+
+    def test_pet_vaccinations(self):
+        self.assertQueryBudget(2, 'get', f'/api/pets/{self.pet.pk}/vaccinations/')
+
+    def test_pet_upcoming_vaccinations(self):
+        self.assertQueryBudget(3, 'get', f'/api/pets/{self.pet.pk}/upcoming_vaccinations/')
+
+    # Vacinas (inclui a consulta da versão do catálogo)
+
+    def test_vaccine_list(self):
+        self.assertQueryBudget(3, 'get', '/api/vaccines/')
+
+    def test_vaccine_retrieve(self):
+        self.assertQueryBudget(3, 'get', f'/api/vaccines/{self.vaccines[0].pk}/')
+
+    def test_vaccine_statistics(self):
+        self.assertQueryBudget(3, 'get', f'/api/vaccines/{self.vaccines[0].pk}/statistics/')
+
+    # Registros de vacinação
+
+    def test_vaccination_list(self):
+        self.assertQueryBudget(2, 'get', '/api/vaccinations/')
+
+    def test_vaccination_retrieve(self):
+        record = VaccinationRecord.objects.filter(pet=self.pet).earliest('id')
+        self.assertQueryBudget(1, 'get', f'/api/vaccinations/{record.pk}/')
+
+    def test_vaccination_due_soon(self):
+        self.assertQueryBudget(1, 'get', '/api/vaccinations/due_soon/')
+
+    def test_vaccination_overdue(self):
+        self.assertQueryBudget(1, 'get', '/api/vaccinations/overdue/')
+
+    def test_vaccination_recent(self):
+        self.assertQueryBudget(1, 'get', '/api/vaccinations/recent/')
+
+    def test_vaccination_export(self):
+        self.assertQueryBudget(1, 'get', '/api/vaccinations/export/', {'export_format': 'ndjson'})
+
+    def test_vaccination_bulk(self):
+        self.assertQueryBudget(16, 'post', '/api/vaccinations/bulk/', lambda size: {
+            'records': [
+                {
+                    'pet': self.pet.pk,
+                    'vaccine': vaccine.pk,
+                    'administered_date': str(self.today - timedelta(days=1000 + size)),
+                    'veterinarian_name': 'Dr. B',
+                }
+                for vaccine in self.vaccines
+            ]
+        })
+
+
+class PetCascadeDeleteTests(TestCase):
+    """
+    Remover um pet trata os registros apagados em cascata em bloco: o
+    número de consultas não depende de quantos registros o pet tem.
+    """
+
+    def setUp(self):
+        user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=user, name='Tutor', email='tutor@example.com')
+        self.vaccines = [
+            Vaccine.objects.create(name='Rabies', duration_months=12),
+            Vaccine.objects.create(name='DHPP', duration_months=1),
+        ]
+        self.kept = self.create_pet('Mantido', 3)
+
+    def create_pet(self, name, doses):
+        pet = Pet.objects.create(pessoa=self.pessoa, name=name, species='dog', birth_date=date(2015, 1, 1))
+        for vaccine in self.vaccines:
+            for dose in range(doses):
+                VaccinationRecord.objects.create(
+                    pet=pet, vaccine=vaccine, veterinarian_name='Dr. A',
+                    administered_date=date(2016, 1, 1) + timedelta(days=40 * dose)
+                )
+        return pet
+
+    def count_delete_queries(self, doses):
+        pet = self.create_pet(f'Pet {doses}', doses)
+        with CaptureQueriesContext(connection) as context:
+            pet.delete()
+        return len(context.captured_queries)
+
+    def test_delete_queries_do_not_grow_with_records(self):
+        self.assertEqual(self.count_delete_queries(2), self.count_delete_queries(20))
+
+    def test_derived_data_after_delete(self):
+        self.count_delete_queries(5)
+
+        for vaccine in self.vaccines:
+            vaccine.refresh_from_db()
+            self.assertEqual(vaccine.total_administrations, 3)
+        self.assertEqual(
+            set(VaccinationStatus.objects.values_list('pet_id', flat=True)), {self.kept.pk}
+        )
+        index = SEARCH_INDEXES[VaccinationRecord]
+        if index.available():
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT rowid FROM {index.table}')
+                indexed = {row[0] for row in cursor.fetchall()}
+            self.assertEqual(indexed, set(VaccinationRecord.objects.values_list('pk', flat=True)))
+
+        # Registros removidos individualmente continuam com os handlers por registro
+        self.kept.vaccination_records.filter(vaccine=self.vaccines[0]).latest('administered_date').delete()
+        self.vaccines[0].refresh_from_db()
+        self.assertEqual(self.vaccines[0].total_administrations, 2)
+
+    def test_failed_delete_does_not_affect_later_deletes(self):
+        pet = self.create_pet('Falha', 3)
+
+        def fail(sender, **kwargs):
+            raise RuntimeError('falha na remoção')
+
+        post_delete.connect(fail, sender=VaccinationRecord, dispatch_uid='test_failed_delete')
+        try:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                pet.delete()
+        finally:
+            post_delete.disconnect(sender=VaccinationRecord, dispatch_uid='test_failed_delete')
+
+        self.vaccines[0].refresh_from_db()
+        self.assertEqual(self.vaccines[0].total_administrations, 6)
+
+        # A remoção de um registro do pet volta a usar os handlers por registro
+        pet.vaccination_records.filter(vaccine=self.vaccines[0]).latest('administered_date').delete()
+        self.vaccines[0].refresh_from_db()
+        self.assertEqual(self.vaccines[0].total_administrations, 5)
+        self.assertEqual(
+            VaccinationStatus.objects.get(pet=pet, vaccine=self.vaccines[0]).administered_date,
+            date(2016, 1, 1) + timedelta(days=40)
+        )
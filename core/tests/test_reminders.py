@@ -0,0 +1,78 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord, VaccinationReminder
+
+
+class SendVaccinationRemindersTests(TestCase):
+    """Testes do comando send_vaccination_reminders"""
+
+    def setUp(self):
+        self.today = date.today()
+        self.rabies = Vaccine.objects.create(name='Rabies', duration_months=12)
+        self.dhpp = Vaccine.objects.create(name='DHPP', duration_months=12)
+        self.felv = Vaccine.objects.create(name='FeLV', duration_months=12)
+        self.pessoa = self.create_pessoa('tutor')
+        self.pet = Pet.objects.create(
+            pessoa=self.pessoa, name='Rex', species='dog', birth_date=date(2020, 1, 1)
+        )
+
+    def create_pessoa(self, username):
+        user = User.objects.create_user(username=username, password='senha-forte-123')
+        return Pessoa.objects.create(user=user, name=username, email=f'{username}@example.com')
+
+    def create_record(self, pet, vaccine, days_until_due):
+        return VaccinationRecord.objects.create(
+            pet=pet,
+            vaccine=vaccine,
+            administered_date=self.today - timedelta(days=30),
+            next_dose_date=self.today + timedelta(days=days_until_due),
+            veterinarian_name='Dr. A'
+        )
+
+    def run_command(self):
+        call_command('send_vaccination_reminders', stdout=StringIO())
+
+    def test_sends_one_digest_per_pessoa(self):
+        self.create_record(self.pet, self.rabies, 10)
+        self.create_record(self.pet, self.dhpp, 20)
+        self.create_record(self.pet, self.felv, 90)  # fora da janela
+        other = self.create_pessoa('outro')
+        other_pet = Pet.objects.create(
+            pessoa=other, name='Mia', species='cat', birth_date=date(2021, 1, 1)
+        )
+        self.create_record(other_pet, self.rabies, 5)
+
+        self.run_command()
+
+        self.assertEqual(len(mail.outbox), 2)
+        digest = next(message for message in mail.outbox if message.to == ['tutor@example.com'])
+        self.assertIn('Rabies', digest.body)
+        self.assertIn('DHPP', digest.body)
+        self.assertNotIn('FeLV', digest.body)
+        self.assertEqual(VaccinationReminder.objects.count(), 3)
+
+    def test_is_idempotent(self):
+        self.create_record(self.pet, self.rabies, 10)
+
+        self.run_command()
+        self.run_command()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(VaccinationReminder.objects.count(), 1)
+
+    def test_picks_up_records_created_after_last_run(self):
+        self.create_record(self.pet, self.rabies, 10)
+        self.run_command()
+
+        self.create_record(self.pet, self.dhpp, 15)
+        self.run_command()
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn('DHPP', mail.outbox[1].body)
+        self.assertNotIn('Rabies', mail.outbox[1].body)
@@ -0,0 +1,93 @@
+import json
+import uuid
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from io import StringIO
+from unittest import mock, skipIf
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from core import renderers
+from core.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """O FastJSONRenderer deve gerar os mesmos bytes que o JSONRenderer do DRF, exceto em floats"""
+
+    data = {
+        'id': 1,
+        'weight': Decimal('12.50'),
+        'ratio': 0.1,
+        'flags': [True, False, None],
+        'birth_date': date(2020, 2, 29),
+        'created_at': datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        'naive': datetime(2024, 5, 1, 12, 30),
+        'at': time(8, 15, 0, 500000),
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'label': gettext_lazy('Vacina'),
+        'notes': 'Ração "especial" </script>\n   🐶',
+        'nested': [{'pets': (1, 2)}],
+        7: 'chave numérica',
+    }
+
+    def test_matches_drf_output(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    @skipIf(renderers.orjson is None, 'orjson não instalado')
+    def test_float_differences(self):
+        # Mesmo valor, com expoente escrito de outra forma
+        for value, fast, drf in [
+            (1e16, b'1e16', b'1e+16'),
+            (1e-5, b'0.00001', b'1e-05'),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(FastJSONRenderer().render([value]), b'[' + fast + b']')
+                self.assertEqual(JSONRenderer().render([value]), b'[' + drf + b']')
+                self.assertEqual(json.loads(fast), value)
+
+        # Valores não finitos viram null, em vez de erro
+        for value in (float('nan'), float('inf')):
+            with self.subTest(value=value):
+                self.assertEqual(FastJSONRenderer().render({'value': value}), b'{"value":null}')
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render({'value': value})
+
+    def test_fallbacks(self):
+        big = {'value': 2 ** 70}
+        self.assertEqual(FastJSONRenderer().render(big), JSONRenderer().render(big))
+
+        indented = FastJSONRenderer().render(self.data, 'application/json; indent=2')
+        self.assertEqual(indented, JSONRenderer().render(self.data, 'application/json; indent=2'))
+
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+
+class RendererSettingsTests(APITestCase):
+
+    def test_api_uses_fast_renderer(self):
+        user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.client.force_authenticate(user)
+        response = self.client.get('/api/vaccines/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+
+
+class BenchmarkRenderersCommandTests(TestCase):
+
+    def test_command_reports_sizes(self):
+        call_command('seed_benchmark_data', '--owners', '2', '--pets', '2', stdout=StringIO())
+        out = StringIO()
+        call_command('benchmark_renderers', '--sizes', '5,20', '--iterations', '2', stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('fast p50', lines[0])
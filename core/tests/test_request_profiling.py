@@ -0,0 +1,98 @@
+import re
+from datetime import date
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth.models import User
+from django.test import TransactionTestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from core import concurrency
+from core.concurrency import map_in_threads, run_queries
+from core.middleware import RequestProfile, RequestProfilingMiddleware, _current_profile
+from core.models import Pessoa, Pet
+
+
+PROFILING = {'ENABLED': True, 'SLOW_REQUEST_MS': 10_000, 'MAX_QUERIES': 1}
+
+
+def query_count(response):
+    return int(re.search(r'desc="(\d+) queries"', response['Server-Timing']).group(1))
+
+
+class RequestProfilingTests(APITestCase):
+    """Testes do RequestProfilingMiddleware"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        for name in ('Rex', 'Mia'):
+            Pet.objects.create(pessoa=pessoa, name=name, species='dog', birth_date=date(2020, 1, 1))
+        self.client.force_authenticate(self.user)
+        self.headers = {'authorization': f'Token {Token.objects.create(user=self.user).key}'}
+
+    def test_disabled_by_default(self):
+        response = self.client.get('/api/pets/')
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(REQUEST_PROFILING=PROFILING)
+    def test_server_timing_and_slow_log(self):
+        with self.assertLogs('core.middleware', 'WARNING') as logs:
+            response = self.client.get('/api/pessoas/')
+
+        timing = response['Server-Timing']
+        for metric in ('db;dur=', 'serializer;dur=', 'view;dur=', 'total;dur='):
+            self.assertIn(metric, timing)
+        self.assertIn('desc="PessoaViewSet.list"', timing)
+        self.assertIn('PessoaViewSet.list', logs.output[0])
+
+    @override_settings(REQUEST_PROFILING={**PROFILING, 'MAX_QUERIES': 100})
+    def test_fast_requests_are_not_logged(self):
+        with self.assertNoLogs('core.middleware', 'WARNING'):
+            response = self.client.get('/api/auth/profile/')
+        self.assertIn('desc="profile"', response['Server-Timing'])
+
+    @override_settings(REQUEST_PROFILING={**PROFILING, 'MAX_QUERIES': 100})
+    async def test_async_views(self):
+        async def get_response(request):
+            return None
+
+        # Instanciado na thread do ORM assíncrono, cuja conexão já estava aberta
+        middleware = await sync_to_async(RequestProfilingMiddleware)(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+
+        response = await self.async_client.get('/api/vaccinations/due_soon/', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('desc="VaccinationRecordViewSet.due_soon"', response['Server-Timing'])
+        # Feitas na thread do ORM assíncrono, fora da thread do middleware
+        self.assertGreaterEqual(query_count(response), 1)
+
+
+@override_settings(REQUEST_PROFILING=PROFILING)
+class WorkerQueryProfilingTests(TransactionTestCase):
+    """
+    Consultas feitas pelas threads de run_queries() e map_in_threads() entram
+    no perfil da requisição. Os dados são confirmados no banco, pois as
+    threads usam outras conexões.
+    """
+
+    def setUp(self):
+        # Instala o registro de consultas nas conexões
+        RequestProfilingMiddleware(lambda request: None)
+        patcher = mock.patch.object(concurrency, 'concurrent_queries_enabled', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.profile = RequestProfile()
+        token = _current_profile.set(self.profile)
+        self.addCleanup(_current_profile.reset, token)
+
+    def test_map_in_threads(self):
+        self.assertEqual(map_in_threads(lambda _: Pet.objects.count(), range(3)), [0, 0, 0])
+        self.assertEqual(len(self.profile.queries), 3)
+
+    async def test_run_queries(self):
+        results = await run_queries(Pet.objects.count, User.objects.count)
+        self.assertEqual(results, [0, 0])
+        self.assertEqual(len(self.profile.queries), 2)
@@ -0,0 +1,114 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+from core.search import SEARCH_INDEXES, pet_index
+
+
+class FullTextSearchTests(APITestCase):
+    """Busca pelos índices FTS5 (core.search) e sua sincronização por core.signals"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Ana Souza', email='ana@example.com')
+        self.rex = Pet.objects.create(
+            pessoa=self.pessoa, name='Rex', species='dog', breed='Labrador Retriever',
+            birth_date=date(2020, 1, 1)
+        )
+        self.mia = Pet.objects.create(
+            pessoa=self.pessoa, name='Mia', species='cat', breed='Siamês',
+            birth_date=date(2021, 1, 1)
+        )
+        self.vaccine = Vaccine.objects.create(name='Antirrábica', duration_months=12)
+        self.record = VaccinationRecord.objects.create(
+            pet=self.rex, vaccine=self.vaccine, administered_date=date(2024, 1, 10),
+            veterinarian_name='Dr. Paulo', clinic_name='Clínica Central'
+        )
+        self.client.force_authenticate(self.user)
+
+    def search(self, url, term):
+        response = self.client.get(url, {'search': term})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        return body['results'] if isinstance(body, dict) else body
+
+    def pet_names(self, term):
+        return sorted(pet['name'] for pet in self.search('/api/pets/', term))
+
+    def record_ids(self, term):
+        return [record['id'] for record in self.search('/api/vaccinations/', term)]
+
+    def test_search_uses_index(self):
+        self.assertTrue(all(index.available() for index in SEARCH_INDEXES.values()))
+        with mock.patch('rest_framework.filters.SearchFilter.filter_queryset') as fallback:
+            self.pet_names('rex')
+        fallback.assert_not_called()
+
+    def test_prefix_and_terms(self):
+        self.assertEqual(self.pet_names('lab'), ['Rex'])
+        self.assertEqual(self.pet_names('ana'), ['Mia', 'Rex'])
+        # Todos os termos devem aparecer, em qualquer coluna
+        self.assertEqual(self.pet_names('ana siam'), ['Mia'])
+        self.assertEqual(self.pet_names('rex siam'), [])
+        # Acentos são ignorados
+        self.assertEqual(self.pet_names('siames'), ['Mia'])
+        self.assertEqual(self.record_ids('clinica paulo'), [self.record.pk])
+        self.assertEqual(self.record_ids('antirrabica'), [self.record.pk])
+
+    def test_index_follows_changes(self):
+        Pet.objects.create(
+            pessoa=self.pessoa, name='Thor', species='dog', birth_date=date(2022, 1, 1)
+        )
+        self.assertEqual(self.pet_names('thor'), ['Thor'])
+
+        self.rex.name = 'Bidu'
+        self.rex.save()
+        self.assertEqual(self.pet_names('rex'), [])
+        self.assertEqual(self.pet_names('bidu'), ['Bidu'])
+
+        # Colunas desnormalizadas (RELATED_COLUMNS)
+        self.assertEqual(self.record_ids('bidu'), [self.record.pk])
+        self.pessoa.name = 'Beatriz Lima'
+        self.pessoa.save()
+        self.assertEqual(self.pet_names('beatriz'), ['Bidu', 'Mia', 'Thor'])
+        self.assertEqual(self.pet_names('souza'), [])
+        self.vaccine.name = 'Raiva'
+        self.vaccine.save()
+        self.assertEqual(self.record_ids('raiva'), [self.record.pk])
+
+        self.record.delete()
+        self.assertEqual(self.record_ids('paulo'), [])
+        self.mia.delete()
+        self.assertEqual(self.pet_names('beatriz'), ['Bidu', 'Thor'])
+
+    def test_rebuild_command(self):
+        with connection.cursor() as cursor:
+            for index in SEARCH_INDEXES.values():
+                cursor.execute(f'DELETE FROM {index.table}')
+        self.assertEqual(self.pet_names('rex'), [])
+
+        out = StringIO()
+        call_command('rebuild_search_index', '--batch-size', '1', stdout=out)
+        self.assertIn(f'{pet_index.table}: 2 linha(s) indexada(s)', out.getvalue())
+        self.assertEqual(self.pet_names('rex'), ['Rex'])
+        self.assertEqual(self.record_ids('central'), [self.record.pk])
+
+    def test_index_created_after_first_check(self):
+        self.addCleanup(pet_index.rebuild)
+        pet_index.drop()
+        self.assertFalse(pet_index.available())
+        self.assertEqual(self.pet_names('lab'), ['Rex'])
+
+        # Ex.: a migração que cria o índice roda com o processo já no ar
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE {pet_index.table} USING fts5("
+                f"{', '.join(pet_index.columns)})"
+            )
+        self.assertTrue(pet_index.available())
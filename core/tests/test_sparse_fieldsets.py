@@ -0,0 +1,76 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+
+
+class SparseFieldsetTests(APITestCase):
+    """Testes de ?fields= / ?omit= nas listagens"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.pet = Pet.objects.create(
+            pessoa=self.pessoa, name='Rex', species='dog',
+            birth_date=date(2020, 1, 1), notes='Observações longas'
+        )
+        VaccinationRecord.objects.create(
+            pet=self.pet,
+            vaccine=Vaccine.objects.create(name='Rabies', duration_months=12),
+            administered_date=date(2024, 1, 10),
+            veterinarian_name='Dr. A',
+            notes='Sem reações'
+        )
+        self.client.force_authenticate(self.user)
+
+    def get_with_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_fields_limits_response_and_columns(self):
+        response, queries = self.get_with_queries('/api/pets/?fields=id,name,age_years')
+
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name', 'age_years'})
+        select = next(sql for sql in queries if 'FROM "core_pet"' in sql and 'COUNT' not in sql)
+        self.assertNotIn('"notes"', select)
+        self.assertIn('"birth_date"', select)
+        self.assertNotIn('JOIN', select)
+
+    def test_omit_removes_fields(self):
+        response, queries = self.get_with_queries('/api/vaccinations/?omit=notes,pet_name')
+
+        record = response.data['results'][0]
+        self.assertNotIn('notes', record)
+        self.assertNotIn('pet_name', record)
+        self.assertIn('vaccine_name', record)
+        select = next(sql for sql in queries if 'FROM "core_vaccinationrecord"' in sql and 'COUNT' not in sql)
+        self.assertNotIn('"core_vaccinationrecord"."notes"', select)
+
+    def test_cursor_pagination_with_fields(self):
+        response, _ = self.get_with_queries('/api/pets/?fields=name&cursor=')
+
+        self.assertEqual(response.data['results'], [{'name': 'Rex'}])
+
+    def test_nested_list_actions(self):
+        response, _ = self.get_with_queries(f'/api/pets/{self.pet.pk}/vaccinations/?fields=id,vaccine_name')
+        self.assertEqual(set(response.data[0]), {'id', 'vaccine_name'})
+
+        response, _ = self.get_with_queries(f'/api/pets/{self.pet.pk}/upcoming_vaccinations/?omit=notes')
+        self.assertEqual(len(response.data['overdue']), 1)
+        self.assertNotIn('notes', response.data['overdue'][0])
+
+        response, _ = self.get_with_queries(f'/api/pessoas/{self.pessoa.pk}/pets/?fields=id')
+        self.assertEqual(response.data, [{'id': self.pet.pk}])
+
+    def test_writes_ignore_fields(self):
+        response = self.client.patch(f'/api/pets/{self.pet.pk}/?fields=id', {'name': 'Max'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], 'Max')
+        self.assertIn('notes', response.data)
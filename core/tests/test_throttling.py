@@ -0,0 +1,62 @@
+from multiprocessing import get_context
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+
+from core.tests import use_temporary_throttle_store
+from core.throttling import throttle_store
+
+
+def _hit_many(path, key, hits):
+    """Executado em outro processo: conta quantas requisições passaram"""
+    with override_settings(THROTTLE_STORE_PATH=path):
+        return sum(throttle_store.hit(key, 5, 60)[0] for _ in range(hits))
+
+
+class ThrottleStoreTests(SimpleTestCase):
+    """Testes do SQLiteThrottleStore"""
+
+    def setUp(self):
+        self.path = use_temporary_throttle_store(self)
+
+    def test_sliding_window(self):
+        results = [throttle_store.hit('k', 5, 60, now=600 + i)[0] for i in range(6)]
+        self.assertEqual(results, [True] * 5 + [False])
+
+        # Metade da janela seguinte: a anterior pesa 5 * 0.5, sobram 3
+        results = [throttle_store.hit('k', 5, 60, now=690)[0] for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+        # Duas janelas depois, a chave recomeça do zero
+        self.assertTrue(throttle_store.hit('k', 5, 60, now=800)[0])
+
+    def test_wait_and_cleanup(self):
+        for _ in range(5):
+            throttle_store.hit('k', 5, 60, now=600)
+        allowed, wait = throttle_store.hit('k', 5, 60, now=630)
+        self.assertFalse(allowed)
+        self.assertGreater(wait, 0)
+        self.assertTrue(throttle_store.hit('k', 5, 60, now=630 + wait + 0.01)[0])
+
+        throttle_store.cleanup(now=10_000)
+        count = throttle_store.get_connection().execute('SELECT COUNT(*) FROM throttle').fetchone()
+        self.assertEqual(count[0], 0)
+
+    def test_limit_holds_across_processes(self):
+        with get_context('fork').Pool(4) as pool:
+            allowed = pool.starmap(_hit_many, [(self.path, 'auth', 5)] * 4)
+        self.assertEqual(sum(allowed), 5)
+
+
+class AuthThrottleTests(APITestCase):
+    """O escopo auth (5/minute) é aplicado no login"""
+
+    def setUp(self):
+        use_temporary_throttle_store(self)
+
+    def test_login_is_throttled(self):
+        statuses = [
+            self.client.post('/api/auth/login/', {'username': 'x', 'password': 'y'}).status_code
+            for _ in range(6)
+        ]
+        self.assertEqual(statuses, [401] * 5 + [429])
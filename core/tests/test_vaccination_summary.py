@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+
+
+class VaccinationSummaryTests(APITestCase):
+    """Testes do endpoint /api/pessoas/{id}/vaccination_summary/"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        self.pessoa = Pessoa.objects.create(user=self.user, name='Tutor', email='tutor@example.com')
+        self.rabies = Vaccine.objects.create(name='Rabies', duration_months=12)
+        self.dhpp = Vaccine.objects.create(name='DHPP', duration_months=1)
+        self.felv = Vaccine.objects.create(name='FeLV', duration_months=12)
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/pessoas/{self.pessoa.pk}/vaccination_summary/'
+
+    def create_pets(self, count):
+        today = date.today()
+        for i in range(count):
+            pet = Pet.objects.create(
+                pessoa=self.pessoa,
+                name=f'Pet {i}',
+                species='dog',
+                birth_date=date(2020, 1, 1)
+            )
+            # A vencer, atrasada e em dia
+            VaccinationRecord.objects.create(
+                pet=pet, vaccine=self.rabies,
+                administered_date=today - timedelta(days=350), veterinarian_name='Dr. A'
+            )
+            VaccinationRecord.objects.create(
+                pet=pet, vaccine=self.dhpp,
+                administered_date=today - timedelta(days=100), veterinarian_name='Dr. A'
+            )
+            VaccinationRecord.objects.create(
+                pet=pet, vaccine=self.felv,
+                administered_date=today - timedelta(days=5), veterinarian_name='Dr. A'
+            )
+
+    def get_query_count(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.data
+
+    def test_summary_content(self):
+        self.create_pets(2)
+        _, data = self.get_query_count()
+
+        self.assertEqual(data['total_pets'], 2)
+        self.assertEqual(data['total_vaccinations'], 6)
+        self.assertEqual(data['due_soon'], 2)
+        self.assertEqual(data['overdue'], 2)
+
+        pet_data = data['pets'][0]
+        self.assertEqual(pet_data['total_vaccinations'], 3)
+        self.assertEqual(len(pet_data['due_vaccinations']), 1)
+        self.assertEqual(pet_data['due_vaccinations'][0]['vaccine'], 'Rabies')
+        self.assertEqual(len(pet_data['overdue_vaccinations']), 1)
+        self.assertEqual(pet_data['overdue_vaccinations'][0]['vaccine'], 'DHPP')
+        self.assertGreater(pet_data['overdue_vaccinations'][0]['days_overdue'], 0)
+
+    def test_renewed_doses_are_not_due(self):
+        self.create_pets(1)
+        pet = Pet.objects.get()
+        VaccinationRecord.objects.create(
+            pet=pet, vaccine=self.rabies,
+            administered_date=date.today() - timedelta(days=1), veterinarian_name='Dr. A'
+        )
+        _, data = self.get_query_count()
+
+        self.assertEqual(data['total_vaccinations'], 4)
+        self.assertEqual(data['due_soon'], 0)
+        self.assertEqual(data['overdue'], 1)
+        self.assertEqual(data['pets'][0]['due_vaccinations'], [])
+
+    def test_query_count_does_not_grow_with_pets(self):
+        self.create_pets(1)
+        small_count, _ = self.get_query_count()
+
+        self.create_pets(20)
+        large_count, data = self.get_query_count()
+
+        self.assertEqual(data['total_pets'], 21)
+        self.assertEqual(small_count, large_count)
+        self.assertLessEqual(large_count, 4)
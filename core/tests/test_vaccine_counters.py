@@ -0,0 +1,32 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+
+
+class VaccineCounterTests(TestCase):
+    """Vaccine.total_administrations é mantido pelos sinais e não pelo save()"""
+
+    def setUp(self):
+        user = User.objects.create_user(username='tutor', password='senha-forte-123')
+        pessoa = Pessoa.objects.create(user=user, name='Tutor', email='tutor@example.com')
+        self.pet = Pet.objects.create(
+            pessoa=pessoa, name='Rex', species='dog', birth_date=date(2020, 1, 1)
+        )
+        self.vaccine = Vaccine.objects.create(name='Rabies', duration_months=12)
+
+    def test_save_keeps_concurrent_increments(self):
+        loaded = Vaccine.objects.get(pk=self.vaccine.pk)
+        VaccinationRecord.objects.create(
+            pet=self.pet, vaccine=self.vaccine,
+            administered_date=date(2024, 1, 10), veterinarian_name='Dr. A'
+        )
+
+        loaded.description = 'Raiva'
+        loaded.save()
+
+        self.vaccine.refresh_from_db()
+        self.assertEqual(self.vaccine.description, 'Raiva')
+        self.assertEqual(self.vaccine.total_administrations, 1)
@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth.models import User
+from rest_framework.test import APITestCase
+
+from core.models import Pessoa, Pet, Vaccine, VaccinationRecord
+from core.pagination import StandardPagination
+from core.serializers import PetDetailSerializer, PetSerializer, VaccinationRecordSerializer
+from core.values import ValuesReader
+
+
+class ValuesReaderParityTests(APITestCase):
+    """
+    O caminho rápido (ValuesReader) deve produzir exatamente os mesmos
+    bytes que os serializers do DRF.
+    """
+
+    def setUp(self):
+        self.staff = User.objects.create_user(username='admin', password='senha-forte-123', is_staff=True)
+        today = date.today()
+        rabies = Vaccine.objects.create(name='Rabies', duration_months=12)
+        dhpp = Vaccine.objects.create(name='DHPP', duration_months=1)
+        pets = []
+        for index, (species, birth_date, weight) in enumerate([
+            ('dog', date(2020, 2, 29), Decimal('12.5')),
+            ('cat', today - timedelta(days=40), None),
+            ('reptile', date(2015, 12, 31), Decimal('0.30')),
+        ]):
+            user = User.objects.create_user(username=f'tutor{index}', password='senha-forte-123')
+            pessoa = Pessoa.objects.create(user=user, name=f'Tutor {index}', email=f'tutor{index}@example.com')
+            pets.append(Pet.objects.create(
+                pessoa=pessoa, name=f'Pet {index}', species=species, breed='SRD',
+                birth_date=birth_date, weight=weight, notes='Ração "especial"\nçã'
+            ))
+
+        for pet in pets:
+            for vaccine, days_ago in ((rabies, 350), (dhpp, 100), (dhpp, 10)):
+                administered_date = max(today - timedelta(days=days_ago), pet.birth_date)
+                if not VaccinationRecord.objects.filter(
+                    pet=pet, vaccine=vaccine, administered_date=administered_date
+                ).exists():
+                    VaccinationRecord.objects.create(
+                        pet=pet, vaccine=vaccine, administered_date=administered_date,
+                        veterinarian_name='Dr. A', batch_number='L-1'
+                    )
+        # Registro sem próxima dose
+        VaccinationRecord.objects.filter(pk=VaccinationRecord.objects.first().pk).update(next_dose_date=None)
+
+        self.pet = pets[0]
+        self.client.force_authenticate(self.staff)
+
+    def assert_same_content(self, url):
+        fast = self.client.get(url)
+        with mock.patch.object(ValuesReader, 'for_serializer', return_value=None):
+            slow = self.client.get(url)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(slow.status_code, 200)
+        self.assertEqual(fast.content, slow.content)
+
+    def test_pet_list(self):
+        for url in [
+            '/api/pets/',
+            '/api/pets/?cursor=',
+            '/api/pets/?fields=id,species_display,age_months',
+            '/api/pets/?ordering=birth_date&omit=notes',
+        ]:
+            with self.subTest(url=url):
+                self.assert_same_content(url)
+
+    def test_vaccination_lists(self):
+        for url in [
+            '/api/vaccinations/',
+            '/api/vaccinations/?cursor=',
+            '/api/vaccinations/?fields=pet_name,is_due,days_until_due',
+            '/api/vaccinations/due_soon/',
+            '/api/vaccinations/overdue/',
+            '/api/vaccinations/recent/',
+            f'/api/pets/{self.pet.pk}/vaccinations/',
+            f'/api/pets/{self.pet.pk}/upcoming_vaccinations/',
+        ]:
+            with self.subTest(url=url):
+                self.assert_same_content(url)
+
+    def test_cursor_pages(self):
+        with mock.patch.object(StandardPagination, 'page_size', 1):
+            response = self.client.get('/api/vaccinations/?cursor=')
+            self.assertEqual(len(response.data['results']), 1)
+            self.assert_same_content(response.data['next'])
+
+    def test_reader_support(self):
+        self.assertIsNotNone(ValuesReader.for_serializer(PetSerializer(), Pet.objects.all()))
+        self.assertIsNotNone(ValuesReader.for_serializer(
+            VaccinationRecordSerializer(), VaccinationRecord.objects.with_due_status()
+        ))
+        # SerializerMethodField não pode ser lido com values()
+        self.assertIsNone(ValuesReader.for_serializer(PetDetailSerializer(), Pet.objects.all()))
@@ -0,0 +1,147 @@
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from rest_framework import throttling
+
+
+class SQLiteThrottleStore:
+    """
+    Contadores de throttling compartilhados entre processos, em um arquivo
+    SQLite próprio (settings.THROTTLE_STORE_PATH).
+    
+    Cada chave guarda apenas a janela fixa atual e a contagem da anterior
+    (sliding window counter): a estimativa de requisições no último
+    intervalo é anterior * fração restante + atual. Cada verificação custa
+    uma leitura e uma escrita na mesma transação (BEGIN IMMEDIATE), o que a
+    torna atômica entre workers. Chaves expiradas são removidas
+    periodicamente por um DELETE indexado em expires_at.
+    """
+    cleanup_probability = 0.001
+    
+    def __init__(self):
+        self._local = threading.local()
+    
+    def get_connection(self):
+        path = str(settings.THROTTLE_STORE_PATH)
+        state = (os.getpid(), path)
+        if getattr(self._local, 'state', None) != state:
+            connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS throttle ('
+                'key TEXT PRIMARY KEY, '
+                'window INTEGER NOT NULL, '
+                'count INTEGER NOT NULL, '
+                'previous_count INTEGER NOT NULL, '
+                'expires_at REAL NOT NULL)'
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS throttle_expires_at ON throttle (expires_at)'
+            )
+            self._local.connection = connection
+            self._local.state = state
+        return self._local.connection
+    
+    def hit(self, key, limit, duration, now=None):
+        """
+        Registra uma requisição para `key` se ela estiver dentro do limite.
+        Retorna (permitida, segundos de espera até a próxima permitida).
+        """
+        now = time.time() if now is None else now
+        window = int(now // duration)
+        elapsed = (now - window * duration) / duration
+        
+        connection = self.get_connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute(
+                'SELECT window, count, previous_count FROM throttle WHERE key = ?', [key]
+            ).fetchone()
+            count, previous = 0, 0
+            if row is not None:
+                if row[0] == window:
+                    count, previous = row[1], row[2]
+                elif row[0] == window - 1:
+                    previous = row[1]
+            
+            allowed = previous * (1 - elapsed) + count < limit
+            if allowed:
+                connection.execute(
+                    'INSERT INTO throttle (key, window, count, previous_count, expires_at) '
+                    'VALUES (?, ?, ?, ?, ?) '
+                    'ON CONFLICT (key) DO UPDATE SET window = excluded.window, '
+                    'count = excluded.count, previous_count = excluded.previous_count, '
+                    'expires_at = excluded.expires_at',
+                    [key, window, count + 1, previous, (window + 2) * duration]
+                )
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        
+        if random.random() < self.cleanup_probability:
+            self.cleanup(now)
+        
+        if allowed:
+            return True, None
+        return False, self._wait(limit, duration, elapsed, count, previous)
+    
+    def cleanup(self, now=None):
+        """Remove chaves cujas duas janelas já expiraram"""
+        now = time.time() if now is None else now
+        self.get_connection().execute('DELETE FROM throttle WHERE expires_at < ?', [now])
+    
+    def clear(self):
+        self.get_connection().execute('DELETE FROM throttle')
+    
+    @staticmethod
+    def _wait(limit, duration, elapsed, count, previous):
+        """Tempo até a estimativa ficar abaixo do limite"""
+        if count < limit:
+            # Ainda na janela atual, esperando o peso da anterior cair
+            return max(duration * (1 - elapsed - (limit - count) / previous), 0)
+        # Só na próxima janela, quando a atual passa a ser a anterior
+        return duration * (1 - elapsed) + duration * (1 - limit / count)
+
+
+throttle_store = SQLiteThrottleStore()
+
+
+class SharedRateThrottleMixin:
+    """
+    Substitui o histórico em cache (lista de timestamps por chave) do
+    SimpleRateThrottle pelo SQLiteThrottleStore, compartilhado entre os
+    workers e com custo constante por verificação.
+    """
+    
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        
+        allowed, self.wait_seconds = throttle_store.hit(
+            self.key, self.num_requests, self.duration
+        )
+        return allowed
+    
+    def wait(self):
+        if self.wait_seconds is None:
+            return None
+        return math.ceil(self.wait_seconds)
+
+
+class AnonRateThrottle(SharedRateThrottleMixin, throttling.AnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(SharedRateThrottleMixin, throttling.UserRateThrottle):
+    pass
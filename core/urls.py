@@ -5,6 +5,7 @@ from core.views import (
     PetViewSet,
     VaccineViewSet,
     VaccinationRecordViewSet,
+    batch,
 )
 from core.views.auth import register, login, logout, profile, update_profile, change_password 
 
@@ -25,6 +26,9 @@ urlpatterns = [
     path('auth/profile/update/', update_profile, name='update-profile'),
     path('auth/change-password/', change_password, name='change-password'),
     
+    # Requisições em lote
+    path('batch/', batch, name='batch'),
+
     # URLs das rotas (CRUD endpoints)
     path('', include(router.urls)),
 ]
\ No newline at end of file
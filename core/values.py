@@ -0,0 +1,195 @@
+from asgiref.sync import sync_to_async
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from core.fieldsets import resolve_source
+from core.middleware import serialization_timer
+
+
+# Campos cujo to_representation devolve o próprio valor lido do banco
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ReadOnlyField,
+)
+
+# Campos convertidos pelo próprio campo do DRF (formato de datas, Decimal)
+CONVERTED_FIELDS = (
+    serializers.DateField,
+    serializers.DateTimeField,
+    serializers.TimeField,
+    serializers.DecimalField,
+    serializers.FloatField,
+)
+
+
+def _not_none(convert):
+    """O DRF não chama to_representation para valores None"""
+    def wrapper(value):
+        return None if value is None else convert(value)
+    return wrapper
+
+
+def _choice_display(model_field):
+    choices = dict(model_field.flatchoices)
+    return lambda value: choices.get(value, value)
+
+
+class ValuesReader:
+    """
+    Caminho rápido de leitura para listagens: lê as linhas com .values()
+    (com os nomes relacionados em joins) e monta a mesma representação do
+    ModelSerializer sem criar instâncias do modelo nem percorrer os
+    campos do DRF por linha.
+
+    Só é usado quando todos os campos legíveis do serializer podem ser
+    lidos do banco: colunas, lookups relacionados (source='pet.name'),
+    get_X_display, anotações do queryset e, sem anotação, os campos
+    calculados em Meta.values_computed ({campo: (lookup, função)}). Qualquer outro campo
+    (SerializerMethodField, serializers aninhados...) faz for_serializer()
+    retornar None e a view usa o serializer normal.
+    """
+
+    def __init__(self, fields):
+        # [(nome na resposta, lookup, conversor ou None)]
+        self.fields = fields
+
+    @classmethod
+    def for_serializer(cls, serializer, queryset):
+        meta = getattr(serializer, 'Meta', None)
+        model = getattr(meta, 'model', None)
+        if model is None or model is not queryset.model:
+            return None
+
+        computed = getattr(meta, 'values_computed', {})
+        annotations = queryset.query.annotations
+        fields = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source in annotations:
+                lookup, convert = field.source, None
+            elif name in computed:
+                lookup, convert = computed[name]
+            else:
+                resolved = cls.resolve_field(model, field)
+                if resolved is None:
+                    return None
+                lookup, convert = resolved
+            fields.append((name, lookup, convert))
+        return cls(fields)
+
+    @staticmethod
+    def resolve_field(model, field):
+        """(lookup, conversor) para um campo do DRF, ou None se não suportado"""
+        if field.source == '*':
+            return None
+        resolved = resolve_source(model, field.source_attrs)
+        if resolved is None:
+            return None
+        lookup, model_field, display = resolved
+
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            # values() já devolve a pk da FK
+            if not model_field.many_to_one or field.pk_field is not None:
+                return None
+            return lookup, None
+        if model_field.is_relation:
+            return None
+        if display:
+            if not isinstance(field, serializers.CharField):
+                return None
+            return lookup, _choice_display(model_field)
+        if isinstance(field, IDENTITY_FIELDS):
+            return lookup, None
+        if isinstance(field, CONVERTED_FIELDS):
+            return lookup, _not_none(field.to_representation)
+        return None
+
+    @property
+    def lookups(self):
+        return list(dict.fromkeys(lookup for _, lookup, _ in self.fields))
+
+    def values(self, queryset, extra=()):
+        """Queryset de dicts com os lookups usados (mais `extra`, ex.: a ordenação do cursor)"""
+        return queryset.values(*dict.fromkeys([*self.lookups, *extra]))
+
+    def represent(self, rows):
+        rows = list(rows)
+        fields = self.fields
+        with serialization_timer():
+            return [
+                {
+                    name: row[lookup] if convert is None else convert(row[lookup])
+                    for name, lookup, convert in fields
+                }
+                for row in rows
+            ]
+
+
+class ValuesListViewMixin:
+    """
+    Mixin de ViewSet que serve a listagem (e as ações que usam
+    list_response()) pelo ValuesReader quando o serializer permite,
+    com a mesma saída do serializer. Combina com SparseFieldsetMixin:
+    só os campos selecionados são lidos.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.list_response(queryset)
+
+    def list_response(self, queryset, paginate=True):
+        reader = ValuesReader.for_serializer(self.get_serializer(), queryset)
+        if reader is None:
+            return self._serializer_list_response(queryset, paginate)
+
+        rows = reader.values(queryset, self._keyset_lookups())
+        page = self.paginate_queryset(rows) if paginate else None
+        if page is not None:
+            return self.get_paginated_response(reader.represent(page))
+        return Response(reader.represent(rows))
+
+    async def alist_response(self, queryset):
+        """Versão assíncrona de list_response(), sem paginação"""
+        data = await aserialize_list(
+            self.get_serializer_class(), queryset, context=self.get_serializer_context()
+        )
+        return Response(data)
+
+    def _serializer_list_response(self, queryset, paginate):
+        page = self.paginate_queryset(queryset) if paginate else None
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def _keyset_lookups(self):
+        """O cursor da paginação por keyset é montado a partir destes campos"""
+        return [field.lstrip('-') for field in getattr(self, 'keyset_ordering', ())]
+
+
+def serialize_list(serializer_class, queryset, **kwargs):
+    """
+    Lista serializada pelo ValuesReader quando possível, senão pelo
+    serializer; para ações que montam a resposta manualmente.
+    """
+    serializer = serializer_class(**kwargs)
+    reader = ValuesReader.for_serializer(serializer, queryset)
+    if reader is None:
+        return serializer_class(queryset, many=True, **kwargs).data
+    return reader.represent(reader.values(queryset))
+
+
+async def aserialize_list(serializer_class, queryset, **kwargs):
+    """Versão assíncrona de serialize_list(), com o ORM assíncrono"""
+    serializer = serializer_class(**kwargs)
+    reader = ValuesReader.for_serializer(serializer, queryset)
+    if reader is None:
+        return await sync_to_async(
+            lambda: serializer_class(queryset, many=True, **kwargs).data
+        )()
+    return reader.represent([row async for row in reader.values(queryset)])
@@ -3,6 +3,7 @@ from .pet import PetViewSet
 from .vaccine import VaccineViewSet
 from .vaccination_record import VaccinationRecordViewSet
 from .auth import register, login, logout, profile, update_profile, change_password
+from .batch import batch
 
 __all__ = [
     'PessoaViewSet',
@@ -15,4 +16,5 @@ __all__ = [
     'profile',
     'update_profile',
     'change_password',
+    'batch',
 ]
\ No newline at end of file
@@ -3,15 +3,19 @@ from rest_framework.decorators import api_view, permission_classes, throttle_cla
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.authtoken.models import Token
-from rest_framework.throttling import AnonRateThrottle
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db.models import Count
+from core.caching import conditional_response, get_validators
+from core.models import Pessoa
 from core.serializers import PessoaCreateSerializer, PessoaSerializer
+from core.throttling import AnonRateThrottle
 
 
 class AuthRateThrottle(AnonRateThrottle):
     """Throttle personalizado para endpoints de autenticação"""
+    scope = 'auth'
     rate = '5/minute'
 
 
@@ -140,7 +144,7 @@ def logout(request):
     Requer: Header Authorization com o token
     """
     try:
-        # Deletar o token
+        # Deletar o token (core.signals o revoga no cache de autenticação)
         request.user.auth_token.delete()
         return Response({
             'message': 'Logout realizado com sucesso'
@@ -156,9 +160,25 @@ def logout(request):
 def profile(request):
     """
     Obter informações do perfil do usuário atual.
+    
+    Aceita requisições condicionais (ETag / Last-Modified); responde 304
+    sem serializar o perfil quando nada mudou.
     """
+    validators = get_validators(
+        Pessoa.objects.filter(user=request.user),
+        timestamps=('updated_at',),
+        counts=('pets',)
+    )
+    if validators is not None:
+        return conditional_response(request, validators, lambda: _profile_response(request))
+    return _profile_response(request)
+
+
+def _profile_response(request):
     try:
-        pessoa = request.user.pessoa
+        pessoa = Pessoa.objects.select_related('user').annotate(
+            pet_count=Count('pets')
+        ).get(user=request.user)
         serializer = PessoaSerializer(pessoa)
         return Response(serializer.data)
     except:
@@ -174,7 +194,9 @@ def update_profile(request):
     Atualizar informações do perfil do usuário atual.
     """
     try:
-        pessoa = request.user.pessoa
+        pessoa = Pessoa.objects.select_related('user').annotate(
+            pet_count=Count('pets')
+        ).get(user=request.user)
         serializer = PessoaSerializer(pessoa, data=request.data, partial=True)
         
         if serializer.is_valid():
@@ -220,7 +242,7 @@ def change_password(request):
             'new_password': list(e.messages)
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # Seta a nova senha
+    # Seta a nova senha (core.signals revoga os tokens em cache do usuário)
     user.set_password(new_password)
     user.save()
     
@@ -0,0 +1,184 @@
+import logging
+from urllib.parse import urlsplit
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from core.concurrency import map_in_threads
+
+
+logger = logging.getLogger(__name__)
+
+# Limites do endpoint de requisições em lote
+BATCH_MAX_REQUESTS = 20
+BATCH_MAX_WORKERS = 4
+BATCH_URL_PREFIX = '/api/'
+
+# Headers da requisição original que não valem para as sub-requisições
+EXCLUDED_META = (
+    'CONTENT_LENGTH',
+    'CONTENT_TYPE',
+    'HTTP_IF_NONE_MATCH',
+    'HTTP_IF_MODIFIED_SINCE',
+    'HTTP_IF_MATCH',
+    'HTTP_IF_UNMODIFIED_SINCE',
+)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch(request):
+    """
+    Executar várias requisições GET da API em uma única chamada.
+
+    Corpo: {"requests": ["/api/pets/", {"url": "/api/vaccines/?species=dog"}],
+    "parallel": false} ou apenas a lista de requisições.
+
+    O usuário é autenticado uma vez e cada sub-requisição é resolvida pelo
+    URLconf e executada pela própria view, com as permissões e os
+    throttles normais (os middlewares não são aplicados). Com
+    "parallel": true, as sub-requisições rodam em um pool de threads
+    quando o banco permite. Retorna {"responses": [...]} na mesma ordem,
+    cada uma com url, status, headers e body.
+    """
+    payload = request.data
+    parallel = False
+    if isinstance(payload, dict):
+        parallel = str(payload.get('parallel', '')).lower() in ('true', '1', 'yes')
+        payload = payload.get('requests')
+
+    if not isinstance(payload, list) or not payload:
+        return Response({
+            'error': 'Forneça uma lista não vazia de requisições em "requests"'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    if len(payload) > BATCH_MAX_REQUESTS:
+        return Response({
+            'error': f'O lote pode conter no máximo {BATCH_MAX_REQUESTS} requisições'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    urls = []
+    errors = []
+    for index, item in enumerate(payload):
+        url, error = _parse_item(item)
+        if error:
+            errors.append({'index': index, 'errors': [error]})
+        urls.append(url)
+    if errors:
+        return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    def run(url):
+        return _run_subrequest(request, url)
+
+    if parallel:
+        responses = map_in_threads(run, urls, max_workers=BATCH_MAX_WORKERS)
+    else:
+        responses = [run(url) for url in urls]
+
+    return Response({'responses': responses})
+
+
+def _parse_item(item):
+    """Valida um item do lote e retorna (url, erro)"""
+    if isinstance(item, dict):
+        method = str(item.get('method', 'GET')).upper()
+        if method != 'GET':
+            return None, 'Apenas requisições GET são permitidas.'
+        item = item.get('url')
+
+    if not isinstance(item, str) or not item.startswith(BATCH_URL_PREFIX):
+        return None, f'Informe uma URL relativa iniciada por "{BATCH_URL_PREFIX}".'
+
+    parts = urlsplit(item)
+    if parts.scheme or parts.netloc or parts.fragment:
+        return None, f'Informe uma URL relativa iniciada por "{BATCH_URL_PREFIX}".'
+    return item, None
+
+
+def _run_subrequest(request, url):
+    """Resolve e executa uma sub-requisição GET com o usuário já autenticado"""
+    parts = urlsplit(url)
+    try:
+        match = resolve(parts.path)
+    except Resolver404:
+        return _result(url, status.HTTP_404_NOT_FOUND, {}, {'detail': 'Não encontrado.'})
+
+    if match.func is batch:
+        return _result(url, status.HTTP_400_BAD_REQUEST, {}, {
+            'detail': 'Requisições em lote não podem ser aninhadas.'
+        })
+
+    subrequest = _build_subrequest(request, parts.path, parts.query)
+    subrequest.resolver_match = match
+
+    view = match.func
+    if iscoroutinefunction(view):
+        view = async_to_sync(view)
+
+    try:
+        response = view(subrequest, *match.args, **match.kwargs)
+        if response.streaming:
+            # Ex.: exportação; o conteúdo não é lido, para não carregá-lo em memória
+            response.close()
+            return _result(url, status.HTTP_400_BAD_REQUEST, {}, {
+                'detail': 'Respostas em streaming (ex.: exportação) não são suportadas em lote.'
+            })
+        if hasattr(response, 'data'):
+            body = response.data
+        else:
+            body = response.content.decode(response.charset)
+    except Exception:
+        logger.exception('Erro na sub-requisição em lote %s', url)
+        return _result(url, status.HTTP_500_INTERNAL_SERVER_ERROR, {}, {
+            'detail': 'Erro interno do servidor.'
+        })
+
+    headers = {
+        name: value for name, value in response.items()
+        if name.lower() != 'content-length'
+    }
+    renderer = getattr(response, 'accepted_renderer', None)
+    if renderer is not None:
+        # Responses do DRF só recebem o Content-Type real ao serem renderizadas
+        charset = f'; charset={renderer.charset}' if renderer.charset else ''
+        headers['Content-Type'] = f'{renderer.media_type}{charset}'
+    return _result(url, response.status_code, headers, body)
+
+
+def _build_subrequest(request, path, query):
+    """
+    HttpRequest GET para `path`, com os headers da requisição original
+    (host, IP para os throttles de anônimos etc.) e o usuário e o token já
+    autenticados, para que o DRF não autentique de novo.
+    """
+    original = request._request
+    subrequest = HttpRequest()
+    subrequest.method = 'GET'
+    subrequest.path = subrequest.path_info = path
+    subrequest.META = {
+        key: value for key, value in original.META.items()
+        if key not in EXCLUDED_META
+    }
+    subrequest.META.update({
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+    })
+    subrequest.GET = QueryDict(query)
+    subrequest.COOKIES = original.COOKIES
+    subrequest._force_auth_user = request.user
+    subrequest._force_auth_token = request.auth
+    return subrequest
+
+
+def _result(url, status_code, headers, body):
+    return {
+        'url': url,
+        'status': status_code,
+        'headers': headers,
+        'body': body,
+    }
@@ -2,8 +2,14 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.db.models import Count
-from core.models import Pessoa
+from django.db.models import Count, Prefetch
+from datetime import date
+from asgiref.sync import sync_to_async
+from core.caching import ConditionalRetrieveMixin
+from core.concurrency import AsyncViewSetMixin, run_queries
+from core.fieldsets import SparseFieldsetViewMixin
+from core.models import Pessoa, VaccinationRecord
+from core.models.vaccination_record import CURRENT_STATUS, due_soon_q, overdue_q
 from core.serializers import (
     PessoaSerializer,
     PessoaDetailSerializer,
@@ -12,7 +18,12 @@ from core.serializers import (
 from core.permissions import IsPessoa, IsPessoaOrReadOnly
 
 
-class PessoaViewSet(viewsets.ModelViewSet):
+class PessoaViewSet(
+    AsyncViewSetMixin,
+    ConditionalRetrieveMixin,
+    SparseFieldsetViewMixin,
+    viewsets.ModelViewSet
+):
     """
     ViewSet para operações CRUD de Pessoa.
     
@@ -21,8 +32,16 @@ class PessoaViewSet(viewsets.ModelViewSet):
     retrieve: Obter detalhes da pessoa com lista de pets
     update: Atualizar informações da pessoa
     destroy: Deletar conta da pessoa
+    
+    retrieve aceita requisições condicionais (ETag / Last-Modified)
+    calculadas a partir da pessoa e dos seus pets.
+    vaccination_summary é assíncrona (AsyncViewSetMixin).
     """
     permission_classes = [IsAuthenticated, IsPessoa]
+    keyset_ordering = ['name', 'id']
+    sparse_required_fields = ('user',)
+    validator_timestamps = ('updated_at', 'pets__updated_at')
+    validator_counts = ('pets',)
     
     def get_queryset(self):
         """
@@ -39,7 +58,7 @@ class PessoaViewSet(viewsets.ModelViewSet):
         # Usuários comuns só podem acessar seu próprio perfil de pessoa
         return Pessoa.objects.filter(user=user).annotate(
             pet_count=Count('pets')
-        )
+        ).select_related('user')
     
     def get_serializer_class(self):
         """Usar serializers diferentes para ações diferentes"""
@@ -61,37 +80,61 @@ class PessoaViewSet(viewsets.ModelViewSet):
         pessoa = self.get_object()
         from core.serializers import PetSerializer
         pets = pessoa.pets.all()
-        serializer = PetSerializer(pets, many=True)
+        serializer = PetSerializer(pets, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
     
     @action(detail=True, methods=['get'])
-    def vaccination_summary(self, request, pk=None):
-        """Obter resumo de vacinação de todos os pets da pessoa"""
-        pessoa = self.get_object()
+    async def vaccination_summary(self, request, pk=None):
+        """
+        Obter resumo de vacinação de todos os pets da pessoa.
+        
+        Usa um número constante de consultas, independente da quantidade
+        de pets e registros: uma agregação condicional para os totais e uma
+        leitura com prefetch (e join com a vacina) para as listas por pet.
+        Os totais e os pets são lidos em paralelo quando o banco permite.
+        """
+        pessoa = await sync_to_async(self.get_object)()
+        today = date.today()
+        
+        counts_queryset = VaccinationRecord.objects.filter(pet__pessoa=pessoa)
+        
+        # Apenas a dose atual de cada vacina, se a vencer ou atrasada,
+        # entra nas listas por pet
+        pending_records = VaccinationRecord.objects.filter(
+            due_soon_q(today, CURRENT_STATUS) | overdue_q(today, CURRENT_STATUS)
+        ).select_related('vaccine').with_due_status(today)
+        pets_queryset = pessoa.pets.annotate(
+            vaccination_count=Count('vaccination_records')
+        ).prefetch_related(
+            Prefetch('vaccination_records', queryset=pending_records, to_attr='pending_records')
+        )
+        
+        counts, pets = await run_queries(
+            lambda: counts_queryset.due_counts(today, current_only=True),
+            lambda: list(pets_queryset)
+        )
         
         summary = {
-            'total_pets': pessoa.pets.count(),
-            'total_vaccinations': 0,
-            'due_soon': 0,
-            'overdue': 0,
+            'total_pets': 0,
+            'total_vaccinations': counts['total'],
+            'due_soon': counts['due_soon'],
+            'overdue': counts['overdue'],
             'pets': []
         }
         
-        for pet in pessoa.pets.all():
+        for pet in pets:
+            summary['total_pets'] += 1
             pet_data = {
                 'id': pet.id,
                 'name': pet.name,
                 'species': pet.species,
-                'total_vaccinations': pet.vaccination_records.count(),
+                'total_vaccinations': pet.vaccination_count,
                 'due_vaccinations': [],
                 'overdue_vaccinations': []
             }
             
-            for record in pet.vaccination_records.all():
-                summary['total_vaccinations'] += 1
-                
+            for record in pet.pending_records:
                 if record.is_due:
-                    summary['due_soon'] += 1
                     pet_data['due_vaccinations'].append({
                         'vaccine': record.vaccine.name,
                         'next_dose_date': record.next_dose_date,
@@ -99,7 +142,6 @@ class PessoaViewSet(viewsets.ModelViewSet):
                     })
                 
                 if record.is_overdue:
-                    summary['overdue'] += 1
                     pet_data['overdue_vaccinations'].append({
                         'vaccine': record.vaccine.name,
                         'next_dose_date': record.next_dose_date,
@@ -1,14 +1,29 @@
-from rest_framework import viewsets, filters
+from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
+from django.db.models import Count, Q
+from datetime import date
+from asgiref.sync import sync_to_async
+from core.caching import ConditionalRetrieveMixin
+from core.concurrency import AsyncViewSetMixin, run_queries
+from core.fieldsets import SparseFieldsetViewMixin
 from core.models import Pet
+from core.models.pet import AGE_LIMITS, AGE_UNITS
 from core.serializers import PetSerializer, PetDetailSerializer
+from core.filters import AliasedOrderingFilter, FullTextSearchFilter
 from core.permissions import IsPessoaOrReadOnly
+from core.values import ValuesListViewMixin, serialize_list
 
 
-class PetViewSet(viewsets.ModelViewSet):
+class PetViewSet(
+    AsyncViewSetMixin,
+    ConditionalRetrieveMixin,
+    SparseFieldsetViewMixin,
+    ValuesListViewMixin,
+    viewsets.ModelViewSet
+):
     """
     ViewSet para operações CRUD de Pets.
     
@@ -17,12 +32,30 @@ class PetViewSet(viewsets.ModelViewSet):
     retrieve: Obter detalhes do pet com histórico de vacinação
     update: Atualizar informações do pet
     destroy: Deletar um pet
+    
+    retrieve aceita requisições condicionais (ETag / Last-Modified)
+    calculadas a partir do pet, do tutor e dos registros de vacinação.
+    upcoming_vaccinations é assíncrona (AsyncViewSetMixin).
+    
+    Filtros por idade: ?age_min= / ?age_max= (inclusivos, em anos ou em
+    meses com ?age_unit=months), convertidos em faixas de birth_date.
+    ?ordering=age ordena do mais novo para o mais velho.
     """
     permission_classes = [IsAuthenticated, IsPessoaOrReadOnly]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, AliasedOrderingFilter]
     search_fields = ['name', 'breed', 'pessoa__name']
     ordering_fields = ['name', 'birth_date', 'created_at']
+    ordering_aliases = {'age': '-birth_date'}
     ordering = ['-created_at']
+    keyset_ordering = ['-created_at', '-id']
+    sparse_required_fields = ('owner',)
+    validator_timestamps = (
+        'updated_at',
+        'pessoa__updated_at',
+        'vaccination_records__updated_at',
+        'vaccination_records__vaccine__updated_at',
+    )
+    validator_counts = ('vaccination_records',)
     
     def get_queryset(self):
         """
@@ -31,14 +64,14 @@ class PetViewSet(viewsets.ModelViewSet):
         Staff pode ver todos os pets.
         """
         user = self.request.user
-        queryset = Pet.objects.select_related('pessoa', 'pessoa__user')
+        queryset = Pet.objects.select_related('pessoa')
         
         if user.is_staff:
             # Staff pode ver todos os pets
             queryset = queryset.all()
         else:
-            # Usuários comuns só veem seus próprios pets
-            queryset = queryset.filter(pessoa__user=user)
+            # Usuários comuns só veem seus próprios pets (owner sem joins)
+            queryset = queryset.filter(owner=user)
         
         # Filtrar por espécie, se fornecida
         species = self.request.query_params.get('species', None)
@@ -50,8 +83,40 @@ class PetViewSet(viewsets.ModelViewSet):
         if pessoa_id:
             queryset = queryset.filter(pessoa_id=pessoa_id)
         
+        # Filtrar por idade (faixa de birth_date, usa o índice da coluna)
+        queryset = self.filter_age(queryset)
+        
+        # Idades calculadas no banco para a serialização
+        queryset = queryset.with_age()
+        
+        # Contagem usada pelo PetDetailSerializer, sem COUNT extra por pet
+        if self.action == 'retrieve':
+            queryset = queryset.annotate(vaccination_count=Count('vaccination_records'))
+        
         return queryset
     
+    def filter_age(self, queryset):
+        """Aplica ?age_min=, ?age_max= e ?age_unit= (years ou months)"""
+        params = self.request.query_params
+        unit = params.get('age_unit', 'years')
+        if unit not in AGE_UNITS:
+            raise ValidationError({'age_unit': [f'Use {" ou ".join(AGE_UNITS)}.']})
+        
+        bounds = {}
+        for name in ('age_min', 'age_max'):
+            value = params.get(name)
+            if value in (None, ''):
+                continue
+            if not (value.isascii() and value.isdigit()):
+                raise ValidationError({name: ['Informe um número inteiro não negativo.']})
+            if int(value) > AGE_LIMITS[unit]:
+                raise ValidationError({name: [f'Informe um valor de no máximo {AGE_LIMITS[unit]}.']})
+            bounds[name] = int(value)
+        
+        if not bounds:
+            return queryset
+        return queryset.age_between(bounds.get('age_min'), bounds.get('age_max'), unit)
+    
     def get_serializer_class(self):
         """Use o DetailSerializer para ação de recuperação"""
         if self.action == 'retrieve':
@@ -75,24 +140,37 @@ class PetViewSet(viewsets.ModelViewSet):
         """Obter todos os registros de vacinação de um pet específico"""
         pet = self.get_object()
         from core.serializers import VaccinationRecordSerializer
-        records = pet.vaccination_records.select_related('vaccine').order_by('-administered_date')
-        serializer = VaccinationRecordSerializer(records, many=True)
-        return Response(serializer.data)
+        records = pet.vaccination_records.select_related(
+            'vaccine'
+        ).with_due_status().order_by('-administered_date')
+        return Response(serialize_list(
+            VaccinationRecordSerializer, records, context=self.get_serializer_context()
+        ))
     
     @action(detail=True, methods=['get'])
-    def upcoming_vaccinations(self, request, pk=None):
-        """Obter vacinações futuras/próximas de um pet"""
-        pet = self.get_object()
+    async def upcoming_vaccinations(self, request, pk=None):
+        """
+        Obter vacinações futuras/próximas de um pet.
+        As duas listas são lidas em paralelo quando o banco permite.
+        """
+        pet = await sync_to_async(self.get_object)()
         from core.serializers import VaccinationRecordSerializer
         
-        records = pet.vaccination_records.filter(
-            next_dose_date__isnull=False
-        ).select_related('vaccine').order_by('next_dose_date')
+        today = date.today()
+        records = pet.vaccination_records.select_related(
+            'vaccine'
+        ).with_due_status(today).order_by('next_dose_date')
+        
+        due_soon = records.due_soon(today, current_only=True)
+        overdue = records.overdue(today, current_only=True)
         
-        due_soon = [r for r in records if r.is_due]
-        overdue = [r for r in records if r.is_overdue]
+        context = self.get_serializer_context()
+        due_soon, overdue = await run_queries(
+            lambda: serialize_list(VaccinationRecordSerializer, due_soon, context=context),
+            lambda: serialize_list(VaccinationRecordSerializer, overdue, context=context)
+        )
         
         return Response({
-            'due_soon': VaccinationRecordSerializer(due_soon, many=True).data,
-            'overdue': VaccinationRecordSerializer(overdue, many=True).data
+            'due_soon': due_soon,
+            'overdue': overdue
         })
\ No newline at end of file
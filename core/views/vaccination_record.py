@@ -1,18 +1,89 @@
-from rest_framework import viewsets, filters
+from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from datetime import date, timedelta
-from core.models import VaccinationRecord
+from itertools import islice
+import csv
+from dateutil.relativedelta import relativedelta
+from core.models import Pet, Vaccine, VaccinationRecord
 from core.serializers import (
     VaccinationRecordSerializer,
-    VaccinationRecordDetailSerializer
+    VaccinationRecordDetailSerializer,
+    VaccinationRecordBulkItemSerializer
 )
+from core.concurrency import AsyncViewSetMixin, is_asgi_request
+from core.fieldsets import SparseFieldsetViewMixin
+from core.filters import FullTextSearchFilter
 from core.permissions import IsPessoaOrReadOnly
+from core.renderers import dumps
+from core.signals import vaccination_records_bulk_created
+from core.values import ValuesListViewMixin
 
 
-class VaccinationRecordViewSet(viewsets.ModelViewSet):
+# Limites do endpoint de criação em lote
+BULK_MAX_RECORDS = 5000
+BULK_CHUNK_SIZE = 500
+
+# Colunas da exportação (cabeçalho -> lookup), na mesma ordem do
+# VaccinationRecordSerializer
+EXPORT_COLUMNS = {
+    'id': 'id',
+    'pet': 'pet_id',
+    'pet_name': 'pet__name',
+    'vaccine': 'vaccine_id',
+    'vaccine_name': 'vaccine__name',
+    'administered_date': 'administered_date',
+    'veterinarian_name': 'veterinarian_name',
+    'clinic_name': 'clinic_name',
+    'batch_number': 'batch_number',
+    'next_dose_date': 'next_dose_date',
+    'is_due': 'is_due',
+    'is_overdue': 'is_overdue',
+    'days_until_due': 'days_until_due',
+    'notes': 'notes',
+    'created_at': 'created_at',
+}
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _prepend(first, iterable):
+    """Gera `first` seguido dos itens de `iterable`"""
+    yield first
+    yield from iterable
+
+
+async def _aiterate(iterable, chunk_size):
+    """
+    Itera `iterable` (síncrono, ex.: .iterator() do ORM) de forma
+    assíncrona, lendo `chunk_size` itens por vez via sync_to_async. Sob
+    ASGI, o Django consumiria um iterador síncrono inteiro com
+    sync_to_async(list) antes de enviar a resposta.
+    """
+    iterator = iter(iterable)
+    next_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)))
+    while chunk := await next_chunk():
+        for item in chunk:
+            yield item
+
+
+class _Echo:
+    """Buffer que apenas devolve o que recebe, para o csv.writer em streaming"""
+    
+    def write(self, value):
+        return value
+
+
+class VaccinationRecordViewSet(
+    AsyncViewSetMixin,
+    SparseFieldsetViewMixin,
+    ValuesListViewMixin,
+    viewsets.ModelViewSet
+):
     """
     ViewSet para operações CRUD de Registro de Vacinação.
     
@@ -21,12 +92,17 @@ class VaccinationRecordViewSet(viewsets.ModelViewSet):
     retrieve: Obter registro de vacinação detalhado
     update: Atualizar registro de vacinação
     destroy: Deletar um registro de vacinação
+    
+    due_soon, overdue e recent são assíncronas (AsyncViewSetMixin) e leem
+    os registros com o ORM assíncrono.
     """
     permission_classes = [IsAuthenticated, IsPessoaOrReadOnly]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, filters.OrderingFilter]
     search_fields = ['pet__name', 'vaccine__name', 'veterinarian_name', 'clinic_name']
     ordering_fields = ['administered_date', 'next_dose_date', 'created_at']
     ordering = ['-administered_date']
+    keyset_ordering = ['-administered_date', '-id']
+    sparse_required_fields = ('owner',)
     
     def get_queryset(self):
         """
@@ -36,13 +112,13 @@ class VaccinationRecordViewSet(viewsets.ModelViewSet):
         user = self.request.user
         queryset = VaccinationRecord.objects.select_related(
             'pet', 'pet__pessoa', 'vaccine'
-        )
+        ).with_due_status()
         
         if user.is_staff:
             queryset = queryset.all()
         else:
-            # Filtrar apenas registros dos pets do usuário
-            queryset = queryset.filter(pet__pessoa__user=user)
+            # Filtrar apenas registros dos pets do usuário (owner sem joins)
+            queryset = queryset.filter(owner=user)
         
         # Filtrar por pet
         pet_id = self.request.query_params.get('pet', None)
@@ -78,34 +154,28 @@ class VaccinationRecordViewSet(viewsets.ModelViewSet):
         serializer.save()
     
     @action(detail=False, methods=['get'])
-    def due_soon(self, request):
-        """Obter todas as vacinações com data de próxima dose nos próximos 30 dias"""
-        user = request.user
-        today = date.today()
-        thirty_days = today + timedelta(days=30)
-        
-        queryset = self.get_queryset().filter(
-            next_dose_date__gte=today,
-            next_dose_date__lte=thirty_days
-        ).order_by('next_dose_date')
+    async def due_soon(self, request):
+        """
+        Obter as vacinações com data de próxima dose nos próximos 30 dias.
+        Considera apenas a dose mais recente de cada pet e vacina.
+        """
+        queryset = self.get_queryset().due_soon(current_only=True).order_by('next_dose_date')
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return await self.alist_response(queryset)
     
     @action(detail=False, methods=['get'])
-    def overdue(self, request):
-        """Obter todas as vacinações atrasadas"""
-        today = date.today()
-        
-        queryset = self.get_queryset().filter(
-            next_dose_date__lt=today
-        ).order_by('next_dose_date')
+    async def overdue(self, request):
+        """
+        Obter as vacinações atrasadas.
+        Considera apenas a dose mais recente de cada pet e vacina, então doses
+        já renovadas não aparecem.
+        """
+        queryset = self.get_queryset().overdue(current_only=True).order_by('next_dose_date')
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return await self.alist_response(queryset)
     
     @action(detail=False, methods=['get'])
-    def recent(self, request):
+    async def recent(self, request):
         """Obter vacinações recentes (últimos 30 dias)"""
         thirty_days_ago = date.today() - timedelta(days=30)
         
@@ -113,5 +183,184 @@ class VaccinationRecordViewSet(viewsets.ModelViewSet):
             administered_date__gte=thirty_days_ago
         ).order_by('-administered_date')
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        return await self.alist_response(queryset)
+    
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Criar vários registros de vacinação em uma única requisição.
+        
+        Corpo: {"records": [...], "atomic": false} ou apenas a lista de registros.
+        
+        O lote é validado com um número fixo de consultas (pets, vacinas e
+        duplicatas são carregados uma vez) e inserido com bulk_create em blocos.
+        Itens inválidos são retornados em "errors" com o seu índice; os demais
+        são criados. Com "atomic": true, qualquer erro cancela o lote inteiro.
+        """
+        payload = request.data
+        atomic = False
+        if isinstance(payload, dict):
+            atomic = str(payload.get('atomic', '')).lower() in ('true', '1', 'yes')
+            payload = payload.get('records')
+        
+        if not isinstance(payload, list) or not payload:
+            return Response({
+                'error': 'Forneça uma lista não vazia de registros em "records"'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        if len(payload) > BULK_MAX_RECORDS:
+            return Response({
+                'error': f'O lote pode conter no máximo {BULK_MAX_RECORDS} registros'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        records, errors = self._build_bulk_records(payload)
+        
+        if errors and (atomic or not records):
+            return Response({
+                'created': [],
+                'errors': errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            with transaction.atomic():
+                created = []
+                for start in range(0, len(records), BULK_CHUNK_SIZE):
+                    created.extend(VaccinationRecord.objects.bulk_create(
+                        records[start:start + BULK_CHUNK_SIZE]
+                    ))
+                vaccination_records_bulk_created.send(
+                    sender=VaccinationRecord, records=created
+                )
+        except IntegrityError:
+            # Registro concorrente com o mesmo pet, vacina e data
+            return Response({
+                'error': 'Conflito com registros existentes; nenhum registro foi criado'
+            }, status=status.HTTP_409_CONFLICT)
+        
+        return Response({
+            'created': VaccinationRecordSerializer(created, many=True).data,
+            'errors': errors
+        }, status=status.HTTP_201_CREATED)
+    
+    def _build_bulk_records(self, payload):
+        """
+        Valida os itens do lote e monta as instâncias a inserir.
+        Retorna (records, errors), com errors no formato {'index', 'errors'}.
+        """
+        items = []
+        errors = []
+        for index, data in enumerate(payload):
+            serializer = VaccinationRecordBulkItemSerializer(data=data)
+            if serializer.is_valid():
+                items.append((index, serializer.validated_data))
+            else:
+                errors.append({'index': index, 'errors': serializer.errors})
+        
+        if not items:
+            return [], errors
+        
+        pet_ids = {item['pet'] for _, item in items}
+        vaccine_ids = {item['vaccine'] for _, item in items}
+        
+        # Usuários comuns só podem registrar vacinas para os próprios pets
+        pets = Pet.objects.filter(pk__in=pet_ids).only(
+            'id', 'name', 'birth_date', 'pessoa_id', 'owner_id'
+        )
+        if not self.request.user.is_staff:
+            pets = pets.filter(owner=self.request.user)
+        pets = {pet.pk: pet for pet in pets}
+        vaccines = Vaccine.objects.in_bulk(vaccine_ids)
+        
+        existing = set(VaccinationRecord.objects.filter(
+            pet_id__in=pets.keys(),
+            vaccine_id__in=vaccines.keys(),
+            administered_date__in={item['administered_date'] for _, item in items}
+        ).values_list('pet_id', 'vaccine_id', 'administered_date'))
+        
+        records = []
+        for index, item in items:
+            pet = pets.get(item['pet'])
+            vaccine = vaccines.get(item['vaccine'])
+            item_errors = {}
+            
+            if pet is None:
+                item_errors['pet'] = ['Pet não encontrado.']
+            elif item['administered_date'] < pet.birth_date:
+                item_errors['administered_date'] = [
+                    'A data da vacinação não pode ser anterior à data de nascimento do pet.'
+                ]
+            if vaccine is None:
+                item_errors['vaccine'] = ['Vacina não encontrada.']
+            
+            key = (item['pet'], item['vaccine'], item['administered_date'])
+            if not item_errors and key in existing:
+                item_errors['non_field_errors'] = [
+                    'Já existe um registro para este pet, vacina e data.'
+                ]
+            
+            if item_errors:
+                errors.append({'index': index, 'errors': item_errors})
+                continue
+            
+            # Evita duplicatas dentro do próprio lote
+            existing.add(key)
+            records.append(VaccinationRecord(
+                pet=pet,
+                owner_id=pet.owner_id,
+                vaccine=vaccine,
+                administered_date=item['administered_date'],
+                veterinarian_name=item['veterinarian_name'],
+                clinic_name=item['clinic_name'],
+                batch_number=item['batch_number'],
+                notes=item['notes'],
+                next_dose_date=item['administered_date'] + relativedelta(months=vaccine.duration_months)
+            ))
+        
+        errors.sort(key=lambda error: error['index'])
+        return records, errors
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Exportar registros de vacinação em CSV ou NDJSON (?export_format=csv|ndjson).
+        
+        Aceita os mesmos filtros da listagem (pet, vaccine, date_from, date_to,
+        search e ordering). As linhas são lidas com .values() e .iterator(),
+        então o uso de memória não cresce com o número de registros exportados.
+        Cada linha NDJSON é JSON compacto em UTF-8 (core.renderers.dumps).
+        Sob ASGI, o conteúdo é um iterador assíncrono, lido em blocos de
+        EXPORT_CHUNK_SIZE linhas.
+        """
+        export_format = request.query_params.get('export_format', 'csv').lower()
+        if export_format not in ('csv', 'ndjson'):
+            return Response({
+                'error': 'Formato inválido. Use "csv" ou "ndjson".'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        headers = list(EXPORT_COLUMNS)
+        rows = self.filter_queryset(self.get_queryset()).values_list(
+            *EXPORT_COLUMNS.values()
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        
+        if export_format == 'csv':
+            writer = csv.writer(_Echo())
+            content = (
+                writer.writerow(row)
+                for row in _prepend(headers, rows)
+            )
+            content_type = 'text/csv; charset=utf-8'
+        else:
+            content = (
+                dumps(dict(zip(headers, row))) + b'\n'
+                for row in rows
+            )
+            content_type = 'application/x-ndjson'
+        
+        if is_asgi_request(request):
+            content = _aiterate(content, EXPORT_CHUNK_SIZE)
+        
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = (
+            f'attachment; filename="vaccinations-{date.today().isoformat()}.{export_format}"'
+        )
+        return response
\ No newline at end of file
@@ -1,26 +1,41 @@
+from asgiref.sync import sync_to_async
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from core.caching import CachedCatalogMixin
+from core.concurrency import AsyncViewSetMixin, run_queries
+from core.fieldsets import SparseFieldsetViewMixin
 from core.models import Vaccine
 from core.serializers import VaccineSerializer, VaccineDetailSerializer
+from core.filters import FullTextSearchFilter
 from core.permissions import IsAdminOrReadOnly
 
 
-class VaccineViewSet(viewsets.ModelViewSet):
+class VaccineViewSet(
+    AsyncViewSetMixin,
+    CachedCatalogMixin,
+    SparseFieldsetViewMixin,
+    viewsets.ModelViewSet
+):
     """
     ViewSet para operações CRUD de Vacinas.
     
     Apenas administradores podem criar/atualizar/deletar vacinas.
     Usuários comuns podem apenas ler informações sobre vacinas.
-
+    
+    list e retrieve são servidos do cache do catálogo (CachedCatalogMixin),
+    cuja versão muda sempre que uma vacina é salva ou removida ou que o
+    seu total de aplicações muda. list e
+    statistics são assíncronas (AsyncViewSetMixin).
     """
     queryset = Vaccine.objects.all()
     permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'manufacturer', 'species_target']
     ordering_fields = ['name', 'duration_months', 'created_at']
     ordering = ['name']
+    keyset_ordering = ['name', 'id']
     
     def get_queryset(self):
         """Apply filters from query parameters"""
@@ -46,15 +61,16 @@ class VaccineViewSet(viewsets.ModelViewSet):
         return VaccineSerializer
     
     @action(detail=True, methods=['get'])
-    def statistics(self, request, pk=None):
-        """Obter estatísticas para uma vacina específica"""
-        vaccine = self.get_object()
-        
-        total_administrations = vaccine.vaccination_records.count()
+    async def statistics(self, request, pk=None):
+        """
+        Obter estatísticas para uma vacina específica.
+        As duas consultas são feitas em paralelo quando o banco permite.
+        """
+        vaccine = await sync_to_async(self.get_object)()
         
         # Obter estatísticas para uma vacina específica
         from django.db.models import Count
-        by_species = vaccine.vaccination_records.values(
+        species_counts = vaccine.vaccination_records.values(
             'pet__species'
         ).annotate(
             count=Count('id')
@@ -63,15 +79,20 @@ class VaccineViewSet(viewsets.ModelViewSet):
         # Administrações recentes (últimos 30 dias)
         from datetime import date, timedelta
         thirty_days_ago = date.today() - timedelta(days=30)
-        recent_count = vaccine.vaccination_records.filter(
+        recent = vaccine.vaccination_records.filter(
             administered_date__gte=thirty_days_ago
-        ).count()
+        )
+        
+        by_species, recent_count = await run_queries(
+            lambda: list(species_counts),
+            recent.count
+        )
         
         return Response({
             'vaccine': vaccine.name,
-            'total_administrations': total_administrations,
+            'total_administrations': vaccine.total_administrations,
             'recent_administrations_30d': recent_count,
-            'by_species': list(by_species),
+            'by_species': by_species,
             'duration_months': vaccine.duration_months,
             'is_mandatory': vaccine.is_mandatory
         })
\ No newline at end of file
@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_sistema_vacinacao.settings')
+# Sob ASGI cada requisição roda o ORM em uma thread diferente: conexões
+# persistentes ficariam abertas sem reaproveitamento
+os.environ.setdefault('DATABASE_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
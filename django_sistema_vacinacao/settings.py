@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 
+from decouple import Csv, config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -20,12 +22,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-=^f_sh9#rzgw3%d51ha%vbj+xxqsd@j=yqc*sk&t&b*+9sf--e'
+SECRET_KEY = config(
+    'SECRET_KEY',
+    default='django-insecure-=^f_sh9#rzgw3%d51ha%vbj+xxqsd@j=yqc*sk&t&b*+9sf--e'
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = config('DEBUG', default=True, cast=bool)
 
-ALLOWED_HOSTS = ['localhost', '127.0.0.1']
+ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=Csv())
 
 
 # Application definition
@@ -47,6 +52,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Primeiro da lista para medir a requisição inteira; desativado por padrão
+    'core.middleware.RequestProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -78,11 +85,52 @@ WSGI_APPLICATION = 'django_sistema_vacinacao.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+#
+# Configurado por variáveis de ambiente (ou .env). Os testes usam o mesmo
+# caminho, com o banco de teste criado pelo Django a partir destes valores.
+
+DATABASE_ENGINE = config('DATABASE_ENGINE', default='django.db.backends.sqlite3')
+if '.' not in DATABASE_ENGINE:
+    # Permite abreviações como "postgresql" ou "sqlite3"
+    DATABASE_ENGINE = f'django.db.backends.{DATABASE_ENGINE}'
+
+DATABASE_NAME = config('DATABASE_NAME', default='db.sqlite3')
+if DATABASE_ENGINE.endswith('sqlite3') and DATABASE_NAME != ':memory:':
+    DATABASE_NAME = BASE_DIR / DATABASE_NAME
+
+# Tempo máximo de execução de uma consulta, em milissegundos (0 desativa).
+# Aplicado no PostgreSQL e no MySQL; o SQLite não tem equivalente.
+DATABASE_STATEMENT_TIMEOUT = config('DATABASE_STATEMENT_TIMEOUT', default=0, cast=int)
+
+DATABASE_OPTIONS = {}
+if DATABASE_STATEMENT_TIMEOUT:
+    if DATABASE_ENGINE.endswith('postgresql'):
+        DATABASE_OPTIONS['options'] = f'-c statement_timeout={DATABASE_STATEMENT_TIMEOUT}'
+    elif DATABASE_ENGINE.endswith('mysql'):
+        DATABASE_OPTIONS['init_command'] = (
+            f'SET SESSION max_execution_time={DATABASE_STATEMENT_TIMEOUT}'
+        )
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': DATABASE_ENGINE,
+        'NAME': DATABASE_NAME,
+        'USER': config('DATABASE_USER', default=''),
+        'PASSWORD': config('DATABASE_PASSWORD', default=''),
+        'HOST': config('DATABASE_HOST', default=''),
+        'PORT': config('DATABASE_PORT', default=''),
+        # Conexões persistentes: segundos que uma conexão é reaproveitada
+        # entre requisições (0 fecha ao fim de cada requisição, None não expira).
+        # asgi.py usa 0: sob ASGI cada requisição usa uma thread diferente e as
+        # conexões persistentes não seriam reaproveitadas.
+        'CONN_MAX_AGE': config(
+            'DATABASE_CONN_MAX_AGE',
+            default='60',
+            cast=lambda value: None if value.lower() == 'none' else int(value)
+        ),
+        # Verifica conexões reaproveitadas antes do uso
+        'CONN_HEALTH_CHECKS': config('DATABASE_CONN_HEALTH_CHECKS', default=True, cast=bool),
+        'OPTIONS': DATABASE_OPTIONS,
     }
 }
 
@@ -123,6 +171,13 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# E-mail (lembretes de vacinação)
+# https://docs.djangoproject.com/en/5.2/topics/email/
+
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+
+DEFAULT_FROM_EMAIL = 'lembretes@sistema-vacinacao.local'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -131,27 +186,75 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST Framework settings
 
+# Renderers da API (lista separada por vírgulas). Por padrão, JSON com
+# orjson (core.renderers.FastJSONRenderer) e o browsable API apenas com DEBUG
+
+API_RENDERER_CLASSES = config(
+    'API_RENDERER_CLASSES',
+    default=','.join(
+        ['core.renderers.FastJSONRenderer']
+        + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else [])
+    ),
+    cast=Csv()
+)
+
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': API_RENDERER_CLASSES,
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'core.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.StandardPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': [
-        'rest_framework.filters.SearchFilter',
+        'core.filters.FullTextSearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'core.throttling.AnonRateThrottle',
+        'core.throttling.UserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/hour',
         'user': '1000/hour',
         'auth': '5/minute',
     }
-}
\ No newline at end of file
+}
+
+# Cache de tokens de autenticação (core.authentication.CachedTokenAuthentication)
+
+TOKEN_AUTH_CACHE = {
+    'MAX_SIZE': 1024,
+    'TTL': 60,
+    'SHARED': False,
+}
+
+# Contadores de throttling compartilhados entre workers (core.throttling)
+
+THROTTLE_STORE_PATH = BASE_DIR / 'throttle.sqlite3'
+
+# Marcadores de revogação do cache de tokens, compartilhados entre workers
+# (core.revocation)
+
+TOKEN_REVOCATION_STORE_PATH = BASE_DIR / 'token_revocations.sqlite3'
+
+# Os testes usam arquivos temporários para os dois stores (core.tests.runner)
+
+TEST_RUNNER = 'core.tests.runner.TestRunner'
+
+# Actions assíncronas (core.concurrency): consultas independentes em paralelo,
+# uma conexão por consulta, fora do SQLite e de transações
+
+ASYNC_CONCURRENT_QUERIES = config('ASYNC_CONCURRENT_QUERIES', default=True, cast=bool)
+
+# Instrumentação por requisição (core.middleware.RequestProfilingMiddleware):
+# header Server-Timing e log de requisições lentas ou com muitas consultas
+
+REQUEST_PROFILING = {
+    'ENABLED': config('REQUEST_PROFILING', default=False, cast=bool),
+    'SLOW_REQUEST_MS': config('REQUEST_PROFILING_SLOW_MS', default=500, cast=int),
+    'MAX_QUERIES': config('REQUEST_PROFILING_MAX_QUERIES', default=30, cast=int),
+}